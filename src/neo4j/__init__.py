@@ -76,6 +76,7 @@ from ._work import (  # noqa: F401 dynamic attribute
     NotificationClassification as _NotificationClassification,
     Query,
     ResultSummary,
+    RetryPolicy,
     SummaryCounters,
     SummaryInputPosition,
     SummaryNotification,
@@ -161,6 +162,7 @@ __all__ = [
     "Record",
     "Result",
     "ResultSummary",
+    "RetryPolicy",
     "RoutingControl",
     "ServerInfo",
     "Session",
@@ -19,6 +19,11 @@ from __future__ import annotations
 import typing as t
 
 from .._async_compat.concurrency import AsyncLock
+from .._async_compat.network import (
+    DnsCache,
+    SocketOptions,
+    TlsSessionCache,
+)
 from .._conf import (
     _trust_to_trusted_certificates,
     Config,
@@ -43,15 +48,58 @@ class AsyncPoolConfig(Config):
     # The maximum duration the driver will keep a connection for before being
     # removed from the pool.
 
+    #: Max Connection Lifetime Jitter
+    max_connection_lifetime_jitter = 0.0
+    # Each connection's lifetime is shortened by a random share of up to this
+    # fraction of max_connection_lifetime (0 <= jitter < 1).
+
     #: Timeout after which idle connections will be checked for liveness
     #: before returned from the pool.
     liveness_check_timeout = None
 
+    #: Max Idle Time
+    max_idle_time = None  # seconds
+    # Connections that have been idle for longer than this are closed instead
+    # of being handed out again.
+
+    #: Connection Maintenance Interval
+    connection_maintenance_interval = None  # seconds
+    # If set, idle connections are checked in the background in this interval:
+    # expired connections are closed and liveness checks are performed.
+
+    #: Background routing table refresh as a fraction of the table's TTL
+    routing_table_refresh_ratio = None
+    # If set (0 < ratio < 1), routing tables of recently used databases are
+    # refreshed in the background after ratio * TTL.
+
+    #: Hedged Discovery Delay
+    hedged_discovery_delay = None  # seconds
+    # If set, routers are queried concurrently when fetching a routing table:
+    # the next router is queried after this delay (or as soon as a query
+    # failed) and the first valid routing table wins. None disables hedging.
+
     #: Max Connection Pool Size
     max_connection_pool_size = 100
     # The maximum total number of connections allowed, per host
     # (i.e. cluster nodes), to be managed by the connection pool.
 
+    #: Max Pending Connections
+    max_pending_connections = None
+    # The maximum number of connections, per host, that are being opened at
+    # the same time. Acquisitions waiting for a connection are served in
+    # order.
+
+    #: Min Idle Connections
+    min_idle_connections = 0
+    # The number of idle connections, per host, the pool keeps open in the
+    # background.
+
+    #: Deferred Reset
+    deferred_reset = False
+    # Don't wait for the server's response to the RESET sent when releasing
+    # a connection to the pool. Consume it with the responses to the next
+    # work done with the connection instead.
+
     #: Connection Timeout
     connection_timeout = 30.0  # seconds
     # The maximum amount of time to wait for a TCP connection to be
@@ -68,6 +116,10 @@ class AsyncPoolConfig(Config):
     resolver = None
     # Custom resolver function, returning list of resolved addresses.
 
+    #: DNS Cache TTL
+    dns_cache_ttl = None  # seconds
+    # If set, DNS resolution results are cached for this many seconds.
+
     #: Encrypted
     encrypted = False
     # Specify whether to use an encrypted connection between the driver and
@@ -91,6 +143,11 @@ class AsyncPoolConfig(Config):
     # Overwrites `trusted_certificates` and `encrypted`.
     # The use of this option is strongly discouraged.
 
+    #: TLS Session Resumption
+    tls_session_resumption = False
+    # Try to resume the TLS session of a previous connection to the same
+    # server when opening a new encrypted connection.
+
     #: User Agent (Python Driver Specific)
     user_agent = None
     # Specify the client agent name.
@@ -99,6 +156,32 @@ class AsyncPoolConfig(Config):
     keep_alive = True
     # Specify whether TCP keep-alive should be enabled.
 
+    #: Socket Keep Alive Interval
+    keep_alive_interval = None
+    # Seconds of idleness before sending keep-alive probes and between
+    # probes. None leaves the operating system's default.
+
+    #: TCP No Delay
+    tcp_no_delay = True
+    # Disable Nagle's algorithm so small messages are sent without delay.
+
+    #: Socket Receive Buffer Size
+    socket_receive_buffer_size = None
+    # SO_RCVBUF in bytes. None leaves the operating system's default.
+
+    #: Socket Send Buffer Size
+    socket_send_buffer_size = None
+    # SO_SNDBUF in bytes. None leaves the operating system's default.
+
+    #: TCP User Timeout
+    tcp_user_timeout = None
+    # Seconds transmitted data may remain unacknowledged before the
+    # connection is dropped (Linux only).
+
+    #: Stream Reader Limit (async driver only)
+    stream_reader_limit = 2**16  # 64 KiB
+    # Buffer limit of the async stream reader in bytes.
+
     #: Authentication provider
     auth = None
 
@@ -113,11 +196,43 @@ class AsyncPoolConfig(Config):
 
     _ssl_context_cache: ssl.SSLContext | None
     _ssl_context_cache_lock: AsyncLock
+    _dns_cache: DnsCache | None
+    _tls_session_cache: TlsSessionCache | None
+    _socket_options: SocketOptions | None
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._ssl_context_cache = None
         self._ssl_context_cache_lock = AsyncLock()
+        self._dns_cache = None
+        self._tls_session_cache = None
+        self._socket_options = None
+
+    def get_dns_cache(self) -> DnsCache | None:
+        if self.dns_cache_ttl is None:
+            return None
+        if self._dns_cache is None:
+            self._dns_cache = DnsCache(self.dns_cache_ttl)
+        return self._dns_cache
+
+    def get_tls_session_cache(self) -> TlsSessionCache | None:
+        if not self.tls_session_resumption:
+            return None
+        if self._tls_session_cache is None:
+            self._tls_session_cache = TlsSessionCache()
+        return self._tls_session_cache
+
+    def get_socket_options(self) -> SocketOptions:
+        if self._socket_options is None:
+            self._socket_options = SocketOptions(
+                tcp_no_delay=self.tcp_no_delay,
+                receive_buffer_size=self.socket_receive_buffer_size,
+                send_buffer_size=self.socket_send_buffer_size,
+                tcp_user_timeout=self.tcp_user_timeout,
+                keep_alive_interval=self.keep_alive_interval,
+                reader_limit=self.stream_reader_limit,
+            )
+        return self._socket_options
 
     async def get_ssl_context(self) -> ssl.SSLContext | None:
         if self.ssl_context is not None:
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import asyncio
 import typing as t
+from functools import partial
 
 
 if t.TYPE_CHECKING:
@@ -34,6 +35,7 @@ from .._api import (
     RoutingControl,
     TelemetryAPI,
 )
+from .._async_compat.concurrency import async_bounded_as_completed
 from .._async_compat.util import AsyncUtil
 from .._conf import (
     Config,
@@ -47,14 +49,21 @@ from .._debug import ENABLED as DEBUG_ENABLED
 from .._meta import (
     deprecation_warn,
     experimental_warn,
+    preview,
     preview_warn,
     unclosed_resource_warn,
 )
 from .._work import (
     EagerResult,
     Query,
+    ResultSummary,
+    RetryPolicy,
     unit_of_work,
 )
+from .._work.bulk import (
+    batch_rows,
+    DEFAULT_BATCH_BYTES,
+)
 from ..addressing import Address
 from ..api import (
     AsyncBookmarkManager,
@@ -85,7 +94,10 @@ from ..auth_management import (
     AsyncClientCertificateProvider,
     ClientCertificate,
 )
-from ..exceptions import Neo4jError
+from ..exceptions import (
+    BulkWriteError,
+    Neo4jError,
+)
 from .auth_management import _AsyncStaticClientCertificateProvider
 from .bookmark_manager import (
     AsyncNeo4jBookmarkManager,
@@ -119,6 +131,12 @@ else:
 
 _T = t.TypeVar("_T")
 
+# how many pre-built session configs a driver keeps for execute_query
+_QUERY_SESSION_CONFIGS_MAX = 128
+
+# upper bound for the default concurrency of execute_concurrently
+_DEFAULT_MAX_CONCURRENCY = 32
+
 
 class AsyncGraphDatabase:
     """Accessor for :class:`neo4j.AsyncDriver` construction."""
@@ -132,8 +150,14 @@ class AsyncGraphDatabase:
             *,
             auth: _TAuth | AsyncAuthManager = ...,
             max_connection_lifetime: float = ...,
+            max_connection_lifetime_jitter: float = ...,
             liveness_check_timeout: float | None = ...,
+            max_idle_time: float | None = ...,
+            connection_maintenance_interval: float | None = ...,
             max_connection_pool_size: int = ...,
+            min_idle_connections: int = ...,
+            max_pending_connections: int | None = ...,
+            deferred_reset: bool = ...,
             connection_timeout: float = ...,
             trust: (
                 te.Literal["TRUST_ALL_CERTIFICATES"]
@@ -149,8 +173,14 @@ class AsyncGraphDatabase:
                 ClientCertificate | AsyncClientCertificateProvider | None
             ) = ...,
             ssl_context: ssl.SSLContext | None = ...,
+            tls_session_resumption: bool = ...,
             user_agent: str = ...,
             keep_alive: bool = ...,
+            keep_alive_interval: float | None = ...,
+            tcp_no_delay: bool = ...,
+            socket_receive_buffer_size: int | None = ...,
+            socket_send_buffer_size: int | None = ...,
+            tcp_user_timeout: float | None = ...,
             notifications_min_severity: (
                 T_NotificationMinimumSeverity | None
             ) = ...,
@@ -164,6 +194,10 @@ class AsyncGraphDatabase:
                 T_NotificationMinimumSeverity | None
             ) = ...,
             telemetry_disabled: bool = ...,
+            routing_table_refresh_ratio: float | None = ...,
+            dns_cache_ttl: float | None = ...,
+            hedged_discovery_delay: float | None = ...,
+            retry_policy: RetryPolicy | None = ...,
             # undocumented/unsupported options
             # they may be changed or removed any time without prior notice
             connection_acquisition_timeout: float = ...,
@@ -171,6 +205,7 @@ class AsyncGraphDatabase:
             initial_retry_delay: float = ...,
             retry_delay_multiplier: float = ...,
             retry_delay_jitter_factor: float = ...,
+            stream_reader_limit: int = ...,
             database: str | None = ...,
             fetch_size: int = ...,
             impersonated_user: str | None = ...,
@@ -288,6 +323,144 @@ class AsyncGraphDatabase:
                 )
             _normalize_notifications_config(config, driver_level=True)
 
+            if "routing_table_refresh_ratio" in config:
+                preview_warn(
+                    "routing_table_refresh_ratio is a preview feature.",
+                    stack_level=2,
+                )
+                refresh_ratio = config["routing_table_refresh_ratio"]
+                if refresh_ratio is not None and not 0 < refresh_ratio < 1:
+                    raise ConfigurationError(
+                        'The config setting "routing_table_refresh_ratio" '
+                        "must be greater than 0 and less than 1 but was "
+                        f"{refresh_ratio}."
+                    )
+
+            if "dns_cache_ttl" in config:
+                preview_warn(
+                    "dns_cache_ttl is a preview feature.",
+                    stack_level=2,
+                )
+                dns_cache_ttl = config["dns_cache_ttl"]
+                if dns_cache_ttl is not None and dns_cache_ttl <= 0:
+                    raise ConfigurationError(
+                        'The config setting "dns_cache_ttl" must be greater '
+                        f"than 0 but was {dns_cache_ttl}."
+                    )
+
+            if "hedged_discovery_delay" in config:
+                preview_warn(
+                    "hedged_discovery_delay is a preview feature.",
+                    stack_level=2,
+                )
+                hedged_delay = config["hedged_discovery_delay"]
+                if hedged_delay is not None and hedged_delay < 0:
+                    raise ConfigurationError(
+                        'The config setting "hedged_discovery_delay" must be '
+                        f"greater than or equal to 0 but was {hedged_delay}."
+                    )
+
+            if "deferred_reset" in config:
+                preview_warn(
+                    "deferred_reset is a preview feature.",
+                    stack_level=2,
+                )
+
+            if "tls_session_resumption" in config:
+                preview_warn(
+                    "tls_session_resumption is a preview feature.",
+                    stack_level=2,
+                )
+
+            if "min_idle_connections" in config:
+                preview_warn(
+                    "min_idle_connections is a preview feature.",
+                    stack_level=2,
+                )
+                min_idle = config["min_idle_connections"]
+                max_pool_size = config.get(
+                    "max_connection_pool_size",
+                    AsyncPoolConfig.max_connection_pool_size,
+                )
+                if min_idle < 0 or (0 <= max_pool_size < min_idle):
+                    raise ConfigurationError(
+                        'The config setting "min_idle_connections" must be '
+                        "greater than or equal to 0 and must not exceed "
+                        '"max_connection_pool_size" but was '
+                        f"{min_idle}."
+                    )
+
+            if "max_pending_connections" in config:
+                preview_warn(
+                    "max_pending_connections is a preview feature.",
+                    stack_level=2,
+                )
+                max_pending = config["max_pending_connections"]
+                if max_pending is not None and max_pending < 1:
+                    raise ConfigurationError(
+                        'The config setting "max_pending_connections" must '
+                        f"be greater than or equal to 1 but was {max_pending}."
+                    )
+
+            if "max_connection_lifetime_jitter" in config:
+                preview_warn(
+                    "max_connection_lifetime_jitter is a preview feature.",
+                    stack_level=2,
+                )
+                jitter = config["max_connection_lifetime_jitter"]
+                if not 0 <= jitter < 1:
+                    raise ConfigurationError(
+                        'The config setting "max_connection_lifetime_jitter" '
+                        "must be greater than or equal to 0 and less than 1 "
+                        f"but was {jitter}."
+                    )
+
+            for option in ("max_idle_time", "connection_maintenance_interval"):
+                if option not in config:
+                    continue
+                preview_warn(f"{option} is a preview feature.", stack_level=2)
+                value = config[option]
+                if value is not None and value <= 0:
+                    raise ConfigurationError(
+                        f'The config setting "{option}" must be greater '
+                        f"than 0 but was {value}."
+                    )
+
+            if "tcp_no_delay" in config:
+                preview_warn(
+                    "tcp_no_delay is a preview feature.", stack_level=2
+                )
+
+            for option in (
+                "keep_alive_interval",
+                "socket_receive_buffer_size",
+                "socket_send_buffer_size",
+                "tcp_user_timeout",
+            ):
+                if option not in config:
+                    continue
+                preview_warn(f"{option} is a preview feature.", stack_level=2)
+                value = config[option]
+                if value is not None and value <= 0:
+                    raise ConfigurationError(
+                        f'The config setting "{option}" must be greater '
+                        f"than 0 but was {value}."
+                    )
+
+            if "retry_policy" in config:
+                preview_warn(
+                    "retry_policy is a preview feature.",
+                    stack_level=2,
+                )
+                retry_policy = config["retry_policy"]
+                if retry_policy is not None and not isinstance(
+                    retry_policy, RetryPolicy
+                ):
+                    raise ConfigurationError(
+                        'The config setting "retry_policy" must be a '
+                        f"RetryPolicy or None but was {retry_policy!r}."
+                    )
+
             liveness_check_timeout = config.get("liveness_check_timeout")
             if (
                 liveness_check_timeout is not None
@@ -526,6 +699,8 @@ class AsyncDriver:
         self._pool = pool
         self._default_workspace_config = default_workspace_config
         self._query_bookmark_manager = AsyncGraphDatabase.bookmark_manager()
+        # pre-built session configs for execute_query and friends
+        self._query_session_configs: dict[tuple, SessionConfig] = {}
 
     async def __aenter__(self) -> AsyncDriver:
         return self
@@ -578,6 +753,7 @@ class AsyncDriver:
             *,
             connection_acquisition_timeout: float = ...,
             max_transaction_retry_time: float = ...,
+            retry_policy: RetryPolicy | None = ...,
             database: str | None = ...,
             fetch_size: int = ...,
             impersonated_user: str | None = ...,
@@ -628,6 +804,11 @@ class AsyncDriver:
                     "is a preview feature.",
                     stack_level=2,
                 )
+            if "retry_policy" in config:
+                preview_warn(
+                    "retry_policy is a preview feature.",
+                    stack_level=2,
+                )
             session_config = self._read_session_config(config)
             return self._session(session_config)
 
@@ -638,6 +819,38 @@ class AsyncDriver:
         config = self._prepare_session_config(config_kwargs)
         return SessionConfig(self._default_workspace_config, config)
 
+    def _query_session_config(
+        self, database, impersonated_user, bookmark_manager, auth
+    ):
+        # Building a SessionConfig (validating every option) is a good part of
+        # the overhead of a single execute_query call. Therefore, configs for
+        # the common case (no auth and the default or no bookmark manager)
+        # are built once per database and user and copied from then on.
+        # Sessions mutate their config (e.g., when resolving the home
+        # database), so the cached config itself must never be handed out.
+        if bookmark_manager is _default:
+            bookmark_manager = self._query_bookmark_manager
+        assert bookmark_manager is not _default
+        config_kwargs = {
+            "database": database,
+            "impersonated_user": impersonated_user,
+            "bookmark_manager": bookmark_manager,
+            "auth": auth,
+        }
+        if auth is not None or (
+            bookmark_manager is not None
+            and bookmark_manager is not self._query_bookmark_manager
+        ):
+            return self._read_session_config(config_kwargs)
+        key = (database, impersonated_user, bookmark_manager is None)
+        config = self._query_session_configs.get(key)
+        if config is None:
+            if len(self._query_session_configs) >= _QUERY_SESSION_CONFIGS_MAX:
+                self._query_session_configs.clear()
+            config = self._read_session_config(config_kwargs)
+            self._query_session_configs[key] = config
+        return config._copy()
+
     @classmethod
     def _prepare_session_config(cls, config_kwargs):
         _normalize_notifications_config(config_kwargs)
@@ -936,27 +1149,20 @@ class AsyncDriver:
                 "or tried to send a query parameter that is reserved. In the "
                 "latter case, use the `parameters_` dictionary instead."
             )
+        work = _work
+        if result_transformer_ is AsyncResult.to_eager_result:
+            work = _eager_work
         if isinstance(query_, Query):
             timeout = query_.timeout
             metadata = query_.metadata
             query_str = query_.text
-            work = unit_of_work(metadata, timeout)(_work)
+            work = unit_of_work(metadata, timeout)(work)
         else:
             query_str = query_
-            work = _work
         parameters = dict(parameters_ or {}, **kwargs)
 
-        if bookmark_manager_ is _default:
-            bookmark_manager_ = self._query_bookmark_manager
-        assert bookmark_manager_ is not _default
-
-        session_config = self._read_session_config(
-            {
-                "database": database_,
-                "impersonated_user": impersonated_user_,
-                "bookmark_manager": bookmark_manager_,
-                "auth": auth_,
-            }
+        session_config = self._query_session_config(
+            database_, impersonated_user_, bookmark_manager_, auth_
         )
         session = self._session(session_config)
         async with session:
@@ -977,6 +1183,323 @@ class AsyncDriver:
                     {},
                 )
 
+    @preview("Driver.execute_queries is a preview feature.")
+    async def execute_queries(
+        self,
+        queries_: t.Iterable[tuple[te.LiteralString, dict[str, t.Any] | None]],
+        routing_: T_RoutingControl = RoutingControl.WRITE,
+        database_: str | None = None,
+        impersonated_user_: str | None = None,
+        bookmark_manager_: (
+            AsyncBookmarkManager
+            | BookmarkManager
+            | None
+            | te.Literal[_DefaultEnum.default]
+        ) = _default,
+        auth_: _TAuth = None,
+    ) -> list[EagerResult]:
+        """
+        Execute several queries in one transaction and return all results.
+
+        This works like :meth:`.execute_query`, except that all queries are
+        run in the same transaction function.
+        The queries are sent to the server in one go (see
+        :meth:`.AsyncManagedTransaction.run_many`), followed by the commit.
+        Therefore, running many small queries this way takes a single round
+        trip instead of one per query.
+
+        The method is roughly equivalent to::
+
+            async def execute_queries(
+                queries_, routing_, database_, impersonated_user_,
+                bookmark_manager_, auth_
+            ):
+                async def work(tx):
+                    results = await tx.run_many(queries_)
+                    return [await res.to_eager_result() for res in results]
+
+                async with driver.session(
+                    database=database_,
+                    impersonated_user=impersonated_user_,
+                    bookmark_manager=bookmark_manager_,
+                    auth=auth_,
+                ) as session:
+                    if routing_ == RoutingControl.WRITE:
+                        return await session.execute_write(work)
+                    elif routing_ == RoutingControl.READ:
+                        return await session.execute_read(work)
+
+        :param queries_: pairs of cypher query and dictionary of parameters
+            (or :data:`None`).
+        :param routing_:
+            See :meth:`.execute_query`.
+        :param database_:
+            See :meth:`.execute_query`.
+        :param impersonated_user_:
+            See :meth:`.execute_query`.
+        :param bookmark_manager_:
+            See :meth:`.execute_query`.
+        :param auth_:
+            See :meth:`.execute_query`.
+
+        :returns: one :class:`.EagerResult` per query in the order of
+            ``queries_``.
+
+        **This is a preview** (see :ref:`filter-warnings-ref`).
+        It might be changed without following the deprecation policy.
+        See also
+        https://github.com/neo4j/neo4j-python-driver/wiki/preview-features
+
+        .. versionadded:: 5.26
+        """
+        self._check_state()
+        queries = [
+            (query, dict(parameters or {})) for query, parameters in queries_
+        ]
+
+        session_config = self._query_session_config(
+            database_, impersonated_user_, bookmark_manager_, auth_
+        )
+        session = self._session(session_config)
+        async with session:
+            if routing_ == RoutingControl.WRITE:
+                access_mode = WRITE_ACCESS
+            elif routing_ == RoutingControl.READ:
+                access_mode = READ_ACCESS
+            else:
+                raise ValueError(
+                    f"Invalid routing control value: {routing_!r}"
+                )
+            with session._pipelined_begin:
+                return await session._run_transaction(
+                    access_mode,
+                    TelemetryAPI.DRIVER,
+                    _many_work,
+                    (queries,),
+                    {},
+                )
+
+    @preview("Driver.execute_concurrently is a preview feature.")
+    async def execute_concurrently(
+        self,
+        queries_: t.Iterable[
+            tuple[te.LiteralString | Query, dict[str, t.Any] | None]
+            | tuple[
+                te.LiteralString | Query, dict[str, t.Any] | None, str | None
+            ]
+        ],
+        max_concurrency_: int | None = None,
+        routing_: T_RoutingControl = RoutingControl.WRITE,
+        database_: str | None = None,
+        impersonated_user_: str | None = None,
+        bookmark_manager_: (
+            AsyncBookmarkManager
+            | BookmarkManager
+            | None
+            | te.Literal[_DefaultEnum.default]
+        ) = _default,
+        auth_: _TAuth = None,
+    ) -> t.AsyncIterator[tuple[int, EagerResult]]:
+        """
+        Execute many queries concurrently and yield results as they complete.
+
+        Each query is executed like with :meth:`.execute_query`, but at most
+        ``max_concurrency_`` of them at the same time.
+        This is meant for scatter-gather workloads, for example, one read per
+        shard key or per tenant database::
+
+            queries = ((QUERY, None, db) for db in tenant_databases)
+            async for index, result in driver.execute_concurrently(
+                queries, routing_=neo4j.RoutingControl.READ
+            ):
+                ...
+
+        Queries are only taken from ``queries_`` when there is capacity to
+        run them. Each query picks the least busy server for its routing
+        control, so reads are spread across all readers of the cluster.
+
+        If any query fails, no further queries are started and the error is
+        raised.
+
+        :param queries_: tuples of query, parameters (or :data:`None`), and
+            optionally the database to run the query against.
+            If the database is omitted, ``database_`` is used.
+        :param max_concurrency_: how many queries to run at the same time.
+            Defaults to :ref:`max-connection-pool-size-ref` times the number
+            of servers currently known for ``routing_`` in ``database_``
+            (one server if the routing table is not known yet), but at most
+            32.
+            Choosing more than the pool can serve makes queries wait for
+            connections and might lead to connection acquisition timeouts.
+        :param routing_:
+            See :meth:`.execute_query`.
+        :param database_:
+            See :meth:`.execute_query`.
+        :param impersonated_user_:
+            See :meth:`.execute_query`.
+        :param bookmark_manager_:
+            See :meth:`.execute_query`.
+        :param auth_:
+            See :meth:`.execute_query`.
+
+        :returns: an iterator yielding the index of the query (within
+            ``queries_``) and its result in the order the queries complete.
+
+        **This is a preview** (see :ref:`filter-warnings-ref`).
+        It might be changed without following the deprecation policy.
+        See also
+        https://github.com/neo4j/neo4j-python-driver/wiki/preview-features
+
+        .. versionadded:: 5.26
+        """
+        self._check_state()
+        if routing_ == RoutingControl.WRITE:
+            access_mode = WRITE_ACCESS
+        elif routing_ == RoutingControl.READ:
+            access_mode = READ_ACCESS
+        else:
+            raise ValueError(f"Invalid routing control value: {routing_!r}")
+        if max_concurrency_ is None:
+            capacity = await self._pool.capacity(access_mode, database_)
+            if capacity is None:
+                max_concurrency_ = _DEFAULT_MAX_CONCURRENCY
+            else:
+                max_concurrency_ = max(
+                    1, min(capacity, _DEFAULT_MAX_CONCURRENCY)
+                )
+        elif max_concurrency_ < 1:
+            raise ValueError(
+                "max_concurrency_ must be greater than 0, got "
+                f"{max_concurrency_!r}"
+            )
+
+        def make_call(item):
+            query, parameters, *database = item
+            return partial(
+                self.execute_query,
+                query,
+                parameters,
+                routing_=routing_,
+                database_=database[0] if database else database_,
+                impersonated_user_=impersonated_user_,
+                bookmark_manager_=bookmark_manager_,
+                auth_=auth_,
+            )
+
+        calls = (make_call(item) for item in queries_)
+        async for index, result in async_bounded_as_completed(
+            calls, max_concurrency_
+        ):
+            yield index, result
+
+    @preview("Driver.bulk_write is a preview feature.")
+    async def bulk_write(
+        self,
+        query_: te.LiteralString,
+        rows_: t.Iterable[t.Any],
+        parameter_name_: str = "rows",
+        batch_bytes_: int = DEFAULT_BATCH_BYTES,
+        database_: str | None = None,
+        impersonated_user_: str | None = None,
+        bookmark_manager_: (
+            AsyncBookmarkManager
+            | BookmarkManager
+            | None
+            | te.Literal[_DefaultEnum.default]
+        ) = _default,
+        auth_: _TAuth = None,
+    ) -> list[ResultSummary]:
+        """
+        Write a large number of rows in batches.
+
+        The rows are split into batches and each batch is passed to the query
+        as a list parameter (named ``parameter_name_``), typically to be
+        consumed with ``UNWIND``::
+
+            rows = ({"name": name} for name in read_names())
+            summaries = await driver.bulk_write(
+                "UNWIND $rows AS row CREATE (:Person {name: row.name})",
+                rows,
+            )
+
+        Batches are sized by the estimated number of bytes the rows take up
+        on the wire instead of by the number of rows. Therefore, rows of
+        varying size don't lead to overly large or needlessly small batches.
+
+        All batches are written through the same session, each batch in its
+        own transaction function. This means that batches are retried
+        individually if they fail with a retryable error and that batches
+        that were committed are not rolled back when a later batch fails.
+        Each batch is sent to the server together with its commit, so it
+        takes a single round trip. The next batch is only sent once the
+        commit succeeded: its transaction must start with the bookmark the
+        commit returns to see the previous batch's writes, and it must not
+        be written at all if the previous batch failed.
+
+        :param query_: cypher query to run for each batch
+        :param rows_: rows to write. The rows are consumed lazily, so this
+            may be an arbitrarily long iterator.
+        :param parameter_name_: name of the query parameter that receives the
+            list of rows of each batch.
+        :param batch_bytes_: estimated maximum number of bytes the rows of a
+            batch take up. Batches always contain at least one row.
+        :param database_:
+            See :meth:`.execute_query`.
+        :param impersonated_user_:
+            See :meth:`.execute_query`.
+        :param bookmark_manager_:
+            See :meth:`.execute_query`.
+        :param auth_:
+            See :meth:`.execute_query`.
+
+        :returns: the summary of each batch in the order the batches were
+            written.
+
+        :raises BulkWriteError: if writing a batch (or consuming ``rows_``)
+            fails. The original error is the ``__cause__`` of the raised
+            error. The batches written before stay committed. To tell how far
+            the write got, the error carries the summaries of those batches
+            (in order) as :attr:`.BulkWriteError.summaries`.
+
+        **This is a preview** (see :ref:`filter-warnings-ref`).
+        It might be changed without following the deprecation policy.
+        See also
+        https://github.com/neo4j/neo4j-python-driver/wiki/preview-features
+
+        .. versionadded:: 5.26
+        """
+        self._check_state()
+        if batch_bytes_ <= 0:
+            raise ValueError(
+                f"batch_bytes_ must be greater than 0, got {batch_bytes_!r}"
+            )
+
+        session_config = self._query_session_config(
+            database_, impersonated_user_, bookmark_manager_, auth_
+        )
+        summaries: list[ResultSummary] = []
+        session = self._session(session_config)
+        try:
+            async with session:
+                for batch in batch_rows(rows_, batch_bytes_):
+                    with session._pipelined_begin:
+                        summary = await session._run_transaction(
+                            WRITE_ACCESS,
+                            TelemetryAPI.DRIVER,
+                            _bulk_work,
+                            (query_, {parameter_name_: batch}),
+                            {},
+                        )
+                    summaries.append(summary)
+        except Exception as exc:
+            # let the caller know which batches have been committed
+            raise BulkWriteError(
+                summaries,
+                f"Bulk write failed after {len(summaries)} committed "
+                "batch(es)",
+            ) from exc
+        return summaries
+
     @property
     def execute_query_bookmark_manager(self) -> AsyncBookmarkManager:
         """
@@ -1180,6 +1703,40 @@ class AsyncDriver:
             assert session._connection
             return session._connection.supports_multiple_databases
 
+    @preview("Driver.warm_up is a preview feature.")
+    async def warm_up(self) -> None:
+        """
+        Open connections to the server(s) ahead of time.
+
+        This makes sure the driver knows the routing table of the default
+        database (only for ``neo4j://`` URIs) and opens connections to all
+        readers and writers in it. Afterward, each server has at least
+        :ref:`min-idle-connections-ref` (but at least one) idle connection in
+        the pool. If :ref:`min-idle-connections-ref` is configured, this also
+        starts keeping the idle connections topped up in the background
+        right away instead of waiting for the first session to need a
+        connection.
+
+        Servers that cannot be reached while warming up are skipped
+        silently.
+
+        :raises Exception: if the driver cannot connect to the remote.
+            Use the exception to further understand the cause of the
+            connectivity problem.
+
+        **This is a preview** (see :ref:`filter-warnings-ref`).
+        It might be changed without following the deprecation policy.
+        See also
+        https://github.com/neo4j/neo4j-python-driver/wiki/preview-features
+
+        .. versionadded:: 5.26
+        """
+        self._check_state()
+        session_config = self._read_session_config({})
+        async with self._session(session_config) as session:
+            await session._connect(READ_ACCESS)
+        await self._pool.warm_up()
+
     if t.TYPE_CHECKING:
 
         async def verify_authentication(
@@ -1309,6 +1866,37 @@ async def _work(
     return await transformer(res)
 
 
+async def _eager_work(
+    tx: AsyncManagedTransaction,
+    query: te.LiteralString,
+    parameters: dict[str, t.Any],
+    transformer: t.Callable[[AsyncResult], t.Awaitable[_T]],
+) -> _T:
+    # The transformer consumes all records and won't abort the transaction,
+    # so BEGIN, RUN, PULL, and COMMIT can all be sent in one go.
+    res = await tx._run_and_commit(query, parameters)
+    return await transformer(res)
+
+
+async def _many_work(
+    tx: AsyncManagedTransaction,
+    queries: list[tuple[te.LiteralString, dict[str, t.Any]]],
+) -> list[EagerResult]:
+    # All results are consumed right away, so the COMMIT is sent along with
+    # the queries as well.
+    results = await tx._run_many(queries, -1, commit=True)
+    return [await res.to_eager_result() for res in results]
+
+
+async def _bulk_work(
+    tx: AsyncManagedTransaction,
+    query: te.LiteralString,
+    parameters: dict[str, t.Any],
+) -> ResultSummary:
+    res = await tx._run_and_commit(query, parameters)
+    return await res.consume()
+
+
 class AsyncBoltDriver(_Direct, AsyncDriver):
     """
     :class:`.AsyncBoltDriver` is instantiated for ``bolt`` URIs.
@@ -49,6 +49,7 @@ from ._bolt3 import (
 from ._common import (
     check_supported_server_product,
     CommitResponse,
+    DeferredResetResponse,
     InitResponse,
     LogonResponse,
     ResetResponse,
@@ -424,23 +425,27 @@ class AsyncBolt5x0(AsyncBolt):
             dehydration_hooks=dehydration_hooks,
         )
 
-    async def reset(self, dehydration_hooks=None, hydration_hooks=None):
+    async def reset(
+        self, dehydration_hooks=None, hydration_hooks=None, deferred=False
+    ):
         """
         Reset the connection.
 
         Add a RESET message to the outgoing queue, send it and consume all
-        remaining messages.
+        remaining messages (unless ``deferred``).
         """
         dehydration_hooks, hydration_hooks = self._default_hydration_hooks(
             dehydration_hooks, hydration_hooks
         )
         log.debug("[#%04X]  C: RESET", self.local_port)
-        response = ResetResponse(self, "reset", hydration_hooks)
+        response_cls = DeferredResetResponse if deferred else ResetResponse
+        response = response_cls(self, "reset", hydration_hooks)
         self._append(
             b"\x0f", response=response, dehydration_hooks=dehydration_hooks
         )
         await self.send_all()
-        await self.fetch_all()
+        if not deferred:
+            await self.fetch_all()
 
     def goodbye(self, dehydration_hooks=None, hydration_hooks=None):
         dehydration_hooks, hydration_hooks = self._default_hydration_hooks(
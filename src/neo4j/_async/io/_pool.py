@@ -21,6 +21,7 @@ import asyncio
 import logging
 import typing as t
 from collections import (
+    Counter,
     defaultdict,
     deque,
 )
@@ -29,10 +30,14 @@ from copy import copy
 from dataclasses import dataclass
 from logging import getLogger
 from random import choice
+from time import monotonic
 
 from ..._async_compat.concurrency import (
+    async_staggered_race,
     AsyncCondition,
     AsyncCooperativeRLock,
+    AsyncLock,
+    AsyncPeriodicWorker,
     AsyncRLock,
 )
 from ..._async_compat.network import AsyncNetworkUtil
@@ -73,6 +78,20 @@ if t.TYPE_CHECKING:
 log = getLogger("neo4j.pool")
 
 
+# Bounds (in seconds) for how long the background routing table refresher
+# sleeps between checks.
+_ROUTING_REFRESH_MIN_INTERVAL = 1.0
+_ROUTING_REFRESH_MAX_INTERVAL = 5.0
+
+# The maximum number of idle connections per address the background
+# maintenance retires ahead of the end of their lifetime per run.
+_MAX_EARLY_RETIREMENTS = 1
+
+# How often (in seconds) the background pre-warmer checks whether the pool
+# holds ``min_idle_connections`` idle connections per address.
+_IDLE_CONNECTIONS_CHECK_INTERVAL = 1.0
+
+
 @dataclass
 class AcquireAuth:
     auth: AsyncAuthManager | AuthManager | None
@@ -92,8 +111,18 @@ class AsyncIOPool(abc.ABC):
         self.workspace_config = workspace_config
         self.connections = defaultdict(deque)
         self.connections_reservations = defaultdict(lambda: 0)
+        # acquisitions waiting for a connection, per address, oldest first
+        # (only used if max_pending_connections is configured)
+        self.waiters = defaultdict(deque)
         self.lock = AsyncCooperativeRLock()
         self.cond = AsyncCondition(self.lock)
+        self._idle_top_up_lock = AsyncLock()
+        self._maintainer = None
+        if pool_config.connection_maintenance_interval is not None:
+            self._maintainer = AsyncPeriodicWorker(self._maintain_connections)
+        self._pre_warmer = None
+        if pool_config.min_idle_connections:
+            self._pre_warmer = AsyncPeriodicWorker(self._keep_idle_connections)
 
     @property
     @abc.abstractmethod
@@ -196,23 +225,73 @@ class AsyncIOPool(abc.ABC):
                     self.connections[address].append(connection)
                 return connection
             finally:
-                if not released_reservation:
-                    with self.lock:
+                with self.lock:
+                    if not released_reservation:
                         self.connections_reservations[address] -= 1
+                    # waiters might be able to open a connection now
+                    self.cond.notify_all()
 
         max_pool_size = self.pool_config.max_connection_pool_size
+        max_pending = self.pool_config.max_pending_connections
         infinite_pool_size = max_pool_size < 0 or max_pool_size == float("inf")
         with self.lock:
             connections = self.connections[address]
-            pool_size = (
-                len(connections) + self.connections_reservations[address]
-            )
+            pending = self.connections_reservations[address]
+            if max_pending is not None and pending >= max_pending:
+                # enough connections are being opened already
+                return None
+            pool_size = len(connections) + pending
             if infinite_pool_size or pool_size < max_pool_size:
                 # there's room for a new connection
                 self.connections_reservations[address] += 1
                 return connection_creator
         return None
 
+    def _connection_expired(self, connection):
+        """Check if a connection must not be handed out anymore."""
+        if connection.closed() or connection.defunct() or connection.stale():
+            return True
+        max_idle_time = self.pool_config.max_idle_time
+        return max_idle_time is not None and connection.is_idle_for(
+            max_idle_time
+        )
+
+    @staticmethod
+    async def _check_liveness(connection, deadline):
+        with connection_deadline(connection, deadline):
+            try:
+                log.debug(
+                    "[#%04X]  _: <POOL> liveness check",
+                    connection.local_port,
+                )
+                await connection.reset()
+            except (OSError, ServiceUnavailable, SessionExpired):
+                return False
+        return True
+
+    @staticmethod
+    async def _fetch_deferred_reset(connection, deadline):
+        # The response to a RESET deferred on release must be consumed before
+        # handing out the connection. Else, a failed RESET would surface in
+        # the next borrower's work.
+        with connection_deadline(connection, deadline):
+            try:
+                log.debug(
+                    "[#%04X]  _: <POOL> fetch deferred reset",
+                    connection.local_port,
+                )
+                await connection.fetch_all()
+            except (OSError, ServiceUnavailable, SessionExpired):
+                return False
+        return True
+
+    def _is_next_in_line(self, address, waiter):
+        with self.lock:
+            waiters = self.waiters.get(address)
+            if not waiters:
+                return True
+            return waiters[0] is waiter
+
     async def _re_auth_connection(self, connection, auth, force):
         if auth:
             # Assert session auth is supported by the protocol.
@@ -268,84 +347,102 @@ class AsyncIOPool(abc.ABC):
             liveness_check_timeout = self.pool_config.liveness_check_timeout
 
         async def health_check(connection_, deadline_):
+            if self._connection_expired(connection_):
+                return False
             if (
-                connection_.closed()
-                or connection_.defunct()
-                or connection_.stale()
+                self.pool_config.deferred_reset
+                and connection_.responses
+                and not await self._fetch_deferred_reset(
+                    connection_, deadline_
+                )
             ):
                 return False
             if liveness_check_timeout is not None and connection_.is_idle_for(
                 liveness_check_timeout
             ):
-                with connection_deadline(connection_, deadline_):
-                    try:
-                        log.debug(
-                            "[#%04X]  _: <POOL> liveness check",
-                            connection_.local_port,
-                        )
-                        await connection_.reset()
-                    except (OSError, ServiceUnavailable, SessionExpired):
-                        return False
+                return await self._check_liveness(connection_, deadline_)
             return True
 
-        while True:
-            # try to find a free connection in the pool
-            connection = await self._acquire_from_pool_checked(
-                address, health_check, deadline
-            )
-            if connection:
-                log.debug(
-                    "[#%04X]  _: <POOL> picked existing connection %s",
-                    connection.local_port,
-                    connection.connection_id,
-                )
-                try:
-                    await self._re_auth_connection(
-                        connection, auth, force_auth
+        # With a limit on pending connections, waiters queue up so that
+        # connections (idle or newly opened) go to the longest waiting one.
+        queue_up = self.pool_config.max_pending_connections is not None
+        waiter = None
+        try:
+            while True:
+                if self._is_next_in_line(address, waiter):
+                    # try to find a free connection in the pool
+                    connection = await self._acquire_from_pool_checked(
+                        address, health_check, deadline
                     )
-                except ConfigurationError:
-                    if auth:
-                        # protocol version lacks support for re-auth
-                        # => session auth token is not supported
-                        raise
-                    # expiring tokens supported by flushing the pool
-                    # => give up this connection
+                else:
+                    connection = None
+                if connection:
                     log.debug(
-                        "[#%04X]  _: <POOL> backwards compatible "
-                        "auth token refresh: purge connection",
+                        "[#%04X]  _: <POOL> picked existing connection %s",
                         connection.local_port,
+                        connection.connection_id,
                     )
-                    await connection.close()
-                    await self.release(connection)
-                    continue
-                log.debug(
-                    "[#%04X]  _: <POOL> handing out existing connection",
-                    connection.local_port,
-                )
-                return connection
-            # all connections in pool are in-use
-            with self.lock:
-                connection_creator = self._acquire_new_later(
-                    address,
-                    auth,
-                    deadline,
-                )
-                if connection_creator:
-                    break
-
-                # failed to obtain a connection from pool because the
-                # pool is full and no free connection in the pool
-                timeout = deadline.to_timeout()
-                if (
-                    timeout == 0  # deadline expired
-                    or not await self.cond.wait(timeout)
-                ):
-                    log.debug("[#0000]  _: <POOL> acquisition timed out")
-                    # TODO: 6.0 - change this to be a DriverError (or subclass)
-                    raise ClientError(
-                        "failed to obtain a connection from the pool within "
-                        f"{deadline.original_timeout!r}s (timeout)"
+                    try:
+                        await self._re_auth_connection(
+                            connection, auth, force_auth
+                        )
+                    except ConfigurationError:
+                        if auth:
+                            # protocol version lacks support for re-auth
+                            # => session auth token is not supported
+                            raise
+                        # expiring tokens supported by flushing the pool
+                        # => give up this connection
+                        log.debug(
+                            "[#%04X]  _: <POOL> backwards compatible "
+                            "auth token refresh: purge connection",
+                            connection.local_port,
+                        )
+                        await connection.close()
+                        await self.release(connection)
+                        continue
+                    log.debug(
+                        "[#%04X]  _: <POOL> handing out existing connection",
+                        connection.local_port,
                     )
+                    return connection
+                # all connections in pool are in-use
+                with self.lock:
+                    if self._is_next_in_line(address, waiter):
+                        connection_creator = self._acquire_new_later(
+                            address,
+                            auth,
+                            deadline,
+                        )
+                        if connection_creator:
+                            break
+                    if queue_up and waiter is None:
+                        waiter = object()
+                        self.waiters[address].append(waiter)
+
+                    # failed to obtain a connection from pool because the
+                    # pool is full and no free connection in the pool (or
+                    # enough connections are being opened already)
+                    timeout = deadline.to_timeout()
+                    if (
+                        timeout == 0  # deadline expired
+                        or not await self.cond.wait(timeout)
+                    ):
+                        log.debug("[#0000]  _: <POOL> acquisition timed out")
+                        # TODO: 6.0 - change this to be a DriverError
+                        #             (or subclass)
+                        raise ClientError(
+                            "failed to obtain a connection from the pool "
+                            f"within {deadline.original_timeout!r}s (timeout)"
+                        )
+        finally:
+            if waiter is not None:
+                with self.lock:
+                    self.waiters[address].remove(waiter)
+                    if not self.waiters[address]:
+                        del self.waiters[address]
+                    # let the next waiter in line have its turn
+                    self.cond.notify_all()
         log.debug("[#0000]  _: <POOL> trying to hand out new connection")
         return await connection_creator()
 
@@ -418,7 +515,15 @@ class AsyncIOPool(abc.ABC):
                         connection.local_port,
                         connection.connection_id,
                     )
-                    await connection.reset()
+                    # Pending responses must be consumed now, their handlers
+                    # belong to the work that is done with the connection.
+                    if (
+                        self.pool_config.deferred_reset
+                        and not connection.responses
+                    ):
+                        await connection.reset(deferred=True)
+                    else:
+                        await connection.reset()
                 except (Neo4jError, DriverError, BoltError) as exc:
                     log.debug(
                         "[#%04X]  _: <POOL> failed to reset connection "
@@ -453,6 +558,190 @@ class AsyncIOPool(abc.ABC):
             connections = self.connections.get(address, ())
             return sum(connection.in_use for connection in connections)
 
+    async def capacity(self, access_mode, database):
+        """
+        Get how many connections for an access mode can be used at once.
+
+        :returns: the number of connections or :data:`None` if the pool size
+            is unbounded.
+        """
+        max_pool_size = self.pool_config.max_connection_pool_size
+        if max_pool_size < 0 or max_pool_size == float("inf"):
+            return None
+        return max_pool_size
+
+    async def _warm_up_addresses(self):
+        """Get the addresses the pool should keep idle connections to."""
+        return ()
+
+    async def _close_unusable_idle_connections(self, address):
+        with self.lock:
+            connections = self.connections.get(address, ())
+            unusable_connections = [
+                connection
+                for connection in connections
+                if not connection.in_use
+                and self._connection_expired(connection)
+            ]
+            for connection in unusable_connections:
+                connections.remove(connection)
+        await self._close_connections(unusable_connections)
+
+    async def _open_idle_connections(self, address, count):
+        for _ in range(count):
+            deadline = Deadline.from_timeout_or_deadline(
+                self.workspace_config.connection_acquisition_timeout
+            )
+            connection_creator = self._acquire_new_later(
+                address, None, deadline
+            )
+            if connection_creator is None:
+                return  # the pool is full
+            connection = await connection_creator()
+            await self.release(connection)
+
+    async def _top_up_idle_connections(self, min_idle):
+        """
+        Open connections until each address has ``min_idle`` idle ones.
+
+        Idle connections that are closed, defunct, or stale (e.g., because
+        they exceeded ``max_connection_lifetime``) are replaced.
+        Failing to connect to an address is logged, not raised.
+        """
+        async with self._idle_top_up_lock:
+            for address in await self._warm_up_addresses():
+                await self._top_up_idle_connections_to(address, min_idle)
+
+    async def _top_up_idle_connections_to(self, address, min_idle):
+        await self._close_unusable_idle_connections(address)
+        with self.lock:
+            idle = sum(
+                not connection.in_use
+                for connection in self.connections.get(address, ())
+            )
+        if idle >= min_idle:
+            return
+        log.debug(
+            "[#0000]  _: <POOL> opening %i idle connection(s) to %r",
+            min_idle - idle,
+            address,
+        )
+        try:
+            await self._open_idle_connections(address, min_idle - idle)
+        except Exception as exc:
+            log.debug(
+                "[#0000]  _: <POOL> failed to open idle connection to %r: %r",
+                address,
+                exc,
+            )
+
+    async def _keep_idle_connections(self):
+        # work of the background pre-warmer
+        await self._top_up_idle_connections(
+            self.pool_config.min_idle_connections
+        )
+        return _IDLE_CONNECTIONS_CHECK_INTERVAL
+
+    async def _check_idle_connections_liveness(self, address):
+        liveness_check_timeout = self.pool_config.liveness_check_timeout
+        if liveness_check_timeout is None:
+            return
+        with self.lock:
+            connections = [
+                connection
+                for connection in self.connections.get(address, ())
+                if not connection.in_use
+                and connection.is_idle_for(liveness_check_timeout)
+            ]
+            # keep acquisitions from picking the connections while checking
+            for connection in connections:
+                connection.in_use = True
+        for connection in connections:
+            alive = False
+            try:
+                deadline = Deadline.from_timeout_or_deadline(
+                    self.workspace_config.connection_acquisition_timeout
+                )
+                alive = await self._check_liveness(connection, deadline)
+            finally:
+                if not alive:
+                    await connection.close()
+                    self._remove_connection(connection)
+                await self.release(connection)
+
+    async def _retire_expiring_idle_connections(self, address):
+        # Retire a bounded number of idle connections that would exceed
+        # their lifetime before the next maintenance run.
+        interval = self.pool_config.connection_maintenance_interval
+        with self.lock:
+            connections = self.connections.get(address, ())
+            expiring_connections = [
+                connection
+                for connection in connections
+                if not connection.in_use
+                and connection.expires_within(interval)
+            ][:_MAX_EARLY_RETIREMENTS]
+            for connection in expiring_connections:
+                connections.remove(connection)
+        if expiring_connections:
+            log.debug(
+                "[#0000]  _: <POOL> retiring %i connection(s) to %r ahead "
+                "of their lifetime",
+                len(expiring_connections),
+                address,
+            )
+        await self._close_connections(expiring_connections)
+
+    async def _maintain_connections(self):
+        """
+        Check idle connections (work of the background maintainer).
+
+        Idle connections that are closed, defunct, stale, or exceeded
+        ``max_idle_time`` are closed and removed from the pool.
+        Idle connections that exceeded ``liveness_check_timeout`` are checked
+        for liveness. Hence, acquisitions rarely have to do either.
+        Idle connections that are about to exceed their lifetime are retired
+        ahead of time, but only a few per run. This way, connections that
+        were opened together are replaced gradually.
+
+        :returns: the number of seconds until the next check is due.
+        """
+        with self.lock:
+            addresses = list(self.connections)
+        for address in addresses:
+            try:
+                await self._close_unusable_idle_connections(address)
+                await self._retire_expiring_idle_connections(address)
+                await self._check_idle_connections_liveness(address)
+            except Exception as exc:
+                log.debug(
+                    "[#0000]  _: <POOL> connection maintenance for %r "
+                    "failed: %r",
+                    address,
+                    exc,
+                )
+        return self.pool_config.connection_maintenance_interval
+
+    async def warm_up(self):
+        """
+        Open connections to all known servers right away.
+
+        Each address ends up with at least ``min_idle_connections`` (but at
+        least one) idle connection.
+        If configured, the background pre-warmer is started to keep it that
+        way.
+        """
+        await self._top_up_idle_connections(
+            max(self.pool_config.min_idle_connections, 1)
+        )
+        self._ensure_workers_started()
+
+    def _ensure_workers_started(self):
+        if self._pre_warmer is not None:
+            self._pre_warmer.ensure_started()
+        if self._maintainer is not None:
+            self._maintainer.ensure_started()
+
     async def mark_all_stale(self):
         with self.lock:
             for address in self.connections:
@@ -533,6 +822,10 @@ class AsyncIOPool(abc.ABC):
         This method is thread safe.
         """
         log.debug("[#0000]  _: <POOL> close")
+        if self._pre_warmer is not None:
+            await self._pre_warmer.stop()
+        if self._maintainer is not None:
+            await self._maintainer.stop()
         try:
             with self.lock:
                 connections = [
@@ -579,6 +872,9 @@ class AsyncBoltPool(AsyncIOPool):
     def __repr__(self):
         return f"<{self.__class__.__name__} address={self.address!r}>"
 
+    async def _warm_up_addresses(self):
+        return (self.address,)
+
     async def acquire(
         self,
         access_mode,
@@ -596,6 +892,7 @@ class AsyncBoltPool(AsyncIOPool):
             access_mode,
             database,
         )
+        self._ensure_workers_started()
         deadline = Deadline.from_timeout_or_deadline(timeout)
         return await self._acquire(
             self.address, auth, deadline, liveness_check_timeout
@@ -658,6 +955,11 @@ class AsyncNeo4jPool(AsyncIOPool):
         self.routing_tables = {}
         self.refresh_lock = AsyncRLock()
         self.is_direct_pool = False
+        self._routing_table_refresher = None
+        if pool_config.routing_table_refresh_ratio is not None:
+            self._routing_table_refresher = AsyncPeriodicWorker(
+                self._refresh_routing_tables
+            )
 
     def __repr__(self):
         """
@@ -677,7 +979,15 @@ class AsyncNeo4jPool(AsyncIOPool):
             return self.routing_tables[database]
 
     async def fetch_routing_info(
-        self, address, database, imp_user, bookmarks, auth, acquisition_timeout
+        self,
+        address,
+        database,
+        imp_user,
+        bookmarks,
+        auth,
+        acquisition_timeout,
+        detached_connection=False,
+        on_connection=None,
     ):
         """
         Fetch raw routing info from a given router address.
@@ -691,6 +1001,12 @@ class AsyncNeo4jPool(AsyncIOPool):
                           info should be fetched
         :param auth: auth
         :param acquisition_timeout: connection acquisition timeout
+        :param detached_connection: use a connection that doesn't report
+            failures back to the pool: an idle pooled connection if there is
+            one, else a new connection that's not part of the pool and closed
+            afterwards.
+        :param on_connection: called with the connection before it's used
+            (e.g., to be able to kill it).
 
         :returns: list of routing records, or None if no connection
             could be established or if no readers or writers are present
@@ -704,20 +1020,84 @@ class AsyncNeo4jPool(AsyncIOPool):
             database,
             address,
         )
-        if auth:
-            auth = copy(auth)
-            auth.force_auth = False
-        cx = await self._acquire(address, auth, deadline, None)
+        borrowed = False
+        if detached_connection:
+            cx, borrowed = await self._acquire_detached(
+                address, auth, deadline
+            )
+        else:
+            if auth:
+                auth = copy(auth)
+                auth.force_auth = False
+            cx = await self._acquire(address, auth, deadline, None)
         try:
+            if on_connection is not None:
+                on_connection(cx)
             routing_table = await cx.route(
                 database=database or self.workspace_config.database,
                 imp_user=imp_user or self.workspace_config.impersonated_user,
                 bookmarks=bookmarks,
             )
         finally:
-            await self.release(cx)
+            if detached_connection:
+                await self._release_detached(cx, borrowed)
+            else:
+                await self.release(cx)
         return routing_table
 
+    async def _acquire_detached(self, address, auth, deadline):
+        """
+        Get a connection that doesn't report failures back to the pool.
+
+        An idle pooled connection is borrowed if there is one (and no session
+        auth is used). Else, a new connection that's not part of the pool is
+        opened.
+
+        :returns: the connection and whether it's borrowed from the pool
+        """
+        if not auth:
+            cx = await self._acquire_from_pool_checked(
+                address, self._check_not_expired, deadline
+            )
+            if cx is not None:
+                try:
+                    await self._re_auth_connection(cx, None, False)
+                except ConfigurationError:
+                    # expiring tokens supported by flushing the pool
+                    # => give up this connection
+                    await cx.close()
+                    await self.release(cx)
+                else:
+                    log.debug(
+                        "[#%04X]  _: <POOL> borrowing idle connection %s",
+                        cx.local_port,
+                        cx.connection_id,
+                    )
+                    cx.pool = None
+                    return cx, True
+        cx = await self.opener(
+            address,
+            (auth and auth.auth) or self.pool_config.auth,
+            deadline,
+        )
+        return cx, False
+
+    async def _check_not_expired(self, connection, deadline):
+        # Health check without liveness check: a failed RESET would report
+        # back to the pool.
+        return not self._connection_expired(connection)
+
+    async def _release_detached(self, cx, borrowed):
+        if not borrowed:
+            await cx.close()
+            return
+        cx.pool = self
+        if not (cx.defunct() or cx.closed() or cx.is_reset):
+            # Resetting the connection on release might report failures back
+            # to the pool.
+            cx.kill()
+        await self.release(cx)
+
     async def fetch_routing_table(
         self,
         *,
@@ -727,6 +1107,8 @@ class AsyncNeo4jPool(AsyncIOPool):
         imp_user,
         bookmarks,
         auth,
+        detached_connection=False,
+        on_connection=None,
     ):
         """
         Fetch a routing table from a given router address.
@@ -740,6 +1122,8 @@ class AsyncNeo4jPool(AsyncIOPool):
         :type imp_user: str or None
         :param bookmarks: bookmarks used when fetching routing table
         :param auth: auth
+        :param detached_connection: see :meth:`fetch_routing_info`
+        :param on_connection: see :meth:`fetch_routing_info`
 
         :returns: a new RoutingTable instance or None if the given router is
                  currently unable to provide routing information
@@ -753,6 +1137,8 @@ class AsyncNeo4jPool(AsyncIOPool):
                 bookmarks,
                 auth,
                 acquisition_timeout,
+                detached_connection=detached_connection,
+                on_connection=on_connection,
             )
         except Neo4jError as e:
             # checks if the code is an error that is caused by the client. In
@@ -814,10 +1200,14 @@ class AsyncNeo4jPool(AsyncIOPool):
         auth,
         acquisition_timeout,
         database_callback,
+        update_pool=False,
     ):
         """
         Try to update routing tables with the given routers.
 
+        :param update_pool: also update the connection pool to the new
+            routing table while still holding the refresh lock.
+
         :returns: True if the routing table is successfully updated,
         otherwise False
         """
@@ -829,9 +1219,22 @@ class AsyncNeo4jPool(AsyncIOPool):
                 ),
                 ", ".join(map(repr, routers)),
             )
+        if self.pool_config.hedged_discovery_delay is not None:
+            return await self._update_routing_table_from_hedged(
+                *routers,
+                database=database,
+                imp_user=imp_user,
+                bookmarks=bookmarks,
+                auth=auth,
+                acquisition_timeout=acquisition_timeout,
+                database_callback=database_callback,
+                update_pool=update_pool,
+            )
         for router in routers:
             async for address in AsyncNetworkUtil.resolve_address(
-                router, resolver=self.pool_config.resolver
+                router,
+                resolver=self.pool_config.resolver,
+                cache=self.pool_config.get_dns_cache(),
             ):
                 new_routing_table = await self.fetch_routing_table(
                     address=address,
@@ -842,23 +1245,141 @@ class AsyncNeo4jPool(AsyncIOPool):
                     auth=auth,
                 )
                 if new_routing_table is not None:
-                    new_database = new_routing_table.database
-                    old_routing_table = await self.get_or_create_routing_table(
-                        new_database
-                    )
-                    old_routing_table.update(new_routing_table)
-                    log.debug(
-                        "[#0000]  _: <POOL> update routing table from "
-                        "address=%r (%r)",
+                    await self._apply_routing_table(
                         address,
-                        self.routing_tables[new_database],
+                        new_routing_table,
+                        database_callback,
+                        update_pool=update_pool,
                     )
-                    if callable(database_callback):
-                        database_callback(new_database)
                     return True
             await self.deactivate(router)
         return False
 
+    async def _update_routing_table_from_hedged(
+        self,
+        *routers,
+        database,
+        imp_user,
+        bookmarks,
+        auth,
+        acquisition_timeout,
+        database_callback,
+        update_pool=False,
+    ):
+        """
+        Try to update routing tables querying the given routers concurrently.
+
+        All resolved addresses of all routers are raced against each other
+        (staggered by ``hedged_discovery_delay``). The first valid routing
+        table wins, the other queries are abandoned.
+        Routers that failed on all their addresses are deactivated.
+
+        The queries use detached connections: pooled connections report
+        failures back to the pool, which requires the refresh lock held by
+        the caller. Addresses with idle pooled connections are tried first.
+        Those connections are borrowed from the pool. Only the other
+        addresses need new connections. Once the race is decided, the
+        connections of the abandoned queries are killed.
+
+        :returns: True if the routing table is successfully updated,
+        otherwise False
+        """
+        candidates = [
+            (router, address)
+            for router in routers
+            async for address in AsyncNetworkUtil.resolve_address(
+                router,
+                resolver=self.pool_config.resolver,
+                cache=self.pool_config.get_dns_cache(),
+            )
+        ]
+        with self.lock:
+            idle_addresses = {
+                address
+                for address, connections in self.connections.items()
+                if any(not connection.in_use for connection in connections)
+            }
+        candidates.sort(
+            key=lambda candidate: candidate[1] not in idle_addresses
+        )
+        failed_routers = []
+        connections = {}
+        cancelled = set()
+
+        def make_attempt(index, router, address):
+            def on_connection(connection):
+                connections[index] = connection
+                if index in cancelled:
+                    connection.kill()
+
+            async def attempt():
+                new_routing_table = await self.fetch_routing_table(
+                    address=address,
+                    acquisition_timeout=acquisition_timeout,
+                    database=database,
+                    imp_user=imp_user,
+                    bookmarks=bookmarks,
+                    auth=auth,
+                    detached_connection=True,
+                    on_connection=on_connection,
+                )
+                if new_routing_table is None and index not in cancelled:
+                    failed_routers.append(router)
+                return new_routing_table
+
+            return attempt
+
+        def cancel(index):
+            cancelled.add(index)
+            connection = connections.get(index)
+            if connection is not None:
+                connection.kill()
+
+        index, new_routing_table = await async_staggered_race(
+            (
+                make_attempt(index, *candidate)
+                for index, candidate in enumerate(candidates)
+            ),
+            self.pool_config.hedged_discovery_delay,
+            cancel=cancel,
+        )
+        address_counts = Counter(router for router, _ in candidates)
+        failure_counts = Counter(failed_routers)
+        for router in routers:
+            if failure_counts[router] == address_counts[router]:
+                await self.deactivate(router)
+        if index is None:
+            return False
+        await self._apply_routing_table(
+            candidates[index][1],
+            new_routing_table,
+            database_callback,
+            update_pool=update_pool,
+        )
+        return True
+
+    async def _apply_routing_table(
+        self, address, new_routing_table, database_callback, update_pool=False
+    ):
+        new_database = new_routing_table.database
+        # The caller might not hold the refresh lock while fetching the new
+        # routing table (background refresh), so make sure it's held while
+        # the shared state is modified.
+        async with self.refresh_lock:
+            old_routing_table = await self.get_or_create_routing_table(
+                new_database
+            )
+            old_routing_table.update(new_routing_table)
+            log.debug(
+                "[#0000]  _: <POOL> update routing table from address=%r (%r)",
+                address,
+                self.routing_tables[new_database],
+            )
+            if update_pool:
+                await self.update_connection_pool(database=new_database)
+        if callable(database_callback):
+            database_callback(new_database)
+
     async def update_routing_table(
         self,
         *,
@@ -981,20 +1502,7 @@ class AsyncNeo4jPool(AsyncIOPool):
         from ...api import READ_ACCESS
 
         async with self.refresh_lock:
-            for database_ in list(self.routing_tables.keys()):
-                # Remove unused databases in the routing table
-                # Remove the routing table after a timeout = TTL + 30s
-                log.debug(
-                    "[#0000]  _: <POOL> routing aged?, database=%s", database_
-                )
-                routing_table = self.routing_tables[database_]
-                if routing_table.should_be_purged_from_memory():
-                    log.debug(
-                        "[#0000]  _: <POOL> dropping routing table for "
-                        "database=%s",
-                        database_,
-                    )
-                    del self.routing_tables[database_]
+            self._purge_routing_tables()
 
             routing_table = await self.get_or_create_routing_table(database)
             if routing_table.is_fresh(readonly=(access_mode == READ_ACCESS)):
@@ -1017,6 +1525,159 @@ class AsyncNeo4jPool(AsyncIOPool):
 
             return True
 
+    async def refresh_writers(
+        self,
+        *,
+        database,
+        imp_user,
+        bookmarks,
+        auth=None,
+        acquisition_timeout=None,
+    ):
+        """
+        Make sure the routing table knows a writer for the database.
+
+        The routing table is only fetched if it's not fresh for writing (e.g.,
+        because the writer was removed after it stopped being the leader).
+        As this is done while holding the refresh lock, concurrent callers
+        share a single routing table update.
+
+        :returns: `True` if a writer is known afterward, `False` otherwise.
+        """
+        from ...api import WRITE_ACCESS
+
+        await self.ensure_routing_table_is_fresh(
+            access_mode=WRITE_ACCESS,
+            database=database,
+            imp_user=imp_user,
+            bookmarks=bookmarks,
+            auth=auth,
+            acquisition_timeout=acquisition_timeout,
+        )
+        async with self.refresh_lock:
+            routing_table = self.routing_tables.get(database)
+            return bool(routing_table and routing_table.writers)
+
+    def _purge_routing_tables(self):
+        # Must be called while holding the refresh lock.
+        for database in list(self.routing_tables.keys()):
+            # Remove unused databases in the routing table
+            # Remove the routing table after a timeout = TTL + 30s
+            log.debug(
+                "[#0000]  _: <POOL> routing aged?, database=%s", database
+            )
+            routing_table = self.routing_tables[database]
+            if routing_table.should_be_purged_from_memory():
+                log.debug(
+                    "[#0000]  _: <POOL> dropping routing table for "
+                    "database=%s",
+                    database,
+                )
+                del self.routing_tables[database]
+
+    async def _refresh_routing_tables(self):
+        """
+        Refresh routing tables ahead of their expiry.
+
+        This is the work of the background routing table refresher.
+        It drops routing tables that should be purged from memory and
+        refreshes tables that have been used since their last update once
+        ``routing_table_refresh_ratio`` of their TTL has passed.
+        Expired tables are left to the foreground
+        (:meth:`ensure_routing_table_is_fresh`).
+
+        The routing lock is only held while inspecting the tables and while
+        applying a fetched table and updating the connection pool
+        accordingly, not while fetching new routing information. Hence,
+        concurrent acquisitions don't have to wait for the refresh.
+
+        :returns: the number of seconds until the next check is due.
+        """
+        ratio = self.pool_config.routing_table_refresh_ratio
+        now = monotonic()
+        next_check = now + _ROUTING_REFRESH_MAX_INTERVAL
+        due = {}
+        async with self.refresh_lock:
+            self._purge_routing_tables()
+            for database, routing_table in self.routing_tables.items():
+                updated = routing_table.last_updated_time
+                if updated + routing_table.ttl <= now:
+                    continue
+                refresh_at = updated + routing_table.ttl * ratio
+                if refresh_at > now:
+                    next_check = min(next_check, refresh_at)
+                    continue
+                if routing_table.used_since_update():
+                    due[database] = [
+                        router
+                        for router in routing_table.routers
+                        if router != self.address
+                    ]
+                # unused tables are checked again soon in case they get used
+                next_check = now
+        for database, routers in due.items():
+            log.debug(
+                "[#0000]  _: <POOL> background refresh of routing table "
+                "for database=%r",
+                database,
+            )
+            try:
+                await self._update_routing_table_from(
+                    *routers,
+                    self.address,
+                    database=database,
+                    imp_user=None,
+                    bookmarks=None,
+                    auth=None,
+                    acquisition_timeout=(
+                        self.workspace_config.connection_acquisition_timeout
+                    ),
+                    database_callback=None,
+                    update_pool=True,
+                )
+            except Exception as exc:
+                log.debug(
+                    "[#0000]  _: <POOL> background refresh of routing table "
+                    "for database=%r failed: %r",
+                    database,
+                    exc,
+                )
+        return max(next_check - monotonic(), _ROUTING_REFRESH_MIN_INTERVAL)
+
+    async def _warm_up_addresses(self):
+        async with self.refresh_lock:
+            addresses = set()
+            for routing_table in self.routing_tables.values():
+                addresses.update(routing_table.readers)
+                addresses.update(routing_table.writers)
+        return addresses
+
+    async def capacity(self, access_mode, database):
+        """
+        Get how many connections for an access mode can be used at once.
+
+        This takes into account all readers (or writers) of the routing table
+        of ``database`` as each of them has its own share of the pool.
+        If the routing table is not known (yet), a single server is assumed.
+
+        :returns: the number of connections or :data:`None` if the pool size
+            is unbounded.
+        """
+        from ...api import READ_ACCESS
+
+        max_pool_size = await super().capacity(access_mode, database)
+        if max_pool_size is None:
+            return None
+        servers = 0
+        async with self.refresh_lock:
+            routing_table = self.routing_tables.get(database)
+            if routing_table is not None:
+                if access_mode == READ_ACCESS:
+                    servers = len(routing_table.readers)
+                else:
+                    servers = len(routing_table.writers)
+        return max_pool_size * max(servers, 1)
+
     async def _select_address(self, *, access_mode, database):
         """Select the address with the fewest in-use connections."""
         from ...api import READ_ACCESS
@@ -1024,6 +1685,7 @@ class AsyncNeo4jPool(AsyncIOPool):
         async with self.refresh_lock:
             routing_table = self.routing_tables.get(database)
             if routing_table:
+                routing_table.mark_used()
                 if access_mode == READ_ACCESS:
                     addresses = routing_table.readers
                 else:
@@ -1086,6 +1748,9 @@ class AsyncNeo4jPool(AsyncIOPool):
             auth=auth,
             acquisition_timeout=timeout,
         )
+        if self._routing_table_refresher is not None:
+            self._routing_table_refresher.ensure_started()
+        self._ensure_workers_started()
 
         while True:
             try:
@@ -1137,6 +1802,16 @@ class AsyncNeo4jPool(AsyncIOPool):
         log.debug("[#0000]  _: <POOL> table=%r", self.routing_tables)
         await super().deactivate(address)
 
+    async def close(self):
+        """
+        Stop the background routing table refresher and close the pool.
+
+        This method is thread safe.
+        """
+        if self._routing_table_refresher is not None:
+            await self._routing_table_refresher.stop()
+        await super().close()
+
     async def on_write_failure(self, address, database):
         """Remove a writer address from the routing table, if present."""
         log.debug(
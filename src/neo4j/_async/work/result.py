@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import inspect
 import typing as t
+from array import array
 from collections import deque
 from logging import getLogger
 from pathlib import Path
@@ -37,24 +38,26 @@ from ..._api import (
 )
 from ..._async_compat.util import AsyncUtil
 from ..._codec.hydration import BrokenHydrationObject
-from ..._data import (
-    Record,
-    RecordTableRowExporter,
-)
+from ..._data import Record
 from ..._debug import NotificationPrinter
+from ..._meta import (
+    preview,
+    preview_warn,
+)
 from ..._work import (
     EagerResult,
     ResultSummary,
 )
+from ..._work.tabular import (
+    columns_to_arrow_arrays,
+    columns_to_df,
+    parse_df_dates,
+)
 from ...exceptions import (
     ResultConsumedError,
     ResultFailedError,
     ResultNotSingleError,
 )
-from ...time import (
-    Date,
-    DateTime,
-)
 from ...warnings import (
     Neo4jDeprecationWarning,
     Neo4jWarning,
@@ -65,6 +68,7 @@ from ..io import ConnectionErrorHandler
 
 if t.TYPE_CHECKING:
     import pandas  # type: ignore[import]
+    import pyarrow  # type: ignore[import]
 
     from ...addressing import Address
     from ...graph import Graph
@@ -76,6 +80,26 @@ notification_log = getLogger("neo4j.notifications")
 _driver_dir = Path(__file__)
 for _ in range(__package__.count(".") + 1):
     _driver_dir = _driver_dir.parent
+_driver_dir_prefix = str(_driver_dir)
+
+
+def _user_code_location() -> tuple[str, int, dict[str, t.Any]] | None:
+    # Find the innermost frame outside the driver by following f_back.
+    # Unlike inspect.stack(), this doesn't build FrameInfo objects or read
+    # source lines for the whole stack. The line number has to be captured
+    # right away as it changes while the frame keeps executing. Not holding
+    # on to the frame itself also avoids keeping its locals alive.
+    frame = inspect.currentframe()
+    try:
+        while frame is not None:
+            filename = frame.f_code.co_filename
+            if not filename.startswith(_driver_dir_prefix):
+                return filename, frame.f_lineno, frame.f_globals
+            frame = frame.f_back
+        return None
+    finally:
+        del frame
+
 
 _T = t.TypeVar("_T")
 _TResultKey = t.Union[int, str]
@@ -96,6 +120,23 @@ _RESULT_CONSUMED_ERROR = (
 )
 
 
+def _column_to_array(column: list[t.Any]) -> t.Sequence[t.Any]:
+    # Pack homogeneous int or float columns into a compact typed array.
+    # bool is a subclass of int, hence the exact type check.
+    if not column:
+        return column
+    type_ = type(column[0])
+    if type_ is int:
+        typecode = "q"
+    elif type_ is float:
+        typecode = "d"
+    else:
+        return column
+    if not all(type(value) is type_ for value in column):
+        return column
+    return array(typecode, column)
+
+
 class AsyncResult(AsyncNonConcurrentMethodChecker):
     """
     Handler for the result of Cypher query execution.
@@ -104,8 +145,7 @@ class AsyncResult(AsyncNonConcurrentMethodChecker):
     :meth:`.AsyncSession.run` and :meth:`.AsyncTransaction.run`.
     """
 
-    _creation_stack: list[inspect.FrameInfo] | None
-    _creation_frame_cache: None | t.Literal[False] | inspect.FrameInfo
+    _creation_location: tuple[str, int, dict[str, t.Any]] | None
 
     def __init__(
         self,
@@ -127,6 +167,8 @@ class AsyncResult(AsyncNonConcurrentMethodChecker):
         self._keys: tuple[str, ...] = ()
         self._had_record = False
         self._record_buffer: deque[Record] = deque()
+        # when set, raw records are passed here instead of being buffered
+        self._record_sink: t.Callable[[t.Iterable[t.Any]], None] | None = None
         self._summary: ResultSummary | None = None
         self._database = None
         self._bookmark = None
@@ -134,10 +176,9 @@ class AsyncResult(AsyncNonConcurrentMethodChecker):
         self._fetch_size = fetch_size
         self._warn_notification_severity = warn_notification_severity
         if warn_notification_severity is not None:
-            self._creation_stack = inspect.stack()
+            self._creation_location = _user_code_location()
         else:
-            self._creation_stack = None
-        self._creation_frame_cache = None
+            self._creation_location = None
 
         # states
         self._discarding = False  # discard the remainder of records
@@ -169,10 +210,15 @@ class AsyncResult(AsyncNonConcurrentMethodChecker):
             return self._raw_qid
 
     async def _tx_ready_run(self, query, parameters):
+        self._tx_ready_queue_run(query, parameters)
+        await self._connection.send_all()
+        await self._attach()
+
+    def _tx_ready_queue_run(self, query, parameters):
         # BEGIN+RUN does not carry any extra on the RUN message.
         # BEGIN {extra}
         # RUN "query" {parameters} {extra}
-        await self._run(query, parameters, None, None, None, None, None, None)
+        self._queue_run(query, parameters, None, None, None, None, None, None)
 
     async def _run(
         self,
@@ -185,6 +231,32 @@ class AsyncResult(AsyncNonConcurrentMethodChecker):
         notifications_min_severity,
         notifications_disabled_classifications,
     ):
+        self._queue_run(
+            query,
+            parameters,
+            db,
+            imp_user,
+            access_mode,
+            bookmarks,
+            notifications_min_severity,
+            notifications_disabled_classifications,
+        )
+        await self._connection.send_all()
+        await self._attach()
+
+    def _queue_run(
+        self,
+        query,
+        parameters,
+        db,
+        imp_user,
+        access_mode,
+        bookmarks,
+        notifications_min_severity,
+        notifications_disabled_classifications,
+    ):
+        # Queue RUN and PULL without sending them. The caller is responsible
+        # for sending the messages and attaching the result afterward.
         query_text = str(query)  # Query or string object
         query_metadata = getattr(query, "metadata", None)
         query_timeout = getattr(query, "timeout", None)
@@ -227,14 +299,16 @@ class AsyncResult(AsyncNonConcurrentMethodChecker):
             on_failure=on_failed_attach,
         )
         self._pull()
-        await self._connection.send_all()
-        await self._attach()
 
     def _pull(self):
         def on_records(records):
             if records:
                 self._had_record = True
-            if not self._discarding:
+            if self._discarding:
+                return
+            if self._record_sink is not None:
+                self._record_sink(records)
+            else:
                 records = (
                     record.raw_data
                     if isinstance(record, BrokenHydrationObject)
@@ -339,42 +413,22 @@ class AsyncResult(AsyncNonConcurrentMethodChecker):
             warning_cls: type[Warning] = Neo4jWarning
             if notification.category == NotificationCategory.DEPRECATION:
                 warning_cls = Neo4jDeprecationWarning
-            creation_frame = self._creation_frame
-            if creation_frame is False:
+            creation_location = self._creation_location
+            if creation_location is None:
                 warn(warning_cls(notification), stacklevel=1)
             else:
-                globals_ = creation_frame.frame.f_globals
+                filename, lineno, globals_ = creation_location
                 warning_registry = globals_.get("__warningregistry__", {})
                 warn_explicit(
                     warning_cls(notification, query),
                     None,
-                    creation_frame.filename,
-                    creation_frame.lineno,
+                    filename,
+                    lineno,
                     module=globals_["__name__"],
                     registry=warning_registry,
                     module_globals=globals_,
                 )
 
-    @property
-    def _creation_frame(self) -> t.Literal[False] | inspect.FrameInfo:
-        if self._creation_frame_cache is not None:
-            return self._creation_frame_cache
-
-        if self._creation_stack is None:
-            self._creation_frame_cache = False
-        else:
-            self._creation_frame_cache = next(
-                (
-                    frame
-                    for frame in self._creation_stack
-                    if not frame.filename.startswith(str(_driver_dir))
-                ),
-                False,
-            )
-
-        assert self._creation_frame_cache is not None  # help mypy a little
-        return self._creation_frame_cache
-
     @AsyncNonConcurrentMethodChecker._non_concurrent_iter
     async def __aiter__(self) -> t.AsyncIterator[Record]:
         """
@@ -389,15 +443,44 @@ class AsyncResult(AsyncNonConcurrentMethodChecker):
         while self._record_buffer or self._attached:
             if self._record_buffer:
                 yield self._record_buffer.popleft()
-            elif self._streaming:
-                await self._connection.fetch_message()
-            elif self._discarding:
-                self._discard()
-                await self._connection.send_all()
-            elif self._has_more:
-                self._pull()
-                await self._connection.send_all()
+            else:
+                await self._advance()
+        self._end_of_stream()
 
+    @AsyncNonConcurrentMethodChecker._non_concurrent_method
+    async def __anext__(self) -> Record:
+        """
+        Advance the result stream and return the record.
+
+        :raises StopAsyncIteration: if no more records are available.
+        """
+        return await self.__aiter__().__anext__()
+
+    async def _advance(self, record_sink=None):
+        # Make progress on the attached result stream by receiving the next
+        # message or by requesting more records.
+        # If given, records are passed to record_sink instead of being
+        # buffered. The sink is only installed while receiving, so it can't
+        # keep swallowing records if its consumer is abandoned.
+        if self._streaming:
+            self._record_sink = record_sink
+            try:
+                await self._connection.fetch_message()
+            finally:
+                self._record_sink = None
+        elif self._discarding:
+            self._discard()
+            await self._connection.send_all()
+        elif self._has_more:
+            self._pull()
+            await self._connection.send_all()
+
+    def _awaiting_pull(self):
+        # All records requested so far have been received and there are more.
+        return not (self._streaming or self._discarding) and self._has_more
+
+    def _end_of_stream(self):
+        # Mark the result exhausted and raise if it ended prematurely.
         self._exhausted = True
         if self._exception is not None:
             raise ResultFailedError(
@@ -408,15 +491,6 @@ class AsyncResult(AsyncNonConcurrentMethodChecker):
         if self._consumed:
             raise ResultConsumedError(self, _RESULT_CONSUMED_ERROR)
 
-    @AsyncNonConcurrentMethodChecker._non_concurrent_method
-    async def __anext__(self) -> Record:
-        """
-        Advance the result stream and return the record.
-
-        :raises StopAsyncIteration: if no more records are available.
-        """
-        return await self.__aiter__().__anext__()
-
     async def _attach(self):
         # Set the Result object in an attached state by fetching messages
         # from the connection to the buffer.
@@ -485,12 +559,33 @@ class AsyncResult(AsyncNonConcurrentMethodChecker):
             async for _ in self:
                 pass
 
-    async def _tx_end(self):
+    def _tx_end_prepare(self):
+        # Prepare closure of the associated transaction.
+        #
+        # Ditch all remaining records. Once the transaction has fetched all
+        # outstanding responses, `_tx_end_discard` queues a DISCARD for the
+        # records left on the server (if any) so that it can be sent
+        # together with the message ending the transaction.
+        if self._exhausted:
+            return
+        self._discarding = True
+        self._record_buffer.clear()
+        if self._exception is not None:
+            raise ResultFailedError(
+                self, _RESULT_FAILED_ERROR
+            ) from self._exception
+
+    def _tx_end_discard(self):
+        if self._attached and self._has_more and not self._streaming:
+            self._discard()
+
+    def _tx_end(self):
         # Handle closure of the associated transaction.
         #
-        # This will consume the result and mark it at out of scope.
+        # This will mark the result as consumed and out of scope.
         # Subsequent calls to `next` will raise a ResultConsumedError.
-        await self._exhaust()
+        self._attached = False
+        self._exhausted = True
         self._out_of_scope = True
 
     def _tx_failure(self, exc):
@@ -801,9 +896,233 @@ class AsyncResult(AsyncNonConcurrentMethodChecker):
             summary=await self.consume(),
         )
 
+    @preview("Result.to_columns is a preview feature.")
+    @AsyncNonConcurrentMethodChecker._non_concurrent_method
+    async def to_columns(self) -> dict[str, t.Sequence[t.Any]]:
+        """
+        Return the remainder of the result as a dictionary of columns.
+
+        Each key of the result is mapped to the sequence of its values in
+        record order.
+        Records are decoded straight into the columns without creating
+        :class:`.Record` objects, which makes this cheaper than, e.g.,
+        :meth:`.values` followed by a transposition.
+
+        Columns that exclusively contain :class:`int` values are returned as
+        :class:`array.array` of type code ``"q"`` and columns that
+        exclusively contain :class:`float` values as :class:`array.array` of
+        type code ``"d"``.
+        All other columns are returned as :class:`list`.
+
+        ::
+
+            res = await tx.run("UNWIND range(1, 3) AS n RETURN n, 'x' AS s")
+            columns = await res.to_columns()
+            # {"n": array("q", [1, 2, 3]), "s": ["x", "x", "x"]}
+
+        :returns: dictionary of column sequences
+
+        :raises ResultConsumedError: if the transaction from which this result
+            was obtained has been closed or the Result has been explicitly
+            consumed.
+
+        **This is a preview** (see :ref:`filter-warnings-ref`).
+        It might be changed without following the deprecation policy.
+        See also
+        https://github.com/neo4j/neo4j-python-driver/wiki/preview-features
+
+        .. versionadded:: 5.26
+        """
+        columns = await self._columns()
+        return {
+            key: _column_to_array(column)
+            for key, column in zip(self._keys, columns)
+        }
+
+    async def _columns(self) -> list[list[t.Any]]:
+        (columns,) = [
+            batch async for batch in self._column_batches(per_fetch=False)
+        ]
+        return columns
+
+    async def _column_batches(
+        self, per_fetch: bool = False, batch_rows: int | None = None
+    ) -> t.AsyncIterator[list[list[t.Any]]]:
+        # Decode the remaining records straight into columns.
+        # If per_fetch is True, a batch of columns is yielded whenever a PULL
+        # has been fully received and there were records in it.
+        # If batch_rows is set, a batch of columns is yielded whenever that
+        # many rows have been received.
+        # Remaining rows are yielded at the end. If neither option is set,
+        # all columns are yielded once at the end (even if there are none).
+        if self._out_of_scope:
+            raise ResultConsumedError(self, _RESULT_OUT_OF_SCOPE_ERROR)
+        if self._consumed:
+            raise ResultConsumedError(self, _RESULT_CONSUMED_ERROR)
+        columns: list[list[t.Any]] = []
+        appenders: list[t.Callable[[t.Any], None]] = []
+        # rows received so far and how many of them have been yielded already
+        rows = offset = 0
+        broken_records = []
+
+        def new_batch():
+            nonlocal columns, appenders, rows, offset
+            columns = [[] for _ in self._keys]
+            appenders = [column.append for column in columns]
+            rows = offset = 0
+
+        def compact():
+            # Drop the rows that have been yielded already. This only happens
+            # before more records are fetched, when fewer than batch_rows rows
+            # are left, so it doesn't copy the same rows over and over.
+            nonlocal columns, appenders, rows, offset
+            if offset:
+                columns = [column[offset:] for column in columns]
+                appenders = [column.append for column in columns]
+                rows -= offset
+                offset = 0
+
+        def sink(records):
+            nonlocal rows
+            for record in records:
+                if isinstance(record, BrokenHydrationObject):
+                    broken_records.append(record.raw_data)
+                    record = record.raw_data
+                for append, value in zip(appenders, record):
+                    append(value)
+                rows += 1
+
+        def batch_ready():
+            if broken_records:
+                # raise the same BrokenRecordError iterating the record would
+                tuple(Record(zip(self._keys, broken_records[0])))
+            return rows > offset
+
+        def full_batch():
+            return batch_rows is not None and rows - offset >= batch_rows
+
+        new_batch()
+        sink(self._record_buffer)
+        self._record_buffer.clear()
+        while self._attached or full_batch():
+            if full_batch():
+                assert batch_rows is not None  # help mypy a little
+                batch_ready()
+                end = offset + batch_rows
+                yield [column[offset:end] for column in columns]
+                offset = end
+            elif per_fetch and self._awaiting_pull() and batch_ready():
+                yield columns
+                new_batch()
+            else:
+                compact()
+                await self._advance(record_sink=sink)
+        self._end_of_stream()
+        if batch_ready() or not (per_fetch or batch_rows is not None):
+            compact()
+            yield columns
+
+    @preview("Result.to_arrow is a preview feature.")
+    @AsyncNonConcurrentMethodChecker._non_concurrent_method
+    async def to_arrow(self) -> pyarrow.Table:
+        """
+        Convert (the rest of) the result to a :class:`pyarrow.Table`.
+
+        This method is only available if the `pyarrow` library is installed.
+
+        ::
+
+            res = await tx.run("UNWIND range(1, 10) AS n RETURN n, n+1 AS m")
+            table = await res.to_arrow()
+
+        for instance will return a table with two ``int64`` columns: ``n``
+        and ``m`` and 10 rows.
+
+        Columns that exclusively contain :class:`time.DateTime` objects or
+        :data:`None` are converted to ``timestamp[ns]`` columns.
+        If the values carry a time zone, the column's time zone will be the
+        values' shared time zone name or ``UTC`` if there is no such name.
+        Columns that exclusively contain :class:`time.Date` objects or
+        :data:`None` are converted to ``date32`` columns.
+        For all other columns, pyarrow's type inference is used.
+        Hence, columns containing values not representable in Arrow (e.g.,
+        :class:`.Node` or :class:`time.Duration` objects) will cause an
+        error.
+
+        :raises ImportError: if `pyarrow` library is not available.
+        :raises pyarrow.ArrowException: if a column cannot be converted.
+        :raises ResultConsumedError: if the transaction from which this result
+            was obtained has been closed or the Result has been explicitly
+            consumed.
+
+        **This is a preview** (see :ref:`filter-warnings-ref`).
+        It might be changed without following the deprecation policy.
+        See also
+        https://github.com/neo4j/neo4j-python-driver/wiki/preview-features
+
+        .. seealso:: :meth:`.iter_arrow_batches`
+
+        .. versionadded:: 5.26
+        """
+        import pyarrow as pa  # type: ignore[import]
+
+        columns = await self._columns()
+        return pa.Table.from_arrays(
+            columns_to_arrow_arrays(columns), names=list(self._keys)
+        )
+
+    @preview("Result.iter_arrow_batches is a preview feature.")
+    @AsyncNonConcurrentMethodChecker._non_concurrent_iter
+    async def iter_arrow_batches(self) -> t.AsyncIterator[pyarrow.RecordBatch]:
+        """
+        Stream (the rest of) the result as Arrow record batches.
+
+        This method is only available if the `pyarrow` library is installed.
+
+        One record batch is produced for each batch of records fetched from
+        the server (see ``fetch_size`` in :ref:`session-configuration-ref`).
+        The next batch is only requested from the server once the previous
+        record batch has been handed out.
+        Hence, only one batch of records is held in memory at a time.
+
+        ::
+
+            res = await tx.run("UNWIND range(1, 10) AS n RETURN n, n+1 AS m")
+            async for batch in res.iter_arrow_batches():
+                ...
+
+        The columns are converted like in :meth:`.to_arrow`.
+        Note that type inference happens per batch, so the schema of the
+        batches might differ (e.g., a column containing only :data:`None` in
+        one batch will be of type ``null`` in that batch).
+
+        :raises ImportError: if `pyarrow` library is not available.
+        :raises pyarrow.ArrowException: if a column cannot be converted.
+        :raises ResultConsumedError: if the transaction from which this result
+            was obtained has been closed or the Result has been explicitly
+            consumed.
+
+        **This is a preview** (see :ref:`filter-warnings-ref`).
+        It might be changed without following the deprecation policy.
+        See also
+        https://github.com/neo4j/neo4j-python-driver/wiki/preview-features
+
+        .. versionadded:: 5.26
+        """
+        import pyarrow as pa  # type: ignore[import]
+
+        names = list(self._keys)
+        async for columns in self._column_batches(per_fetch=True):
+            yield pa.RecordBatch.from_arrays(
+                columns_to_arrow_arrays(columns), names=names
+            )
+
     @AsyncNonConcurrentMethodChecker._non_concurrent_method
     async def to_df(
-        self, expand: bool = False, parse_dates: bool = False
+        self,
+        expand: bool = False,
+        parse_dates: bool = False,
+        batch_rows: int | None = None,
     ) -> pandas.DataFrame:
         r"""
         Convert (the rest of) the result to a pandas DataFrame.
@@ -887,68 +1206,125 @@ class AsyncResult(AsyncNonConcurrentMethodChecker):
             :data:`None`, will be converted to :class:`pandas.Timestamp`.
             If :data:`False`, columns of the above types will be left as driver
             types (dtype ``object``).
+        :param batch_rows:
+            If set, the DataFrame is built from DataFrames of (at most)
+            ``batch_rows`` rows each, which are concatenated at the end.
+            This bounds the number of records held in memory as Python
+            objects to one batch.
+            Note that column dtypes are inferred per batch and combined
+            following :func:`pandas.concat`'s rules.
+            Hence, they might differ from those inferred for the whole
+            result at once (e.g., an ``int64`` batch followed by a batch
+            containing only :data:`None` results in an ``object`` column).
+            If :data:`None` (default), the DataFrame is built in one go.
+
+            **This is a preview** (see :ref:`filter-warnings-ref`).
+            It might be changed without following the deprecation policy.
+            See also
+            https://github.com/neo4j/neo4j-python-driver/wiki/preview-features
+
+            .. versionadded:: 5.26
 
         :raises ImportError: if `pandas` library is not available.
+        :raises ValueError: if ``batch_rows`` is not a positive integer.
         :raises ResultConsumedError: if the transaction from which this result
             was obtained has been closed or the Result has been explicitly
             consumed.
         """
         import pandas as pd  # type: ignore[import]
-        import pytz
 
-        if not expand:
-            df = pd.DataFrame(await self.values(), columns=self._keys)
+        if batch_rows is not None:
+            preview_warn(
+                "Passing batch_rows to to_df is a preview feature.",
+                stack_level=2,
+            )
+        if batch_rows is not None and batch_rows < 1:
+            raise ValueError(
+                f"batch_rows must be a positive integer, got {batch_rows!r}"
+            )
+        if batch_rows is None:
+            df = columns_to_df(self._keys, await self._columns(), expand)
         else:
-            df_keys = None
-            rows = []
-            async for record in self:
-                row = RecordTableRowExporter().transform(dict(record.items()))
-                if df_keys == row.keys():
-                    rows.append(row.values())
-                elif df_keys is None:
-                    df_keys = row.keys()
-                    rows.append(row.values())
-                elif df_keys is False:
-                    rows.append(row)
-                else:
-                    # The rows have different keys. We need to pass a list
-                    # of dicts to pandas
-                    rows = [dict(zip(df_keys, r)) for r in rows]
-                    df_keys = False
-                    rows.append(row)
-            if df_keys is False:
-                df = pd.DataFrame(rows)
+            dfs = [
+                columns_to_df(self._keys, columns, expand)
+                async for columns in self._column_batches(
+                    batch_rows=batch_rows
+                )
+            ]
+            if dfs:
+                df = pd.concat(dfs, ignore_index=True)
             else:
-                columns = df_keys or [
-                    k.replace(".", "\\.").replace("\\", "\\\\")
-                    for k in self._keys
-                ]
-                df = pd.DataFrame(rows, columns=columns)
-        if not parse_dates:
-            return df
-        dt_columns = df.columns[
-            df.apply(
-                lambda col: pd.api.types.infer_dtype(col) == "mixed"
-                and col.map(
-                    lambda x: isinstance(x, (DateTime, Date, type(None)))
-                ).all()
-            )
-        ]
+                df = columns_to_df(
+                    self._keys, [[] for _ in self._keys], expand
+                )
+        if parse_dates:
+            df = parse_df_dates(df)
+        return df
+
+    @preview("Result.iter_dfs is a preview feature.")
+    @AsyncNonConcurrentMethodChecker._non_concurrent_iter
+    async def iter_dfs(
+        self,
+        batch_rows: int | None = None,
+        expand: bool = False,
+        parse_dates: bool = False,
+    ) -> t.AsyncIterator[pandas.DataFrame]:
+        """
+        Stream (the rest of) the result as pandas DataFrames.
+
+        This method is only available if the `pandas` library is installed.
+
+        Each DataFrame holds one batch of records.
+        The next batch is only requested from the server once the previous
+        DataFrame has been handed out.
+        Hence, only one batch of records is held in memory as Python objects
+        at a time.
+
+        ::
+
+            res = await tx.run("UNWIND range(1, 10) AS n RETURN n, n+1 AS m")
+            async for df in res.iter_dfs(batch_rows=4):
+                ...
+
+        for instance will produce three DataFrames with two columns: ``n`` and
+        ``m`` and 4, 4, and 2 rows respectively.
+
+        :param batch_rows: The number of rows per DataFrame (the last one
+            might have fewer).
+            If :data:`None` (default), one DataFrame is produced per batch of
+            records fetched from the server (see ``fetch_size`` in
+            :ref:`session-configuration-ref`).
+        :param expand: See :meth:`.to_df`.
+        :param parse_dates: See :meth:`.to_df`.
+            Note that the conversion is applied to each DataFrame on its own.
+            A column that only contains :data:`None` in one batch will,
+            therefore, not be converted in that batch's DataFrame.
 
-        def datetime_to_timestamp(x):
-            if not x:
-                return pd.NaT
-            tzinfo = getattr(x, "tzinfo", None)
-            if tzinfo is None:
-                return pd.Timestamp(x.iso_format())
-            return pd.Timestamp(
-                x.astimezone(pytz.UTC).iso_format()
-            ).astimezone(tzinfo)
-
-        df[dt_columns] = df[dt_columns].apply(
-            lambda col: col.map(datetime_to_timestamp)
+        :raises ImportError: if `pandas` library is not available.
+        :raises ValueError: if ``batch_rows`` is not a positive integer.
+        :raises ResultConsumedError: if the transaction from which this result
+            was obtained has been closed or the Result has been explicitly
+            consumed.
+
+        **This is a preview** (see :ref:`filter-warnings-ref`).
+        It might be changed without following the deprecation policy.
+        See also
+        https://github.com/neo4j/neo4j-python-driver/wiki/preview-features
+
+        .. versionadded:: 5.26
+        """
+        if batch_rows is not None and batch_rows < 1:
+            raise ValueError(
+                f"batch_rows must be a positive integer, got {batch_rows!r}"
+            )
+        batches = self._column_batches(
+            per_fetch=batch_rows is None, batch_rows=batch_rows
         )
-        return df
+        async for columns in batches:
+            df = columns_to_df(self._keys, columns, expand)
+            if parse_dates:
+                df = parse_df_dates(df)
+            yield df
 
     def closed(self) -> bool:
         """
@@ -20,6 +20,7 @@ import asyncio
 import typing as t
 
 from ..._async_compat.util import AsyncUtil
+from ..._meta import preview
 from ..._work import Query
 from ...exceptions import TransactionError
 from .._debug import AsyncNonConcurrentMethodChecker
@@ -55,6 +56,8 @@ class AsyncTransactionBase(AsyncNonConcurrentMethodChecker):
         self._bookmark = None
         self._database = None
         self._results = []
+        # set once a COMMIT has been sent along with a query
+        self._commit_metadata = None
         self._closed_flag = False
         self._last_error = None
         self._fetch_size = fetch_size
@@ -120,8 +123,22 @@ class AsyncTransactionBase(AsyncNonConcurrentMethodChecker):
         await AsyncUtil.callback(self._on_error, exc)
 
     async def _consume_results(self):
+        # Queue a DISCARD for every result with records left on the server.
+        # They're sent in one go with the message ending the transaction
+        # instead of costing a round trip each.
         for result in self._results:
-            await result._tx_end()
+            result._tx_end_prepare()
+        # Outstanding responses (e.g., to PULL) tell which results have
+        # records left on the server. Messages might still be queued (e.g., a
+        # pipelined BEGIN if queueing the first RUN failed), so flush first.
+        await self._error_handling_connection.send_all()
+        await self._error_handling_connection.fetch_all()
+        for result in self._results:
+            result._tx_end_discard()
+
+    def _end_results(self):
+        for result in self._results:
+            result._tx_end()
         self._results = []
 
     @AsyncNonConcurrentMethodChecker._non_concurrent_method
@@ -196,6 +213,118 @@ class AsyncTransactionBase(AsyncNonConcurrentMethodChecker):
 
         return result
 
+    @preview("Transaction.run_many is a preview feature.")
+    @AsyncNonConcurrentMethodChecker._non_concurrent_method
+    async def run_many(
+        self,
+        queries: t.Iterable[tuple[te.LiteralString, dict[str, t.Any] | None]],
+    ) -> list[AsyncResult]:
+        """
+        Run several Cypher queries within the context of this transaction.
+
+        All queries are sent to the server in one go instead of waiting for
+        the server to respond to each query before sending the next one::
+
+            query = "CREATE (a:Person { name: $name, age: $age })"
+            results = await tx.run_many([
+                (query, {"name": "Alice", "age": 33}),
+                (query, {"name": "Bob", "age": 44}),
+            ])
+
+        This saves a network round trip per query, which adds up when running
+        many small queries.
+        The queries are still executed one after another by the server.
+        If one of them fails, the transaction fails as if the queries had
+        been run with :meth:`.run` one by one.
+
+        :param queries: pairs of cypher query and dictionary of parameters
+            (or :data:`None`).
+
+        :raise TransactionError: if the transaction is already closed
+
+        :returns: a list of new :class:`neo4j.AsyncResult` objects, one per
+            query in the order of ``queries``.
+
+        **This is a preview** (see :ref:`filter-warnings-ref`).
+        It might be changed without following the deprecation policy.
+        See also
+        https://github.com/neo4j/neo4j-python-driver/wiki/preview-features
+
+        .. versionadded:: 5.26
+        """
+        return await self._run_many(queries, self._fetch_size)
+
+    async def _run_many(self, queries, fetch_size, commit=False):
+        # Queue RUN and PULL for all queries (and COMMIT if requested) and
+        # send them with a single flush.
+        # With `commit=True`, the returned results must be consumed before
+        # calling `_commit` to get to know whether the commit succeeded.
+        if self._closed_flag or self._commit_metadata is not None:
+            raise TransactionError(self, "Transaction closed")
+        if self._last_error:
+            raise TransactionError(
+                self, "Transaction failed"
+            ) from self._last_error
+
+        if (
+            self._results
+            and self._connection.supports_multiple_results is False
+        ):
+            # Bolt 3 Support
+            await self._results[-1]._buffer_all()
+
+        queries = list(queries)
+        for query, _ in queries:
+            if isinstance(query, Query):
+                # TODO: 6.0 - make this a TypeError and remove lint exception
+                raise ValueError(  # noqa: TRY004
+                    "Query object is only supported for session.run"
+                )
+            if not isinstance(query, str):
+                raise TypeError("query must be a string")
+
+        results = []
+        try:
+            for query, parameters in queries:
+                result = AsyncResult(
+                    self._connection,
+                    fetch_size,
+                    self._warn_notification_severity,
+                    self._result_on_closed_handler,
+                    self._error_handler,
+                )
+                result._tx_ready_queue_run(query, dict(parameters or {}))
+                self._results.append(result)
+                results.append(result)
+        except Exception:
+            # Packing the parameters of a query failed. Don't leave the
+            # queries queued before it behind: send them and consume their
+            # responses so the connection is in a clean state again.
+            if results:
+                await self._error_handling_connection.send_all()
+                await self._error_handling_connection.fetch_all()
+            raise
+
+        if commit:
+            commit_metadata = {}
+            self._connection.commit(on_success=commit_metadata.update)
+            self._commit_metadata = commit_metadata
+
+        await self._error_handling_connection.send_all()
+        for result in results:
+            await result._attach()
+        return results
+
+    @AsyncNonConcurrentMethodChecker._non_concurrent_method
+    async def _run_and_commit(self, query, parameters):
+        # Run a query pulling all records at once with the COMMIT queued
+        # right behind it. This saves the round trip of committing if the
+        # transaction consists of a single query whose records are all
+        # consumed anyway. The returned result must be consumed before
+        # calling `_commit` to get to know whether the commit succeeded.
+        results = await self._run_many(((query, parameters),), -1, commit=True)
+        return results[0]
+
     @AsyncNonConcurrentMethodChecker._non_concurrent_method
     async def _commit(self):
         if self._closed_flag:
@@ -207,17 +336,23 @@ class AsyncTransactionBase(AsyncNonConcurrentMethodChecker):
 
         metadata = {}
         try:
-            # DISCARD pending records then do a commit.
+            # DISCARD pending records then do a commit (pipelined).
             await self._consume_results()
-            self._connection.commit(on_success=metadata.update)
-            await self._connection.send_all()
-            await self._connection.fetch_all()
+            if self._commit_metadata is None:
+                self._connection.commit(on_success=metadata.update)
+                await self._connection.send_all()
+                await self._connection.fetch_all()
+            else:
+                # COMMIT was sent along with the query and its response has
+                # been consumed with the other pending ones.
+                metadata = self._commit_metadata
             self._bookmark = metadata.get("bookmark")
             self._database = metadata.get("db", self._database)
         except asyncio.CancelledError:
             self._on_cancel()
             raise
         finally:
+            self._end_results()
             self._closed_flag = True
             await AsyncUtil.callback(self._on_closed)
 
@@ -234,8 +369,10 @@ class AsyncTransactionBase(AsyncNonConcurrentMethodChecker):
                 self._connection.defunct()
                 or self._connection.closed()
                 or self._connection.is_reset
+                # too late, COMMIT has been sent already
+                or self._commit_metadata is not None
             ):
-                # DISCARD pending records then do a rollback.
+                # DISCARD pending records then do a rollback (pipelined).
                 await self._consume_results()
                 self._connection.rollback(on_success=metadata.update)
                 await self._connection.send_all()
@@ -244,6 +381,7 @@ class AsyncTransactionBase(AsyncNonConcurrentMethodChecker):
             self._on_cancel()
             raise
         finally:
+            self._end_results()
             self._closed_flag = True
             await AsyncUtil.callback(self._on_closed)
 
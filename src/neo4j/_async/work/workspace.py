@@ -184,6 +184,19 @@ class AsyncWorkspace(AsyncNonConcurrentMethodChecker):
         self._connection = await self._pool.acquire(**acquire_kwargs_)
         self._connection_access_mode = access_mode
 
+    async def _refresh_writers(self, auth=None):
+        # Update the routing table right away (instead of on the next
+        # connection acquisition) and report whether a writer is known.
+        if not isinstance(self._pool, AsyncNeo4jPool):
+            return False
+        return await self._pool.refresh_writers(
+            database=self._config.database,
+            imp_user=self._config.impersonated_user,
+            bookmarks=await self._get_bookmarks(),
+            auth=AcquireAuth(auth),
+            acquisition_timeout=self._config.connection_acquisition_timeout,
+        )
+
     async def _disconnect(self, sync=False):
         if self._connection:
             if sync:
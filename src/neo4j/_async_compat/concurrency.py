@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import asyncio
 import collections
+import concurrent.futures
 import re
 import threading
 import typing as t
@@ -34,15 +35,24 @@ __all__ = [
     "AsyncCooperativeLock",
     "AsyncCooperativeRLock",
     "AsyncLock",
+    "AsyncPeriodicWorker",
     "AsyncRLock",
     "Condition",
     "CooperativeLock",
     "CooperativeRLock",
     "Lock",
+    "PeriodicWorker",
     "RLock",
+    "async_bounded_as_completed",
+    "async_staggered_race",
+    "bounded_as_completed",
+    "staggered_race",
 ]
 
 
+_T = t.TypeVar("_T")
+
+
 AsyncLock = asyncio.Lock
 
 
@@ -479,6 +489,345 @@ class AsyncCondition:
         self.notify(len(self._waiters))
 
 
+class AsyncPeriodicWorker:
+    """
+    Run a coroutine function repeatedly in a background task.
+
+    ``work`` is awaited without arguments and must return the number of
+    seconds to sleep before it's called again.
+    The worker is started lazily (there must be a running event loop) and
+    runs until :meth:`stop` is called.
+    ``work`` is expected to handle its own errors: an exception escaping it
+    ends the worker.
+    """
+
+    def __init__(self, work: t.Callable[[], t.Awaitable[float]]) -> None:
+        self._work = work
+        self._task: asyncio.Future | None = None
+        self._stopped = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def ensure_started(self) -> None:
+        """Start the worker unless it's already running or was stopped."""
+        if self._stopped or self.running:
+            return
+        self._task = asyncio.ensure_future(self._run())
+
+    async def _run(self) -> None:
+        while not self._stopped:
+            delay = await self._work()
+            await asyncio.sleep(delay)
+
+    async def stop(self) -> None:
+        """Stop the worker and wait for it to finish."""
+        self._stopped = True
+        task, self._task = self._task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        if task is not asyncio.current_task():
+            await asyncio.wait((task,))
+
+
+class PeriodicWorker:
+    """
+    Run a function repeatedly in a background (daemon) thread.
+
+    ``work`` is called without arguments and must return the number of
+    seconds to sleep before it's called again.
+    The worker is started lazily and runs until :meth:`stop` is called.
+    ``work`` is expected to handle its own errors: an exception escaping it
+    ends the worker.
+    Threads can't be cancelled: :meth:`stop` waits at most ``stop_timeout``
+    seconds for a call of ``work`` in progress. Past that, the call is left
+    to finish in the background; ``work`` isn't called again.
+    """
+
+    def __init__(
+        self, work: t.Callable[[], float], stop_timeout: float = 5.0
+    ) -> None:
+        self._work = work
+        self._stop_timeout = stop_timeout
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def ensure_started(self) -> None:
+        """Start the worker unless it's already running or was stopped."""
+        with self._lock:
+            if self._stop_event.is_set() or self.running:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="neo4j-periodic-worker", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            delay = self._work()
+            self._stop_event.wait(delay)
+
+    def stop(self) -> None:
+        """Stop the worker and wait (at most ``stop_timeout``) for it."""
+        with self._lock:
+            self._stop_event.set()
+            thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(self._stop_timeout)
+
+
+async def async_staggered_race(
+    attempts: t.Iterable[t.Callable[[], t.Awaitable[_T | None]]],
+    delay: float,
+    discard: t.Callable[[_T], t.Awaitable[None]] | None = None,
+    cancel: t.Callable[[int], None] | None = None,
+) -> tuple[int | None, _T | None]:
+    """
+    Run attempts concurrently, staggered in time, until the first succeeds.
+
+    An attempt succeeds by returning something other than :data:`None`.
+    The next attempt is started ``delay`` seconds after the previous one or
+    as soon as a running attempt fails, whichever comes first.
+    Once an attempt succeeded, all other attempts are cancelled.
+    Before that, ``cancel`` is called with the index of each attempt that's
+    still running (e.g., to close its connection).
+    Results of attempts that (also) succeeded but lost the race are passed
+    to ``discard`` (e.g., to close them).
+    An exception raised by any attempt cancels all attempts and is
+    propagated.
+
+    :returns: the index and result of the winning attempt or
+        ``(None, None)`` if all attempts failed.
+    """
+    attempts = list(attempts)
+    if not attempts:
+        return None, None
+    tasks: list[asyncio.Future[_T | None]] = []
+    winner: int | None = None
+    try:
+        pending: set[asyncio.Future[_T | None]] = set()
+        while True:
+            if len(tasks) < len(attempts):
+                new_task = asyncio.ensure_future(attempts[len(tasks)]())
+                tasks.append(new_task)
+                pending.add(new_task)
+            timeout = delay if len(tasks) < len(attempts) else None
+            done, pending = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            for index, task in enumerate(tasks):
+                if task not in done:
+                    continue
+                result = task.result()
+                if result is not None:
+                    winner = index
+                    return index, result
+            if not pending and len(tasks) == len(attempts):
+                return None, None
+    finally:
+        losers = {
+            index: task for index, task in enumerate(tasks) if not task.done()
+        }
+        for index, loser in losers.items():
+            if cancel is not None:
+                cancel(index)
+            loser.cancel()
+        if losers:
+            await asyncio.wait(losers.values())
+        for index, task in enumerate(tasks):
+            if index == winner or task.cancelled():
+                continue
+            if discard is None or task.exception() is not None:
+                continue
+            lost_result = task.result()
+            if lost_result is not None:
+                await discard(lost_result)
+
+
+def staggered_race(
+    attempts: t.Iterable[t.Callable[[], _T | None]],
+    delay: float,
+    discard: t.Callable[[_T], None] | None = None,
+    cancel: t.Callable[[int], None] | None = None,
+) -> tuple[int | None, _T | None]:
+    """
+    Run attempts concurrently, staggered in time, until the first succeeds.
+
+    An attempt succeeds by returning something other than :data:`None`.
+    The next attempt is started (in a new thread) ``delay`` seconds after the
+    previous one or as soon as a running attempt fails, whichever comes
+    first.
+    Threads can't be cancelled: once the race is decided, ``cancel`` is
+    called with the index of each attempt that's still running (e.g., to
+    close its connection so that it fails promptly). Then, all threads are
+    joined. Without ``cancel``, attempts still running are left to finish
+    in the background (in daemon threads).
+    Results of attempts that (also) succeeded but lost the race are passed
+    to ``discard`` (e.g., to close them).
+    An exception raised by any attempt ends the race and is propagated.
+
+    :returns: the index and result of the winning attempt or
+        ``(None, None)`` if all attempts failed.
+    """
+    attempts = list(attempts)
+    cond = threading.Condition()
+    outcomes: dict[int, tuple[_T | None, BaseException | None]] = {}
+    threads: list[threading.Thread] = []
+    decided = False
+
+    def run(index: int) -> None:
+        try:
+            outcome: tuple[_T | None, BaseException | None] = (
+                attempts[index](),
+                None,
+            )
+        except BaseException as exc:
+            outcome = None, exc
+        with cond:
+            late = decided
+            if not late:
+                outcomes[index] = outcome
+                cond.notify_all()
+        if late and outcome[0] is not None and discard is not None:
+            discard(outcome[0])
+
+    handled = 0
+    winner: tuple[int | None, _T | None] = None, None
+    error: BaseException | None = None
+    try:
+        with cond:
+            while winner[0] is None and error is None:
+                if len(threads) < len(attempts):
+                    thread = threading.Thread(
+                        target=run, args=(len(threads),), daemon=cancel is None
+                    )
+                    thread.start()
+                    threads.append(thread)
+                elif handled == len(attempts):
+                    break
+                timeout = delay if len(threads) < len(attempts) else None
+                if len(outcomes) == handled:
+                    cond.wait(timeout)
+                handled = len(outcomes)
+                for index in sorted(outcomes):
+                    result, exc = outcomes[index]
+                    if exc is not None:
+                        error = exc
+                        break
+                    if result is not None:
+                        winner = index, result
+                        break
+    finally:
+        with cond:
+            decided = True
+            running = [
+                index for index in range(len(threads)) if index not in outcomes
+            ]
+            losers = [
+                result
+                for index, (result, _) in outcomes.items()
+                if index != winner[0] and result is not None
+            ]
+        if cancel is not None:
+            for index in running:
+                cancel(index)
+            for thread in threads:
+                thread.join()
+    if discard is not None:
+        for result in losers:
+            discard(result)
+    if error is not None:
+        raise error
+    return winner
+
+
+async def async_bounded_as_completed(
+    calls: t.Iterable[t.Callable[[], t.Awaitable[_T]]],
+    limit: int,
+) -> t.AsyncIterator[tuple[int, _T]]:
+    """
+    Run calls concurrently, at most ``limit`` at a time.
+
+    ``calls`` is consumed lazily: the next call is only taken from it once
+    fewer than ``limit`` calls are running.
+    The index (within ``calls``) and result of each call are yielded as soon
+    as the call completes.
+    An exception raised by any call cancels all running calls and is
+    propagated. Closing the iterator early cancels all running calls as well.
+    """
+    pending = iter(enumerate(calls))
+    running: dict[asyncio.Future, int] = {}
+    try:
+        while True:
+            while len(running) < limit:
+                try:
+                    index, call = next(pending)
+                except StopIteration:
+                    break
+                running[asyncio.ensure_future(call())] = index
+            if not running:
+                return
+            done, _ = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in sorted(done, key=running.__getitem__):
+                index = running.pop(task)
+                yield index, task.result()
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.wait(running)
+        for task in running:
+            # retrieve the exception to avoid "never retrieved" warnings
+            if not task.cancelled():
+                task.exception()
+
+
+def bounded_as_completed(
+    calls: t.Iterable[t.Callable[[], _T]],
+    limit: int,
+) -> t.Iterator[tuple[int, _T]]:
+    """
+    Run calls concurrently (in worker threads), at most ``limit`` at a time.
+
+    ``calls`` is consumed lazily: the next call is only taken from it once
+    fewer than ``limit`` calls are running.
+    The index (within ``calls``) and result of each call are yielded as soon
+    as the call completes.
+    An exception raised by any call stops starting new calls and is
+    propagated. Threads can't be cancelled: calls still running at that
+    point (or when the iterator is closed early) are waited for.
+    """
+    pending = iter(enumerate(calls))
+    running: dict[concurrent.futures.Future, int] = {}
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=limit, thread_name_prefix="neo4j-bounded"
+    ) as executor:
+        while True:
+            while len(running) < limit:
+                try:
+                    index, call = next(pending)
+                except StopIteration:
+                    break
+                running[executor.submit(call)] = index
+            if not running:
+                return
+            done, _ = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in sorted(done, key=running.__getitem__):
+                index = running.pop(future)
+                yield index, future.result()
+
+
 Condition: te.TypeAlias = threading.Condition
 CooperativeLock: te.TypeAlias = threading.Lock
 Lock: te.TypeAlias = threading.Lock
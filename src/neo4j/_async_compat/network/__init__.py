@@ -20,7 +20,10 @@ from ._bolt_socket import (
 )
 from ._util import (
     AsyncNetworkUtil,
+    DnsCache,
     NetworkUtil,
+    SocketOptions,
+    TlsSessionCache,
 )
 
 
@@ -28,5 +31,8 @@ __all__ = [
     "AsyncBoltSocket",
     "AsyncNetworkUtil",
     "BoltSocket",
+    "DnsCache",
     "NetworkUtil",
+    "SocketOptions",
+    "TlsSessionCache",
 ]
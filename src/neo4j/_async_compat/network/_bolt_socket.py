@@ -21,6 +21,11 @@ import logging
 import struct
 import typing as t
 from contextlib import suppress
+from functools import partial
+from itertools import (
+    chain,
+    zip_longest,
+)
 
 
 # fmt: off
@@ -56,10 +61,15 @@ from ...exceptions import (
     DriverError,
     ServiceUnavailable,
 )
+from ..concurrency import (
+    async_staggered_race,
+    staggered_race,
+)
 from ..shims import wait_for
 from ._util import (
     AsyncNetworkUtil,
     NetworkUtil,
+    SocketOptions,
 )
 
 
@@ -73,6 +83,29 @@ if t.TYPE_CHECKING:
 log = logging.getLogger("neo4j.io")
 
 
+# Delay before starting a connection attempt to the next address a host
+# resolved to while the previous attempts are still pending
+# (RFC 8305, "Connection Attempt Delay").
+_CONNECTION_ATTEMPT_DELAY = 0.25
+
+
+def _interleave_address_families(resolved_addresses):
+    # RFC 8305, section 4: alternate between address families (IPv6 and
+    # IPv4), starting with the family of the first (most preferred) address.
+    by_family = {}
+    for resolved_address in resolved_addresses:
+        by_family.setdefault(len(resolved_address), []).append(
+            resolved_address
+        )
+    return [
+        resolved_address
+        for resolved_address in chain.from_iterable(
+            zip_longest(*by_family.values())
+        )
+        if resolved_address is not None
+    ]
+
+
 def _sanitize_deadline(deadline):
     if deadline is None:
         return None
@@ -82,6 +115,28 @@ def _sanitize_deadline(deadline):
     return deadline
 
 
+class _SessionResumingSSLContext:
+    """
+    Proxy for an SSL context that resumes a given TLS session.
+
+    asyncio offers no way to pass the session to resume when opening a
+    connection, so it's injected when the SSL object gets created.
+    """
+
+    def __init__(self, ssl_context, session):
+        self._ssl_context = ssl_context
+        self._session = session
+
+    def __getattr__(self, name):
+        return getattr(self._ssl_context, name)
+
+    def wrap_bio(self, incoming, outgoing, server_side=False, **kwargs):
+        kwargs.setdefault("session", self._session)
+        return self._ssl_context.wrap_bio(
+            incoming, outgoing, server_side=server_side, **kwargs
+        )
+
+
 class AsyncBoltSocket:
     Bolt: te.Final[type[AsyncBolt]] = None  # type: ignore[assignment]
 
@@ -138,6 +193,12 @@ class AsyncBoltSocket:
     def getpeername(self):
         return self._writer.transport.get_extra_info("peername")
 
+    def _tls_session(self):
+        ssl_object = self._writer.transport.get_extra_info("ssl_object")
+        if ssl_object is None:
+            return None
+        return ssl_object.session
+
     def getpeercert(self, *args, **kwargs):
         return self._writer.transport.get_extra_info("ssl_object").getpeercert(
             *args, **kwargs
@@ -177,7 +238,15 @@ class AsyncBoltSocket:
         self._writer.close()
 
     @classmethod
-    async def _connect_secure(cls, resolved_address, timeout, keep_alive, ssl):
+    async def _connect_secure(
+        cls,
+        resolved_address,
+        timeout,
+        keep_alive,
+        ssl,
+        tls_session=None,
+        socket_options=None,
+    ):
         """
         Connect to the address and return the socket.
 
@@ -185,9 +254,13 @@ class AsyncBoltSocket:
         :param timeout: seconds
         :param keep_alive: True or False
         :param ssl: SSLContext or None
+        :param tls_session: SSLSession to try to resume or None
+        :param socket_options: SocketOptions or None for the defaults
 
         :returns: AsyncBoltSocket object
         """
+        if socket_options is None:
+            socket_options = SocketOptions()
         loop = asyncio.get_event_loop()
         s = None
 
@@ -200,6 +273,7 @@ class AsyncBoltSocket:
             else:
                 raise ValueError(f"Unsupported address {resolved_address!r}")
             s.setblocking(False)  # asyncio + blocking = no-no!
+            socket_options.apply(s)
             log.debug("[#0000]  C: <OPEN> %s", resolved_address)
             await wait_for(loop.sock_connect(s, resolved_address), timeout)
 
@@ -210,25 +284,42 @@ class AsyncBoltSocket:
 
             if ssl is not None:
                 hostname = resolved_address._host_name or None
+                ssl_arg = ssl
+                # Only asyncio's own loops are known to create the SSL
+                # object through the context's `wrap_bio`.
+                if tls_session is not None and isinstance(
+                    loop, asyncio.BaseEventLoop
+                ):
+                    ssl_arg = _SessionResumingSSLContext(ssl, tls_session)
                 ssl_kwargs.update(
-                    ssl=ssl, server_hostname=hostname if HAS_SNI else None
+                    ssl=ssl_arg,
+                    server_hostname=hostname if HAS_SNI else None,
                 )
 
             reader = asyncio.StreamReader(
-                limit=2**16,  # 64 KiB,
+                limit=socket_options.reader_limit,
                 loop=loop,
             )
             protocol = asyncio.StreamReaderProtocol(reader, loop=loop)
             transport, _ = await loop.create_connection(
                 lambda: protocol, sock=s, **ssl_kwargs
             )
+            # asyncio's transports enable TCP_NODELAY on their own
+            socket_options.apply_no_delay(s)
             writer = asyncio.StreamWriter(transport, protocol, reader, loop)
 
             if ssl is not None:
+                ssl_object = transport.get_extra_info("ssl_object")
+                if tls_session is not None:
+                    log.debug(
+                        "[#%04X]  C: <SECURE> TLS session resumed: %s",
+                        s.getsockname()[1],
+                        ssl_object.session_reused,
+                    )
                 # Check that the server provides a certificate
-                der_encoded_server_certificate = transport.get_extra_info(
-                    "ssl_object"
-                ).getpeercert(binary_form=True)
+                der_encoded_server_certificate = ssl_object.getpeercert(
+                    binary_form=True
+                )
                 if der_encoded_server_certificate is None:
                     local_port = s.getsockname()[1]
                     raise BoltProtocolError(
@@ -386,35 +477,70 @@ class AsyncBoltSocket:
         custom_resolver,
         ssl_context,
         keep_alive,
+        dns_cache=None,
+        tls_session_cache=None,
+        socket_options=None,
     ):
         """
         Connect and perform a handshake.
 
         Return a valid Connection object, assuming a protocol version can be
         agreed.
+
+        Resolved addresses that can't be connected to are dropped from the
+        ``dns_cache`` (if given).
+        If a ``tls_session_cache`` is given, encrypted connections try to
+        resume the TLS session of the last connection to the same address.
+        ``socket_options`` are applied to the socket of each attempt.
         """
+        if ssl_context is None:
+            tls_session_cache = None
         errors = []
         failed_addresses = []
         # Establish a connection to the host and port specified
         # Catches refused connections see:
         # https://docs.python.org/2/library/errno.html
 
-        resolved_addresses = AsyncNetworkUtil.resolve_address(
-            addressing.Address(address), resolver=custom_resolver
+        resolved_addresses = _interleave_address_families(
+            [
+                resolved_address
+                async for resolved_address in AsyncNetworkUtil.resolve_address(
+                    addressing.Address(address),
+                    resolver=custom_resolver,
+                    cache=dns_cache,
+                )
+            ]
         )
-        async for resolved_address in resolved_addresses:
+
+        async def attempt(resolved_address):
+            attempt_timeout = tcp_timeout
             deadline_timeout = deadline.to_timeout()
             if (
                 deadline_timeout is not None
-                and deadline_timeout <= tcp_timeout
+                and deadline_timeout <= attempt_timeout
             ):
-                tcp_timeout = deadline_timeout
+                attempt_timeout = deadline_timeout
+            tls_session = None
+            if tls_session_cache is not None:
+                tls_session = tls_session_cache.get(
+                    resolved_address, ssl_context
+                )
             s = None
             try:
                 s = await cls._connect_secure(
-                    resolved_address, tcp_timeout, keep_alive, ssl_context
+                    resolved_address,
+                    attempt_timeout,
+                    keep_alive,
+                    ssl_context,
+                    tls_session=tls_session,
+                    socket_options=socket_options,
                 )
-                return await s._handshake(resolved_address, deadline)
+                result = await s._handshake(resolved_address, deadline)
+                if tls_session_cache is not None:
+                    tls_session_cache.put(
+                        resolved_address, ssl_context, s._tls_session()
+                    )
+                return result
             except (BoltError, DriverError, OSError) as error:
                 try:
                     local_port = s.getsockname()[1]
@@ -431,8 +557,13 @@ class AsyncBoltSocket:
                 )
                 if s:
                     await cls.close_socket(s)
+                if dns_cache is not None:
+                    dns_cache.invalidate(resolved_address)
+                if tls_session_cache is not None:
+                    tls_session_cache.invalidate(resolved_address)
                 errors.append(error)
                 failed_addresses.append(resolved_address)
+                return None
             except asyncio.CancelledError:
                 try:
                     local_port = s.getsockname()[1]
@@ -449,6 +580,26 @@ class AsyncBoltSocket:
                 if s:
                     await cls.close_socket(s)
                 raise
+
+        async def discard(handshake_result):
+            # lost the race: close the fully established connection
+            await cls.close_socket(handshake_result[0])
+
+        if len(resolved_addresses) == 1:
+            result = await attempt(resolved_addresses[0])
+        else:
+            # Happy Eyeballs (RFC 8305): staggered concurrent connection
+            # attempts, the first successful handshake wins.
+            _, result = await async_staggered_race(
+                (
+                    partial(attempt, resolved_address)
+                    for resolved_address in resolved_addresses
+                ),
+                _CONNECTION_ATTEMPT_DELAY,
+                discard=discard,
+            )
+        if result is not None:
+            return result
         address_strs = tuple(map(str, failed_addresses))
         if not errors:
             raise ServiceUnavailable(
@@ -527,18 +678,25 @@ class BoltSocket:
         self.close_socket(self._socket)
 
     def kill(self):
-        self._socket.close()
+        # Shutting down wakes up threads blocked on the socket (e.g., losers
+        # of a hedged routing table fetch), closing alone doesn't.
+        self._kill_raw_socket(self._socket)
 
     @classmethod
-    def _connect(cls, resolved_address, timeout, keep_alive):
+    def _connect(
+        cls, resolved_address, timeout, keep_alive, socket_options=None
+    ):
         """
         Connect to the address and return the socket.
 
         :param resolved_address:
         :param timeout: seconds
         :param keep_alive: True or False
+        :param socket_options: SocketOptions or None for the defaults
         :returns: socket object
         """
+        if socket_options is None:
+            socket_options = SocketOptions()
         s = None  # The socket
 
         try:
@@ -548,6 +706,7 @@ class BoltSocket:
                 s = socket(AF_INET6)
             else:
                 raise ValueError(f"Unsupported address {resolved_address!r}")
+            socket_options.apply(s)
             t = s.gettimeout()
             if timeout:
                 s.settimeout(timeout)
@@ -581,14 +740,16 @@ class BoltSocket:
             raise
 
     @classmethod
-    def _secure(cls, s, host, ssl_context):
+    def _secure(cls, s, host, ssl_context, session=None):
         local_port = s.getsockname()[1]
         # Secure the connection if an SSL context has been provided
         if ssl_context:
             log.debug("[#%04X]  C: <SECURE> %s", local_port, host)
             try:
                 sni_host = host if HAS_SNI and host else None
-                s = ssl_context.wrap_socket(s, server_hostname=sni_host)
+                s = ssl_context.wrap_socket(
+                    s, server_hostname=sni_host, session=session
+                )
             except (OSError, SSLError, CertificateError) as cause:
                 cls._kill_raw_socket(s)
                 raise BoltSecurityError(
@@ -603,6 +764,12 @@ class BoltSocket:
                     "provide a certificate",
                     address=(host, local_port),
                 )
+            if session is not None:
+                log.debug(
+                    "[#%04X]  C: <SECURE> TLS session resumed: %s",
+                    local_port,
+                    s.session_reused,
+                )
             return s
         return s
 
@@ -714,37 +881,72 @@ class BoltSocket:
         custom_resolver,
         ssl_context,
         keep_alive,
+        dns_cache=None,
+        tls_session_cache=None,
+        socket_options=None,
     ):
         """
         Connect and perform a handshake.
 
         Return a valid Connection object, assuming a protocol version can be
         agreed.
+
+        Resolved addresses that can't be connected to are dropped from the
+        ``dns_cache`` (if given).
+        If a ``tls_session_cache`` is given, encrypted connections try to
+        resume the TLS session of the last connection to the same address.
+        ``socket_options`` are applied to the socket of each attempt.
         """
+        if ssl_context is None:
+            tls_session_cache = None
         errors = []
         # Establish a connection to the host and port specified
         # Catches refused connections see:
         # https://docs.python.org/2/library/errno.html
 
-        resolved_addresses = NetworkUtil.resolve_address(
-            addressing.Address(address), resolver=custom_resolver
+        resolved_addresses = _interleave_address_families(
+            list(
+                NetworkUtil.resolve_address(
+                    addressing.Address(address),
+                    resolver=custom_resolver,
+                    cache=dns_cache,
+                )
+            )
         )
-        for resolved_address in resolved_addresses:
+
+        def attempt(resolved_address):
+            attempt_timeout = tcp_timeout
             deadline_timeout = deadline.to_timeout()
             if (
                 deadline_timeout is not None
-                and deadline_timeout <= tcp_timeout
+                and deadline_timeout <= attempt_timeout
             ):
-                tcp_timeout = deadline_timeout
+                attempt_timeout = deadline_timeout
+            tls_session = None
+            if tls_session_cache is not None:
+                tls_session = tls_session_cache.get(
+                    resolved_address, ssl_context
+                )
             s = None
             try:
                 s = BoltSocket._connect(
-                    resolved_address, tcp_timeout, keep_alive
+                    resolved_address,
+                    attempt_timeout,
+                    keep_alive,
+                    socket_options=socket_options,
                 )
                 s = BoltSocket._secure(
-                    s, resolved_address._host_name, ssl_context
+                    s,
+                    resolved_address._host_name,
+                    ssl_context,
+                    session=tls_session,
                 )
-                return BoltSocket._handshake(s, resolved_address, deadline)
+                result = BoltSocket._handshake(s, resolved_address, deadline)
+                if tls_session_cache is not None:
+                    tls_session_cache.put(
+                        resolved_address, ssl_context, s.session
+                    )
+                return result
             except (BoltError, DriverError, OSError) as error:
                 try:
                     local_port = s.getsockname()[1]
@@ -758,11 +960,36 @@ class BoltSocket:
                 )
                 if s:
                     cls.close_socket(s)
+                if dns_cache is not None:
+                    dns_cache.invalidate(resolved_address)
+                if tls_session_cache is not None:
+                    tls_session_cache.invalidate(resolved_address)
                 errors.append(error)
+                return None
             except Exception:
                 if s:
                     cls.close_socket(s)
                 raise
+
+        def discard(handshake_result):
+            # lost the race: close the fully established connection
+            cls.close_socket(handshake_result[0])
+
+        if len(resolved_addresses) == 1:
+            result = attempt(resolved_addresses[0])
+        else:
+            # Happy Eyeballs (RFC 8305): staggered concurrent connection
+            # attempts, the first successful handshake wins.
+            _, result = staggered_race(
+                (
+                    partial(attempt, resolved_address)
+                    for resolved_address in resolved_addresses
+                ),
+                _CONNECTION_ATTEMPT_DELAY,
+                discard=discard,
+            )
+        if result is not None:
+            return result
         if not errors:
             resolved_address_strs = tuple(map(str, resolved_addresses))
             raise ServiceUnavailable(
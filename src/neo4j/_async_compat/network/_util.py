@@ -17,6 +17,8 @@
 import asyncio
 import logging
 import socket
+import threading
+from time import monotonic
 
 from ... import addressing
 from ..util import AsyncUtil
@@ -37,6 +39,288 @@ def _resolved_addresses_from_info(info, host_name):
             yield addressing.ResolvedAddress(addr, host_name=host_name)
 
 
+class _Resolution:
+    # A DNS resolution in progress (see DnsCache.resolve).
+    def __init__(self):
+        self.done = threading.Event()
+        # (resolved, error) or None if the resolution was abandoned
+        self.outcome = None
+
+
+class DnsCache:
+    """
+    Cache for DNS resolution results.
+
+    Entries expire after ``ttl`` seconds. They are dropped early when
+    connecting to one of the cached addresses failed (see
+    :meth:`invalidate`).
+    Custom resolver functions are not cached, only the DNS resolution of the
+    addresses they return.
+    Concurrent misses for the same address and family are merged: only one
+    caller resolves the address, the others wait for its outcome (see
+    :meth:`resolve` and :meth:`async_resolve`).
+
+    This class is thread-safe.
+    """
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._entries = {}
+        self._resolutions = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(address, family):
+        return tuple(address), family
+
+    def _get(self, key):
+        # must be called with the lock held
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, resolved = entry
+        if expires_at <= monotonic():
+            del self._entries[key]
+            return None
+        return list(resolved)
+
+    def get(self, address, family=0):
+        """Get the cached resolution of address or None if there is none."""
+        key = self._key(address, family)
+        with self._lock:
+            return self._get(key)
+
+    def _put(self, key, resolved):
+        # must be called with the lock held
+        if resolved:
+            self._entries[key] = monotonic() + self.ttl, tuple(resolved)
+
+    def put(self, address, family, resolved):
+        key = self._key(address, family)
+        with self._lock:
+            self._put(key, resolved)
+
+    def _join(self, key, new_resolution):
+        # Get the cached resolution or the resolution in progress to wait
+        # for. If there is neither, start a new resolution that the caller
+        # is responsible for (indicated by the last return value).
+        with self._lock:
+            resolved = self._get(key)
+            if resolved is not None:
+                return resolved, None, False
+            resolution = self._resolutions.get(key)
+            if resolution is not None:
+                return None, resolution, False
+            resolution = self._resolutions[key] = new_resolution()
+            return None, resolution, True
+
+    def _finish(self, key, outcome):
+        with self._lock:
+            del self._resolutions[key]
+            if outcome is not None and outcome[1] is None:
+                self._put(key, outcome[0])
+
+    def resolve(self, address, family, resolver):
+        """
+        Get the cached resolution of address or resolve it.
+
+        :param address: the address to resolve
+        :param family: the address family
+        :param resolver: function that resolves the address (returning a
+            list of resolved addresses). It's only called if neither a cached
+            result nor another thread resolving the same address is found.
+
+        :returns: the list of resolved addresses
+        """
+        key = self._key(address, family)
+        while True:
+            resolved, resolution, own = self._join(key, _Resolution)
+            if resolved is not None:
+                log.debug("[#0000]  _: <RESOLVE> dns cache hit: %s", address)
+                return resolved
+            if own:
+                break
+            resolution.done.wait()
+            if resolution.outcome is None:
+                continue  # abandoned => try again
+            resolved, error = resolution.outcome
+            if error is not None:
+                raise error
+            return list(resolved)
+        outcome = None
+        try:
+            resolved = resolver()
+            outcome = resolved, None
+            return resolved
+        except Exception as exc:
+            outcome = None, exc
+            raise
+        finally:
+            self._finish(key, outcome)
+            resolution.outcome = outcome
+            resolution.done.set()
+
+    async def async_resolve(self, address, family, resolver):
+        """
+        Get the cached resolution of address or resolve it.
+
+        Async version of :meth:`resolve`. ``resolver`` is a coroutine
+        function. Only tasks of one event loop may share a cache.
+        """
+        key = self._key(address, family)
+        loop = asyncio.get_running_loop()
+        while True:
+            resolved, resolution, own = self._join(key, loop.create_future)
+            if resolved is not None:
+                log.debug("[#0000]  _: <RESOLVE> dns cache hit: %s", address)
+                return resolved
+            if own:
+                break
+            # Don't await the future directly: being cancelled mustn't
+            # cancel the resolution for the others.
+            await asyncio.wait((resolution,))
+            outcome = resolution.result()
+            if outcome is None:
+                continue  # abandoned => try again
+            resolved, error = outcome
+            if error is not None:
+                raise error
+            return list(resolved)
+        outcome = None
+        try:
+            resolved = await resolver()
+            outcome = resolved, None
+            return resolved
+        except Exception as exc:
+            outcome = None, exc
+            raise
+        finally:
+            self._finish(key, outcome)
+            resolution.set_result(outcome)
+
+    def invalidate(self, resolved_address):
+        """Drop all entries that resolved to the given address."""
+        with self._lock:
+            for key, (_, resolved) in list(self._entries.items()):
+                if resolved_address in resolved:
+                    del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class TlsSessionCache:
+    """
+    Cache for TLS sessions to resume them when opening new connections.
+
+    One session is kept per server address. A session can only be resumed
+    with the SSL context that established it, so the context is stored
+    alongside and sessions of other contexts are ignored.
+
+    This class is thread-safe.
+    """
+
+    def __init__(self):
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(resolved_address):
+        return resolved_address._host_name, tuple(resolved_address)
+
+    def get(self, resolved_address, ssl_context):
+        """Get the session to resume or None if there is none."""
+        with self._lock:
+            entry = self._sessions.get(self._key(resolved_address))
+        if entry is None or entry[0] is not ssl_context:
+            return None
+        return entry[1]
+
+    def put(self, resolved_address, ssl_context, session):
+        if session is None:
+            return
+        with self._lock:
+            self._sessions[self._key(resolved_address)] = ssl_context, session
+
+    def invalidate(self, resolved_address):
+        with self._lock:
+            self._sessions.pop(self._key(resolved_address), None)
+
+    def clear(self):
+        with self._lock:
+            self._sessions.clear()
+
+
+class SocketOptions:
+    """
+    Options applied to the sockets of new connections.
+
+    Options set to None are left at the operating system's default.
+    Options not supported by the platform are skipped.
+    """
+
+    def __init__(
+        self,
+        tcp_no_delay=True,
+        receive_buffer_size=None,
+        send_buffer_size=None,
+        tcp_user_timeout=None,
+        keep_alive_interval=None,
+        reader_limit=2**16,  # 64 KiB
+    ):
+        self.tcp_no_delay = tcp_no_delay
+        self.receive_buffer_size = receive_buffer_size
+        self.send_buffer_size = send_buffer_size
+        self.tcp_user_timeout = tcp_user_timeout
+        self.keep_alive_interval = keep_alive_interval
+        self.reader_limit = reader_limit
+
+    def _socket_options(self):
+        no_delay = 1 if self.tcp_no_delay else 0
+        yield socket.IPPROTO_TCP, socket.TCP_NODELAY, no_delay
+        if self.receive_buffer_size is not None:
+            yield socket.SOL_SOCKET, socket.SO_RCVBUF, self.receive_buffer_size
+        if self.send_buffer_size is not None:
+            yield socket.SOL_SOCKET, socket.SO_SNDBUF, self.send_buffer_size
+        user_timeout_option = getattr(socket, "TCP_USER_TIMEOUT", None)
+        if self.tcp_user_timeout is not None and user_timeout_option:
+            # milliseconds
+            user_timeout = int(self.tcp_user_timeout * 1000)
+            yield socket.IPPROTO_TCP, user_timeout_option, user_timeout
+        if self.keep_alive_interval is not None:
+            interval = max(1, int(self.keep_alive_interval))
+            # macOS calls the idle time option TCP_KEEPALIVE
+            for name in ("TCP_KEEPIDLE", "TCP_KEEPALIVE", "TCP_KEEPINTVL"):
+                option = getattr(socket, name, None)
+                if option is not None:
+                    yield socket.IPPROTO_TCP, option, interval
+
+    @staticmethod
+    def _set_option(s, level, option, value):
+        try:
+            s.setsockopt(level, option, value)
+        except OSError as exc:
+            log.debug(
+                "[#0000]  _: <SOCKET> failed to set option %r: %r",
+                option,
+                exc,
+            )
+
+    def apply(self, s):
+        """Apply the options to the (not yet connected) socket ``s``."""
+        for level, option, value in self._socket_options():
+            self._set_option(s, level, option, value)
+
+    def apply_no_delay(self, s):
+        self._set_option(
+            s,
+            socket.IPPROTO_TCP,
+            socket.TCP_NODELAY,
+            1 if self.tcp_no_delay else 0,
+        )
+
+
 class AsyncNetworkUtil:
     @staticmethod
     async def get_address_info(
@@ -48,7 +332,7 @@ class AsyncNetworkUtil:
         )
 
     @staticmethod
-    async def _dns_resolver(address, family=0):
+    async def _dns_resolver(address, family=0, cache=None):
         """
         Apply regular DNS resolution.
 
@@ -56,21 +340,31 @@ class AsyncNetworkUtil:
 
         :param address:
         :param family:
+        :param cache: optional :class:`DnsCache` to serve results from and
+            to store results in
         :returns:
         """
-        try:
-            info = await AsyncNetworkUtil.get_address_info(
-                address.host,
-                address.port,
-                family=family,
-                type=socket.SOCK_STREAM,
+
+        async def resolve():
+            try:
+                info = await AsyncNetworkUtil.get_address_info(
+                    address.host,
+                    address.port,
+                    family=family,
+                    type=socket.SOCK_STREAM,
+                )
+            except OSError as e:
+                raise ValueError(f"Cannot resolve address {address}") from e
+            return list(
+                _resolved_addresses_from_info(info, address._host_name)
             )
-        except OSError as e:
-            raise ValueError(f"Cannot resolve address {address}") from e
-        return list(_resolved_addresses_from_info(info, address._host_name))
+
+        if cache is None:
+            return await resolve()
+        return await cache.async_resolve(address, family, resolve)
 
     @staticmethod
-    async def resolve_address(address, family=0, resolver=None):
+    async def resolve_address(address, family=0, resolver=None, cache=None):
         """
         Carry out domain name resolution on this Address object.
 
@@ -88,6 +382,8 @@ class AsyncNetworkUtil:
                        addresses by (e.g. `socket.AF_INET6`)
         :param resolver: optional customer resolver function to be
                          called before regular DNS resolution
+        :param cache: optional :class:`DnsCache` for the regular DNS
+                      resolution
         """
         if isinstance(address, addressing.ResolvedAddress):
             yield address
@@ -105,7 +401,7 @@ class AsyncNetworkUtil:
                     address_resolved,
                 )
                 addresses_dns_resolved = await AsyncNetworkUtil._dns_resolver(
-                    address_resolved, family=family
+                    address_resolved, family=family, cache=cache
                 )
                 for address_dns_resolved in addresses_dns_resolved:
                     log.debug(
@@ -115,7 +411,7 @@ class AsyncNetworkUtil:
                     yield address_dns_resolved
         else:
             for address_dns_resolved in await AsyncNetworkUtil._dns_resolver(
-                address, family=family
+                address, family=family, cache=cache
             ):
                 log.debug(
                     "[#0000]  _: <RESOLVE> dns resolver out: %s",
@@ -130,7 +426,7 @@ class NetworkUtil:
         return socket.getaddrinfo(host, port, family, type, proto, flags)
 
     @staticmethod
-    def _dns_resolver(address, family=0):
+    def _dns_resolver(address, family=0, cache=None):
         """
         Apply regular DNS resolution.
 
@@ -138,21 +434,31 @@ class NetworkUtil:
 
         :param address:
         :param family:
+        :param cache: optional :class:`DnsCache` to serve results from and
+            to store results in
         :returns:
         """
-        try:
-            info = NetworkUtil.get_address_info(
-                address.host,
-                address.port,
-                family=family,
-                type=socket.SOCK_STREAM,
+
+        def resolve():
+            try:
+                info = NetworkUtil.get_address_info(
+                    address.host,
+                    address.port,
+                    family=family,
+                    type=socket.SOCK_STREAM,
+                )
+            except OSError as e:
+                raise ValueError(f"Cannot resolve address {address}") from e
+            return list(
+                _resolved_addresses_from_info(info, address._host_name)
             )
-        except OSError as e:
-            raise ValueError(f"Cannot resolve address {address}") from e
-        return _resolved_addresses_from_info(info, address._host_name)
+
+        if cache is None:
+            return resolve()
+        return cache.resolve(address, family, resolve)
 
     @staticmethod
-    def resolve_address(address, family=0, resolver=None):
+    def resolve_address(address, family=0, resolver=None, cache=None):
         """
         Carry out domain name resolution on this Address object.
 
@@ -170,6 +476,8 @@ class NetworkUtil:
                        addresses by (e.g. `socket.AF_INET6`)
         :param resolver: optional customer resolver function to be
                          called before regular DNS resolution
+        :param cache: optional :class:`DnsCache` for the regular DNS
+                      resolution
         """
         if isinstance(address, addressing.ResolvedAddress):
             yield address
@@ -184,7 +492,7 @@ class NetworkUtil:
                     address_resolved,
                 )
                 addresses_dns_resolved = NetworkUtil._dns_resolver(
-                    address_resolved, family=family
+                    address_resolved, family=family, cache=cache
                 )
                 for address_dns_resolved in addresses_dns_resolved:
                     log.debug(
@@ -194,7 +502,7 @@ class NetworkUtil:
                     yield address_dns_resolved
         else:
             for address_dns_resolved in NetworkUtil._dns_resolver(
-                address, family=family
+                address, family=family, cache=cache
             ):
                 log.debug(
                     "[#0000]  _: <RESOLVE> dns resolver out: %s",
@@ -133,22 +133,26 @@ class _GraphHydrator(GraphHydrator):
         assert len(nodes) >= 1
         assert len(sequence) % 2 == 0
         last_node = nodes[0]
-        entities = [last_node]
-        for i, rel_index in enumerate(sequence[::2]):
+        path_nodes = [last_node]
+        path_relationships = []
+        for i in range(0, len(sequence), 2):
+            rel_index = sequence[i]
             assert rel_index != 0
-            next_node = nodes[sequence[2 * i + 1]]
+            next_node = nodes[sequence[i + 1]]
             if rel_index > 0:
                 r = relationships[rel_index - 1]
                 r._start_node = last_node
                 r._end_node = next_node
-                entities.append(r)
             else:
                 r = relationships[-rel_index - 1]
                 r._start_node = next_node
                 r._end_node = last_node
-                entities.append(r)
+            path_nodes.append(next_node)
+            path_relationships.append(r)
             last_node = next_node
-        return Path(*entities)
+        return Path._from_hydration(
+            tuple(path_nodes), tuple(path_relationships)
+        )
 
 
 class HydrationHandler(HydrationHandlerABC):
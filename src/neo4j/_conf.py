@@ -330,6 +330,12 @@ class Config(Mapping, metaclass=ConfigType):
                 self.__update(arg)
         self.__update(kwargs)
 
+    def _copy(self):
+        # Shallow copy without going through the validation of __init__.
+        config = self.__class__.__new__(self.__class__)
+        config.__dict__.update(self.__dict__)
+        return config
+
     def __repr__(self):
         attrs = [f" {key}={getattr(self, key)!r}" for key in self]
         return f"<{self.__class__.__name__}{''.join(attrs)}>"
@@ -376,6 +382,11 @@ class WorkspaceConfig(Config):
     #: Retry Delay Jitter Factor
     retry_delay_jitter_factor = 0.2  # seconds
 
+    #: Retry Policy
+    retry_policy = None
+    # Replaces the retry delay settings above if set. The same policy object
+    # is shared by all sessions of a driver to keep a driver-wide retry budget.
+
     #: Database Name
     database = DEFAULT_DATABASE
     # Name of the database to query.
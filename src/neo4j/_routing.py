@@ -113,6 +113,8 @@ class RoutingTable:
         self.writers = OrderedSet(writers)
         self.initialized_without_writers = not self.writers
         self.last_updated_time = monotonic()
+        self.last_used_time = self.last_updated_time
+        self._used_since_update = False
         self.ttl = ttl
         self.database = database
 
@@ -181,6 +183,15 @@ class RoutingTable:
         )
         return should_be_purged
 
+    def mark_used(self):
+        """Record that the routing table was just used to select a server."""
+        self.last_used_time = monotonic()
+        self._used_since_update = True
+
+    def used_since_update(self):
+        """Check if the table was used since it was last updated."""
+        return self._used_since_update
+
     def update(self, new_routing_table):
         """Update the routing table with new routing information."""
         self.routers.replace(new_routing_table.routers)
@@ -188,6 +199,7 @@ class RoutingTable:
         self.writers.replace(new_routing_table.writers)
         self.initialized_without_writers = not self.writers
         self.last_updated_time = monotonic()
+        self._used_since_update = False
         self.ttl = new_routing_table.ttl
         log.debug("[#0000]  _: <ROUTING> updated table=%r", self)
 
@@ -21,6 +21,7 @@ import asyncio
 import typing as t
 from collections import deque
 from logging import getLogger
+from random import random
 from time import monotonic
 
 from ..._async_compat.network import BoltSocket
@@ -141,6 +142,7 @@ class Bolt:
         sock,
         max_connection_lifetime,
         *,
+        max_connection_lifetime_jitter=0.0,
         auth=None,
         auth_manager=None,
         user_agent=None,
@@ -175,6 +177,12 @@ class Bolt:
         )
         self.hydration_handler = self.HYDRATION_HANDLER_CLS()
         self.responses = deque()
+        if max_connection_lifetime > 0 and max_connection_lifetime_jitter:
+            # Shorten the lifetime by a random share of up to the jitter.
+            # Hence, connections opened together don't expire together.
+            max_connection_lifetime *= (
+                1 - max_connection_lifetime_jitter * random()
+            )
         self._max_connection_lifetime = max_connection_lifetime
         self._creation_timestamp = monotonic()
         self.routing_context = routing_context
@@ -407,6 +415,8 @@ class Bolt:
                 custom_resolver=pool_config.resolver,
                 ssl_context=pool_config.get_ssl_context(),
                 keep_alive=pool_config.keep_alive,
+                dns_cache=pool_config.get_dns_cache(),
+                socket_options=pool_config.get_socket_options(),
             )
         except (ServiceUnavailable, SessionExpired, BoltHandshakeError):
             return None
@@ -452,6 +462,9 @@ class Bolt:
             custom_resolver=pool_config.resolver,
             ssl_context=pool_config.get_ssl_context(),
             keep_alive=pool_config.keep_alive,
+            dns_cache=pool_config.get_dns_cache(),
+            tls_session_cache=pool_config.get_tls_session_cache(),
+            socket_options=pool_config.get_socket_options(),
         )
 
         pool_config.protocol_version = protocol_version
@@ -545,6 +558,9 @@ class Bolt:
             address,
             s,
             pool_config.max_connection_lifetime,
+            max_connection_lifetime_jitter=(
+                pool_config.max_connection_lifetime_jitter
+            ),
             auth=auth,
             auth_manager=auth_manager,
             user_agent=pool_config.user_agent,
@@ -881,12 +897,17 @@ class Bolt:
         """
 
     @abc.abstractmethod
-    def reset(self, dehydration_hooks=None, hydration_hooks=None):
+    def reset(
+        self, dehydration_hooks=None, hydration_hooks=None, deferred=False
+    ):
         """
         Submit a RESET (send + consume all).
 
         Append a RESET message to the outgoing queue, sends it and consumes
         all remaining messages.
+        If ``deferred`` is :data:`True`, the RESET is sent without waiting
+        for the response. It's consumed along with the responses to the next
+        messages sent over the connection.
 
         :param dehydration_hooks:
             Hooks to dehydrate types (dict from type (class) to dehydration
@@ -896,6 +917,7 @@ class Bolt:
             Hooks to hydrate types (mapping from type (class) to
             dehydration function). Dehydration functions receive the value of
             type understood by packstream and are free to return anything.
+        :param deferred: don't wait for the response.
         """
 
     @abc.abstractmethod
@@ -1074,10 +1096,14 @@ class Bolt:
             raise SessionExpired(message)
 
     def stale(self):
-        return self._stale or (
+        return self._stale or self.expires_within(0)
+
+    def expires_within(self, seconds):
+        """Check if the connection exceeds its lifetime within ``seconds``."""
+        return (
             0
             <= self._max_connection_lifetime
-            <= monotonic() - self._creation_timestamp
+            <= monotonic() - self._creation_timestamp + seconds
         )
 
     _stale = False
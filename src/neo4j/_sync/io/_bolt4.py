@@ -46,6 +46,7 @@ from ._bolt3 import (
 from ._common import (
     check_supported_server_product,
     CommitResponse,
+    DeferredResetResponse,
     InitResponse,
     ResetResponse,
     Response,
@@ -422,23 +423,27 @@ class Bolt4x0(Bolt):
             dehydration_hooks=dehydration_hooks,
         )
 
-    def reset(self, dehydration_hooks=None, hydration_hooks=None):
+    def reset(
+        self, dehydration_hooks=None, hydration_hooks=None, deferred=False
+    ):
         """
         Reset the connection.
 
         Add a RESET message to the outgoing queue, send it and consume all
-        remaining messages.
+        remaining messages (unless ``deferred``).
         """
         dehydration_hooks, hydration_hooks = self._default_hydration_hooks(
             dehydration_hooks, hydration_hooks
         )
         log.debug("[#%04X]  C: RESET", self.local_port)
-        response = ResetResponse(self, "reset", hydration_hooks)
+        response_cls = DeferredResetResponse if deferred else ResetResponse
+        response = response_cls(self, "reset", hydration_hooks)
         self._append(
             b"\x0f", response=response, dehydration_hooks=dehydration_hooks
         )
         self.send_all()
-        self.fetch_all()
+        if not deferred:
+            self.fetch_all()
 
     def goodbye(self, dehydration_hooks=None, hydration_hooks=None):
         dehydration_hooks, hydration_hooks = self._default_hydration_hooks(
@@ -318,6 +318,18 @@ class ResetResponse(Response):
         self._unexpected_message("IGNORED")
 
 
+class DeferredResetResponse(ResetResponse):
+    # Response to a RESET whose reply is consumed when the pool hands out the
+    # connection again. Failures make the pool drop the connection.
+    def _unexpected_message(self, response):
+        super()._unexpected_message(response)
+        address = self.connection.unresolved_address
+        raise ServiceUnavailable(
+            f"Failed to reset connection {address!r} "
+            f"(RESET received {response})"
+        )
+
+
 class CommitResponse(Response):
     pass
 
@@ -43,7 +43,9 @@ from ...api import (
 from ...exceptions import (
     ClientError,
     DriverError,
+    ForbiddenOnReadOnlyDatabase,
     Neo4jError,
+    NotALeader,
     ServiceUnavailable,
     SessionExpired,
     TransactionError,
@@ -549,6 +551,7 @@ class Session(Workspace):
         metadata = getattr(transaction_function, "metadata", None)
         timeout = getattr(transaction_function, "timeout", None)
 
+        retry_policy = self._config.retry_policy
         retry_delay = retry_delay_generator(
             self._config.initial_retry_delay,
             self._config.retry_delay_multiplier,
@@ -562,6 +565,7 @@ class Session(Workspace):
             telemetry_sent = True
 
         errors = []
+        leader_switch_retried = False
 
         t0: float = -1  # Timer
 
@@ -597,6 +601,8 @@ class Session(Workspace):
                     raise
                 errors.append(error)
             else:
+                if retry_policy is not None:
+                    retry_policy._on_success()
                 return result
             if t0 == -1:
                 # The timer should be started after the first attempt
@@ -604,7 +610,26 @@ class Session(Workspace):
             t1 = monotonic()
             if t1 - t0 > self._config.max_transaction_retry_time:
                 break
-            delay = next(retry_delay)
+            if (
+                not leader_switch_retried
+                and isinstance(
+                    errors[-1], (NotALeader, ForbiddenOnReadOnlyDatabase)
+                )
+                and self._try_refresh_writers()
+            ):
+                # The cluster already elected a new leader: no need to wait.
+                leader_switch_retried = True
+                delay = 0.0
+            elif retry_policy is None:
+                delay = next(retry_delay)
+            else:
+                delay = retry_policy.retry_delay(errors[-1], len(errors))
+                if delay is None:
+                    break
+            if retry_policy is not None and not retry_policy._acquire_retry(
+                delay
+            ):
+                break
             log.warning(
                 "Transaction failed and will be retried in %ss (%s)",
                 delay,
@@ -621,6 +646,17 @@ class Session(Workspace):
         else:
             raise ServiceUnavailable("Transaction failed")
 
+    def _try_refresh_writers(self) -> bool:
+        try:
+            return self._refresh_writers(auth=self._config.auth)
+        except (DriverError, Neo4jError) as exc:
+            log.debug(
+                "[#0000]  _: <SESSION> failed to refresh routing table after "
+                "leader switch: %r",
+                exc,
+            )
+            return False
+
     @NonConcurrentMethodChecker._non_concurrent_method
     def execute_read(
         self,
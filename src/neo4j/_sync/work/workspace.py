@@ -184,6 +184,19 @@ class Workspace(NonConcurrentMethodChecker):
         self._connection = self._pool.acquire(**acquire_kwargs_)
         self._connection_access_mode = access_mode
 
+    def _refresh_writers(self, auth=None):
+        # Update the routing table right away (instead of on the next
+        # connection acquisition) and report whether a writer is known.
+        if not isinstance(self._pool, Neo4jPool):
+            return False
+        return self._pool.refresh_writers(
+            database=self._config.database,
+            imp_user=self._config.impersonated_user,
+            bookmarks=self._get_bookmarks(),
+            auth=AcquireAuth(auth),
+            acquisition_timeout=self._config.connection_acquisition_timeout,
+        )
+
     def _disconnect(self, sync=False):
         if self._connection:
             if sync:
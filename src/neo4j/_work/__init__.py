@@ -19,6 +19,7 @@ from .query import (
     Query,
     unit_of_work,
 )
+from .retry import RetryPolicy
 from .summary import (
     GqlStatusObject,
     NotificationClassification,
@@ -36,6 +37,7 @@ __all__ = [
     "NotificationClassification",
     "Query",
     "ResultSummary",
+    "RetryPolicy",
     "SummaryCounters",
     "SummaryInputPosition",
     "SummaryNotification",
@@ -0,0 +1,109 @@
+# Copyright (c) "Neo4j"
+# Neo4j Sweden AB [https://neo4j.com]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Helpers for splitting rows into batches for bulk writes."""
+
+from __future__ import annotations
+
+import typing as t
+
+
+__all__ = [
+    "DEFAULT_BATCH_BYTES",
+    "batch_rows",
+    "estimate_packed_size",
+]
+
+
+DEFAULT_BATCH_BYTES = 1024 * 1024
+
+# rough size of values the estimation doesn't know about (e.g., temporal and
+# spatial types that are packed as small structures)
+_STRUCTURE_SIZE = 32
+
+
+def _header_size(length: int) -> int:
+    if length < 0x10:
+        return 1
+    if length < 0x100:
+        return 2
+    if length < 0x10000:
+        return 3
+    return 5
+
+
+def estimate_packed_size(value: t.Any) -> int:
+    """
+    Estimate the number of bytes ``value`` takes up when packed.
+
+    The estimation follows PackStream's encoding without actually packing
+    the value. Strings are assumed to be mostly ASCII (one byte per
+    character) to avoid having to encode them.
+    """
+    if value is None or isinstance(value, bool):
+        return 1
+    if isinstance(value, int):
+        if -0x10 <= value < 0x80:
+            return 1
+        if -0x80 <= value < 0x80:
+            return 2
+        if -0x8000 <= value < 0x8000:
+            return 3
+        if -0x80000000 <= value < 0x80000000:
+            return 5
+        return 9
+    if isinstance(value, float):
+        return 9
+    if isinstance(value, str):
+        return _header_size(len(value)) + len(value)
+    if isinstance(value, (bytes, bytearray)):
+        # bytes have no tiny header
+        return max(_header_size(len(value)), 2) + len(value)
+    if isinstance(value, dict):
+        return _header_size(len(value)) + sum(
+            estimate_packed_size(k) + estimate_packed_size(v)
+            for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return _header_size(len(value)) + sum(
+            estimate_packed_size(item) for item in value
+        )
+    return _STRUCTURE_SIZE
+
+
+def batch_rows(
+    rows: t.Iterable[t.Any], max_bytes: int
+) -> t.Iterator[list[t.Any]]:
+    """
+    Split ``rows`` into lists whose estimated packed size fits ``max_bytes``.
+
+    Every batch contains at least one row, even if that row alone exceeds
+    ``max_bytes``.
+    The rows are consumed lazily, so ``rows`` may be an arbitrarily long
+    iterator.
+    """
+    batch: list[t.Any] = []
+    batch_bytes = 0
+    for row in rows:
+        row_bytes = estimate_packed_size(row)
+        if batch and batch_bytes + row_bytes > max_bytes:
+            yield batch
+            batch = []
+            batch_bytes = 0
+        batch.append(row)
+        batch_bytes += row_bytes
+    if batch:
+        yield batch
@@ -0,0 +1,155 @@
+# Copyright (c) "Neo4j"
+# Neo4j Sweden AB [https://neo4j.com]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import annotations
+
+import threading
+from random import random
+
+from .._meta import preview
+from ..exceptions import (
+    DriverError,
+    ForbiddenOnReadOnlyDatabase,
+    NotALeader,
+)
+
+
+__all__ = ["RetryPolicy"]
+
+
+@preview("RetryPolicy is a preview feature.")
+class RetryPolicy:
+    """
+    Policy for retrying transaction functions.
+
+    Configure a driver with a retry policy (see :ref:`retry-policy-ref`) to
+    control how managed transactions (:meth:`.Session.execute_read` etc.
+    and :meth:`.Driver.execute_query`) are retried when they fail with a
+    retryable error.
+
+    The delay before a retry depends on the kind of error:
+
+    * ``leader_switch_delay`` for errors caused by a cluster member no longer
+      (or not yet) being the leader (e.g., during a leader election).
+    * ``connectivity_delay`` for errors caused by the driver losing
+      connectivity to the server (e.g., :exc:`.ServiceUnavailable`).
+    * ``transient_delay`` for all other retryable errors (e.g., deadlocks).
+
+    The delay is multiplied by ``multiplier`` for every failed attempt of
+    the same transaction function and randomized by ``jitter_factor``
+    (``0.2`` means +/- 20 %).
+
+    Further, the policy can limit retries to a fraction of the normal
+    traffic across all sessions of the driver (a token bucket). With
+    ``retry_budget_ratio`` set, every retry costs one token and every
+    successful transaction function earns ``retry_budget_ratio`` tokens.
+    The bucket holds at most ``retry_budget_max_tokens`` tokens and starts
+    full. When it's empty, failing transaction functions are not retried
+    anymore but fail right away. This avoids overloading the cluster with
+    retries when many clients fail at the same time.
+
+    To customize the delays further, override :meth:`retry_delay`.
+
+    The policy keeps count of the retries it has scheduled
+    (:attr:`retry_count`), refused because of the retry budget
+    (:attr:`denied_retry_count`), and of the time spent waiting to
+    retry (:attr:`retry_time`).
+
+    **This is a preview** (see :ref:`filter-warnings-ref`).
+    It might be changed without following the deprecation policy.
+    See also
+    https://github.com/neo4j/neo4j-python-driver/wiki/preview-features
+
+    .. versionadded:: 5.26
+    """
+
+    def __init__(
+        self,
+        *,
+        leader_switch_delay: float = 1.0,
+        connectivity_delay: float = 1.0,
+        transient_delay: float = 0.2,
+        multiplier: float = 2.0,
+        jitter_factor: float = 0.2,
+        retry_budget_ratio: float | None = None,
+        retry_budget_max_tokens: float = 10.0,
+    ) -> None:
+        self.leader_switch_delay = leader_switch_delay
+        self.connectivity_delay = connectivity_delay
+        self.transient_delay = transient_delay
+        self.multiplier = multiplier
+        self.jitter_factor = jitter_factor
+        self.retry_budget_ratio = retry_budget_ratio
+        self.retry_budget_max_tokens = retry_budget_max_tokens
+        self._lock = threading.Lock()
+        self._tokens = retry_budget_max_tokens
+        self._retry_count = 0
+        self._denied_retry_count = 0
+        self._retry_time = 0.0
+
+    def retry_delay(self, error: Exception, attempt: int) -> float | None:
+        """
+        Get the delay before retrying a failed transaction function.
+
+        :param error: the retryable error the last attempt failed with.
+        :param attempt: the number of failed attempts so far (starting at 1).
+
+        :returns: the delay in seconds or :data:`None` to not retry.
+        """
+        if isinstance(error, (NotALeader, ForbiddenOnReadOnlyDatabase)):
+            delay = self.leader_switch_delay
+        elif isinstance(error, DriverError):
+            delay = self.connectivity_delay
+        else:
+            delay = self.transient_delay
+        delay *= self.multiplier ** (attempt - 1)
+        jitter = self.jitter_factor * delay
+        return delay - jitter + (2 * jitter * random())
+
+    @property
+    def retry_count(self) -> int:
+        """How many retries have been made."""
+        return self._retry_count
+
+    @property
+    def denied_retry_count(self) -> int:
+        """How many retries have been refused due to the retry budget."""
+        return self._denied_retry_count
+
+    @property
+    def retry_time(self) -> float:
+        """How many seconds have been spent waiting to retry in total."""
+        return self._retry_time
+
+    def _on_success(self) -> None:
+        if self.retry_budget_ratio is None:
+            return
+        with self._lock:
+            self._tokens = min(
+                self._tokens + self.retry_budget_ratio,
+                self.retry_budget_max_tokens,
+            )
+
+    def _acquire_retry(self, delay: float) -> bool:
+        with self._lock:
+            if self.retry_budget_ratio is not None:
+                if self._tokens < 1:
+                    self._denied_retry_count += 1
+                    return False
+                self._tokens -= 1
+            self._retry_count += 1
+            self._retry_time += delay
+        return True
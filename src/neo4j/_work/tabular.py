@@ -0,0 +1,279 @@
+# Copyright (c) "Neo4j"
+# Neo4j Sweden AB [https://neo4j.com]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Helpers for turning result columns into tabular (columnar) data."""
+
+from __future__ import annotations
+
+import typing as t
+
+from .._data import RecordTableRowExporter
+from ..time import (
+    Date,
+    DateTime,
+    NANO_SECONDS,
+)
+
+
+if t.TYPE_CHECKING:
+    import pandas  # type: ignore[import]
+    import pyarrow  # type: ignore[import]
+
+
+__all__ = [
+    "columns_to_arrow_arrays",
+    "columns_to_df",
+    "date_to_epoch_days",
+    "datetime_to_epoch_ns",
+    "parse_df_dates",
+    "temporal_series_to_pandas",
+]
+
+
+_UNIX_EPOCH_ORDINAL = Date(1970, 1, 1).to_ordinal()
+
+
+def date_to_epoch_days(value: Date) -> int:
+    """Get the number of days between the Unix epoch and ``value``."""
+    return value.to_ordinal() - _UNIX_EPOCH_ORDINAL
+
+
+def datetime_to_epoch_ns(value: DateTime) -> int:
+    """
+    Get the nanoseconds between the Unix epoch and ``value``.
+
+    For values with a time zone, the result is relative to the UTC epoch.
+    For local values, the wall clock time is taken as if it was UTC.
+    """
+    h, m, s, ns = value.hour_minute_second_nanosecond
+    seconds = (value.to_ordinal() - _UNIX_EPOCH_ORDINAL) * 86400
+    seconds += h * 3600 + m * 60 + s
+    offset = value.utcoffset()
+    if offset is not None:
+        seconds -= offset.days * 86400 + offset.seconds
+    return seconds * NANO_SECONDS + ns
+
+
+def _epoch_ns(value: Date | DateTime) -> int:
+    if isinstance(value, DateTime):
+        return datetime_to_epoch_ns(value)
+    return date_to_epoch_days(value) * 86400 * NANO_SECONDS
+
+
+def _tz_key(tz: t.Any) -> str | None:
+    for attr in ("zone", "key"):
+        key = getattr(tz, attr, None)
+        if key and isinstance(key, str):
+            return key
+    return None
+
+
+def _temporal_arrow_array(
+    pa: t.Any, column: t.Sequence[t.Any]
+) -> pyarrow.Array | None:
+    # Returns None if the column is not made up of driver temporal types
+    # (and None) exclusively.
+    has_dates = has_naive = has_aware = False
+    tz_keys = set()
+    for value in column:
+        if value is None:
+            continue
+        if isinstance(value, DateTime):
+            if value.tzinfo is None:
+                has_naive = True
+            else:
+                has_aware = True
+                tz_keys.add(_tz_key(value.tzinfo))
+        elif isinstance(value, Date):
+            has_dates = True
+        else:
+            return None
+    if has_naive and has_aware:
+        return None
+    if has_aware and has_dates:
+        return None
+    if has_naive or has_aware:
+        tz = None
+        if has_aware:
+            tz = tz_keys.pop() if len(tz_keys) == 1 else None
+            tz = tz or "UTC"
+        return pa.array(
+            [None if value is None else _epoch_ns(value) for value in column],
+            type=pa.timestamp("ns", tz=tz),
+        )
+    if has_dates:
+        return pa.array(
+            [
+                None if value is None else date_to_epoch_days(value)
+                for value in column
+            ],
+            type=pa.date32(),
+        )
+    return None
+
+
+def columns_to_arrow_arrays(
+    columns: t.Iterable[t.Sequence[t.Any]],
+) -> list[pyarrow.Array]:
+    """
+    Convert result columns to :class:`pyarrow.Array` objects.
+
+    Columns made up of :class:`.DateTime` (and :data:`None`) become
+    ``timestamp[ns]`` arrays (with ``tz`` set for values with a time zone),
+    columns made up of :class:`.Date` (and :data:`None`) become ``date32``
+    arrays.
+    All other columns are left to pyarrow's type inference.
+
+    :raises ImportError: if `pyarrow` library is not available.
+    """
+    import pyarrow as pa  # type: ignore[import]
+
+    arrays = []
+    for column in columns:
+        array = _temporal_arrow_array(pa, column)
+        if array is None:
+            array = pa.array(column)
+        arrays.append(array)
+    return arrays
+
+
+def temporal_series_to_pandas(series: pandas.Series) -> pandas.Series | None:
+    """
+    Convert a series of :class:`.DateTime`, :class:`.Date`, and :data:`None`.
+
+    The values are converted to epoch nanoseconds and turned into a
+    ``datetime64[ns]`` series in one go.
+    Values with a time zone are supported as long as all values in the
+    series share the same time zone.
+
+    :returns: the converted series or :data:`None` if the series cannot be
+        converted in bulk (mixed local and zoned values, multiple time zones,
+        or values out of the range of ``datetime64[ns]``).
+    """
+    import numpy as np
+    import pandas as pd
+
+    tz = tz_group = None
+    has_local = False
+    for value in series:
+        if value is None:
+            continue
+        if isinstance(value, DateTime) and value.tzinfo is not None:
+            group = _tz_key(value.tzinfo) or value.tzinfo
+            if tz is None:
+                tz, tz_group = value.tzinfo, group
+            elif group != tz_group:
+                return None
+        else:
+            has_local = True
+    if has_local and tz is not None:
+        return None
+
+    nat = pd.NaT.value
+    try:
+        epoch_ns = np.fromiter(
+            (nat if value is None else _epoch_ns(value) for value in series),
+            dtype=np.int64,
+            count=len(series),
+        )
+    except OverflowError:
+        return None
+    values = pd.DatetimeIndex(epoch_ns.view("datetime64[ns]"))
+    if tz is not None:
+        values = values.tz_localize("UTC").tz_convert(tz)
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+def columns_to_df(
+    keys: t.Sequence[str],
+    columns: t.Sequence[t.Sequence[t.Any]],
+    expand: bool,
+) -> pandas.DataFrame:
+    """
+    Build a :class:`pandas.DataFrame` from result columns.
+
+    See :meth:`.Result.to_df` for the meaning of ``expand``.
+
+    :raises ImportError: if `pandas` library is not available.
+    """
+    import pandas as pd  # type: ignore[import]
+
+    if not expand:
+        return pd.DataFrame(dict(zip(keys, columns)), columns=keys)
+    df_keys = None
+    rows: list = []
+    for values in zip(*columns):
+        row = RecordTableRowExporter().transform(dict(zip(keys, values)))
+        if df_keys == row.keys():
+            rows.append(row.values())
+        elif df_keys is None:
+            df_keys = row.keys()
+            rows.append(row.values())
+        elif df_keys is False:
+            rows.append(row)
+        else:
+            # The rows have different keys. We need to pass a list
+            # of dicts to pandas
+            rows = [dict(zip(df_keys, r)) for r in rows]
+            df_keys = False
+            rows.append(row)
+    if df_keys is False:
+        return pd.DataFrame(rows)
+    df_columns = df_keys or [
+        k.replace(".", "\\.").replace("\\", "\\\\") for k in keys
+    ]
+    return pd.DataFrame(rows, columns=df_columns)
+
+
+def parse_df_dates(df: pandas.DataFrame) -> pandas.DataFrame:
+    """
+    Convert temporal columns of a :class:`pandas.DataFrame`.
+
+    Columns that exclusively contain :class:`.DateTime` objects,
+    :class:`.Date` objects, or :data:`None` are converted to
+    :class:`pandas.Timestamp`.
+    The converted columns replace the original ones in ``df``, which is
+    returned as well.
+    """
+    import pandas as pd  # type: ignore[import]
+    import pytz
+
+    dt_columns = df.columns[
+        df.apply(
+            lambda col: pd.api.types.infer_dtype(col) == "mixed"
+            and col.map(
+                lambda x: isinstance(x, (DateTime, Date, type(None)))
+            ).all()
+        )
+    ]
+
+    def datetime_to_timestamp(x):
+        if not x:
+            return pd.NaT
+        tzinfo = getattr(x, "tzinfo", None)
+        if tzinfo is None:
+            return pd.Timestamp(x.iso_format())
+        return pd.Timestamp(x.astimezone(pytz.UTC).iso_format()).astimezone(
+            tzinfo
+        )
+
+    for column in dt_columns:
+        converted = temporal_series_to_pandas(df[column])
+        if converted is None:
+            # not convertible in bulk, fall back to per value conversion
+            converted = df[column].map(datetime_to_timestamp)
+        df[column] = converted
+    return df
@@ -46,6 +46,7 @@ Driver API Errors
     + ResultConsumedError
     + ResultNotSingleError
   + BrokenRecordError
+  + BulkWriteError
   + SessionExpired
   + ServiceUnavailable
     + RoutingServiceUnavailable
@@ -73,6 +74,7 @@ __all__ = [
     "AuthConfigurationError",
     "AuthError",
     "BrokenRecordError",
+    "BulkWriteError",
     "CertificateConfigurationError",
     "ClientError",
     "ConfigurationError",
@@ -124,6 +126,7 @@ if t.TYPE_CHECKING:
         Session,
         Transaction,
     )
+    from ._work import ResultSummary
 
     _TTransaction = t.Union[
         AsyncManagedTransaction,
@@ -153,6 +156,7 @@ __all__ = [
     "AuthConfigurationError",
     "AuthError",
     "BrokenRecordError",
+    "BulkWriteError",
     "CertificateConfigurationError",
     "ClientError",
     "ConfigurationError",
@@ -1089,6 +1093,31 @@ class BrokenRecordError(DriverError):
     """
 
 
+# DriverError > BulkWriteError
+class BulkWriteError(DriverError):
+    """
+    Raised when :meth:`.Driver.bulk_write` fails to write a batch.
+
+    The error that made the batch fail is the :attr:`__cause__` of this
+    error. Batches written before stay committed. Their summaries are
+    available as :attr:`summaries` to tell how far the write got.
+
+    **This is a preview** (see :ref:`filter-warnings-ref`).
+    It might be changed without following the deprecation policy.
+    See also
+    https://github.com/neo4j/neo4j-python-driver/wiki/preview-features
+
+    .. versionadded:: 5.26
+    """
+
+    #: The summaries of the committed batches (in order).
+    summaries: list[ResultSummary]
+
+    def __init__(self, summaries_, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.summaries = summaries_
+
+
 # DriverError > SessionExpired
 class SessionExpired(DriverError):
     """
@@ -307,6 +307,20 @@ class Path:
         self._nodes = tuple(nodes)
         self._relationships = relationships
 
+    @classmethod
+    def _from_hydration(
+        cls,
+        nodes: tuple[Node, ...],
+        relationships: tuple[Relationship, ...],
+    ) -> Path:
+        # The hydration already walked the path and wired up the start and
+        # end nodes of each relationship, so there is no need to re-validate
+        # the node/relationship chain.
+        path = cls.__new__(cls)
+        path._nodes = nodes
+        path._relationships = relationships
+        return path
+
     def __repr__(self) -> str:
         return (
             f"<Path start={self.start_node!r} end={self.end_node!r} "
@@ -49,6 +49,7 @@ def async_fake_connection_generator(session_mocker):
             self.attach_mock(mock.Mock(return_value=True), "is_reset_mock")
             self.attach_mock(mock.Mock(return_value=False), "defunct")
             self.attach_mock(mock.Mock(return_value=False), "stale")
+            self.attach_mock(mock.Mock(return_value=False), "expires_within")
             self.attach_mock(mock.Mock(return_value=False), "closed")
             self.attach_mock(mock.Mock(return_value=False), "socket")
             self.attach_mock(mock.Mock(return_value=False), "re_auth")
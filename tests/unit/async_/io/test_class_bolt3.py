@@ -67,6 +67,50 @@ def test_conn_is_not_stale(fake_socket, set_stale):
     assert connection.stale() is set_stale
 
 
+@pytest.mark.parametrize(
+    ("jitter", "random_value", "expected_lifetime"),
+    (
+        (0.0, 0.5, 1000),
+        (0.2, 0.0, 1000),
+        (0.2, 0.5, 900),
+        (0.2, 0.999, 800.2),
+    ),
+)
+def test_conn_lifetime_jitter(
+    fake_socket, mocker, jitter, random_value, expected_lifetime
+):
+    mocker.patch("neo4j._async.io._bolt.random", return_value=random_value)
+    monotonic = mocker.patch("neo4j._async.io._bolt.monotonic", return_value=0)
+    address = neo4j.Address(("127.0.0.1", 7687))
+    connection = AsyncBolt3(
+        address,
+        fake_socket(address),
+        1000,
+        max_connection_lifetime_jitter=jitter,
+    )
+
+    monotonic.return_value = expected_lifetime - 1
+    assert not connection.stale()
+    assert connection.expires_within(1)
+    assert not connection.expires_within(0.5)
+    monotonic.return_value = expected_lifetime
+    assert connection.stale()
+
+
+@pytest.mark.parametrize("max_connection_lifetime", (0, -1))
+def test_conn_lifetime_jitter_keeps_special_lifetimes(
+    fake_socket, max_connection_lifetime
+):
+    address = neo4j.Address(("127.0.0.1", 7687))
+    connection = AsyncBolt3(
+        address,
+        fake_socket(address),
+        max_connection_lifetime,
+        max_connection_lifetime_jitter=0.5,
+    )
+    assert connection.stale() is (max_connection_lifetime == 0)
+
+
 def test_db_extra_not_supported_in_begin(fake_socket):
     address = neo4j.Address(("127.0.0.1", 7687))
     connection = AsyncBolt3(
@@ -27,6 +27,7 @@ from neo4j._async.io import (
     AsyncBolt,
     AsyncNeo4jPool,
 )
+from neo4j._async_compat import async_sleep
 from neo4j._async_compat.util import AsyncUtil
 from neo4j._conf import (
     RoutingConfig,
@@ -279,6 +280,58 @@ async def test_release_resets_connections(opener):
     cx1.reset.assert_called_once()
 
 
+@pytest.mark.parametrize("pending_responses", (False, True))
+@mark_async_test
+async def test_release_defers_reset(opener, pending_responses, mocker):
+    pool_config = _pool_config()
+    pool_config.deferred_reset = True
+    pool = AsyncNeo4jPool(
+        opener, pool_config, WorkspaceConfig(), ROUTER1_ADDRESS
+    )
+    cx1 = await pool.acquire(READ_ACCESS, 30, "test_db", None, None, None)
+    cx1.is_reset_mock.return_value = False
+    cx1.responses = [mocker.Mock()] if pending_responses else []
+    await pool.release(cx1)
+    if pending_responses:
+        # the responses' handlers must not outlive the release
+        cx1.reset.assert_awaited_once_with()
+    else:
+        cx1.reset.assert_awaited_once_with(deferred=True)
+
+
+@pytest.mark.parametrize("reset_fails", (False, True))
+@mark_async_test
+async def test_acquire_fetches_deferred_reset(opener, reset_fails, mocker):
+    pool_config = _pool_config()
+    pool_config.deferred_reset = True
+    pool = AsyncNeo4jPool(
+        opener, pool_config, WorkspaceConfig(), ROUTER1_ADDRESS
+    )
+    cx1 = await pool._acquire(READER1_ADDRESS, None, Deadline(30), None)
+    cx1.is_reset_mock.return_value = False
+    cx1.responses = []
+    await pool.release(cx1)
+    cx1.reset.assert_awaited_once_with(deferred=True)
+    # the RESET's response is pending
+    cx1.responses = [mocker.Mock()]
+    fetch_all_mock = mocker.AsyncMock()
+    if reset_fails:
+        fetch_all_mock.side_effect = ServiceUnavailable("reset failed")
+    cx1.fetch_all = fetch_all_mock
+
+    cx2 = await pool._acquire(READER1_ADDRESS, None, Deadline(30), None)
+
+    fetch_all_mock.assert_awaited_once()
+    if reset_fails:
+        assert cx2 is not cx1
+        cx1.close.assert_awaited_once()
+        assert cx1 not in pool.connections[READER1_ADDRESS]
+        assert cx2 in pool.connections[READER1_ADDRESS]
+    else:
+        assert cx2 is cx1
+        cx1.close.assert_not_called()
+
+
 @mark_async_test
 async def test_release_does_not_resets_closed_connections(opener):
     pool = _simple_pool(opener)
@@ -767,3 +820,721 @@ async def test_pool_does_not_close_connections_dropped_from_rt_for_other_server(
     assert len(pool.connections[READER1_ADDRESS]) == 1
     assert len(pool.connections[READER2_ADDRESS]) == reader2_connection_count
     assert len(pool.connections[READER3_ADDRESS]) == 1
+
+
+def _refreshing_pool(opener, ratio=0.5) -> AsyncNeo4jPool:
+    pool_config = _pool_config()
+    pool_config.routing_table_refresh_ratio = ratio
+    return AsyncNeo4jPool(
+        opener, pool_config, WorkspaceConfig(), ROUTER1_ADDRESS
+    )
+
+
+def _age_routing_table(routing_table, seconds):
+    routing_table.last_updated_time -= seconds
+    routing_table.last_used_time -= seconds
+
+
+@mark_async_test
+async def test_no_routing_table_refresher_by_default(opener):
+    pool = _simple_pool(opener)
+    cx = await pool.acquire(READ_ACCESS, 30, "test_db", None, None, None)
+    await pool.release(cx)
+    assert pool._routing_table_refresher is None
+    await pool.close()
+
+
+@mark_async_test
+async def test_acquire_starts_routing_table_refresher(opener):
+    pool = _refreshing_pool(opener)
+    assert not pool._routing_table_refresher.running
+    cx = await pool.acquire(READ_ACCESS, 30, "test_db", None, None, None)
+    await pool.release(cx)
+    assert pool._routing_table_refresher.running
+    await pool.close()
+    assert not pool._routing_table_refresher.running
+
+
+@mark_async_test
+async def test_background_refresh_of_used_routing_table(opener):
+    pool = _refreshing_pool(opener)
+    await pool.update_routing_table(
+        database="test_db", imp_user=None, bookmarks=None
+    )
+    routing_table = pool.routing_tables["test_db"]
+    _age_routing_table(routing_table, 600)  # ttl is 1000
+    routing_table.mark_used()
+    old_value = routing_table.last_updated_time
+
+    delay = await pool._refresh_routing_tables()
+
+    assert pool.routing_tables["test_db"] is routing_table
+    assert routing_table.last_updated_time > old_value
+    assert 0 < delay <= 5
+
+
+@pytest.mark.parametrize("used", (True, False))
+@mark_async_test
+async def test_background_refresh_skips_fresh_routing_table(opener, used):
+    pool = _refreshing_pool(opener)
+    await pool.update_routing_table(
+        database="test_db", imp_user=None, bookmarks=None
+    )
+    routing_table = pool.routing_tables["test_db"]
+    _age_routing_table(routing_table, 400)  # ttl is 1000
+    if used:
+        routing_table.mark_used()
+    old_value = routing_table.last_updated_time
+
+    await pool._refresh_routing_tables()
+
+    assert routing_table.last_updated_time == old_value
+
+
+@mark_async_test
+async def test_background_refresh_skips_unused_routing_table(opener):
+    pool = _refreshing_pool(opener)
+    await pool.update_routing_table(
+        database="test_db", imp_user=None, bookmarks=None
+    )
+    routing_table = pool.routing_tables["test_db"]
+    _age_routing_table(routing_table, 600)  # ttl is 1000
+    old_value = routing_table.last_updated_time
+
+    await pool._refresh_routing_tables()
+
+    assert routing_table.last_updated_time == old_value
+    # the table is used now => the refresh should happen
+    routing_table.mark_used()
+    await pool._refresh_routing_tables()
+    assert routing_table.last_updated_time > old_value
+
+
+@mark_async_test
+async def test_background_refresh_skips_expired_routing_table(opener):
+    pool = _refreshing_pool(opener)
+    await pool.update_routing_table(
+        database="test_db", imp_user=None, bookmarks=None
+    )
+    routing_table = pool.routing_tables["test_db"]
+    routing_table.mark_used()
+    routing_table.ttl = 0
+    old_value = routing_table.last_updated_time
+
+    await pool._refresh_routing_tables()
+
+    assert routing_table.last_updated_time == old_value
+
+
+@mark_async_test
+async def test_background_refresh_drops_old_routing_tables(opener):
+    pool = _refreshing_pool(opener)
+    for database in ("test_db1", "test_db2"):
+        await pool.update_routing_table(
+            database=database, imp_user=None, bookmarks=None
+        )
+    pool.routing_tables[
+        "test_db2"
+    ].ttl = -RoutingConfig.routing_table_purge_delay
+
+    await pool._refresh_routing_tables()
+
+    assert "test_db1" in pool.routing_tables
+    assert "test_db2" not in pool.routing_tables
+
+
+class _LockTracker:
+    def __init__(self, lock):
+        self.lock = lock
+        self.held = 0
+
+    async def __aenter__(self):
+        await self.lock.acquire()
+        self.held += 1
+
+    async def __aexit__(self, *_):
+        self.held -= 1
+        self.lock.release()
+
+
+@mark_async_test
+async def test_background_refresh_applies_routing_table_under_lock(
+    opener, mocker
+):
+    pool = _refreshing_pool(opener)
+    await pool.update_routing_table(
+        database="test_db", imp_user=None, bookmarks=None
+    )
+    routing_table = pool.routing_tables["test_db"]
+    _age_routing_table(routing_table, 600)  # ttl is 1000
+    routing_table.mark_used()
+    lock = _LockTracker(pool.refresh_lock)
+    pool.refresh_lock = lock
+    held_at = {}
+
+    def track(name, original):
+        async def wrapper(*args, **kwargs):
+            held_at[name] = lock.held
+            return await original(*args, **kwargs)
+
+        return wrapper
+
+    original_update = routing_table.update
+
+    def track_update(new_routing_table):
+        held_at["update"] = lock.held
+        return original_update(new_routing_table)
+
+    mocker.patch.object(
+        pool,
+        "fetch_routing_table",
+        side_effect=track("fetch", pool.fetch_routing_table),
+    )
+    mocker.patch.object(
+        pool,
+        "update_connection_pool",
+        side_effect=track("update_pool", pool.update_connection_pool),
+    )
+    mocker.patch.object(routing_table, "update", side_effect=track_update)
+
+    await pool._refresh_routing_tables()
+
+    assert held_at["fetch"] == 0
+    assert held_at["update"] > 0
+    assert held_at["update_pool"] > 0
+
+
+@mark_async_test
+async def test_background_refresh_survives_failures(
+    custom_routing_opener,
+):
+    opener = custom_routing_opener(
+        failures=iter((None, *(ServiceUnavailable("oops"),) * 10))
+    )
+    pool = _refreshing_pool(opener)
+    await pool.update_routing_table(
+        database="test_db", imp_user=None, bookmarks=None
+    )
+    routing_table = pool.routing_tables["test_db"]
+    _age_routing_table(routing_table, 600)  # ttl is 1000
+    routing_table.mark_used()
+    old_value = routing_table.last_updated_time
+
+    delay = await pool._refresh_routing_tables()
+
+    assert routing_table.last_updated_time == old_value
+    assert delay == 1
+
+
+def _hedged_pool(opener) -> AsyncNeo4jPool:
+    pool_config = _pool_config()
+    pool_config.hedged_discovery_delay = 0.01
+    return AsyncNeo4jPool(
+        opener, pool_config, WorkspaceConfig(), ROUTER1_ADDRESS
+    )
+
+
+def _patch_router_opener(opener, router_open):
+    original_open = opener.side_effect
+
+    async def open_(addr, auth, timeout):
+        await router_open(addr)
+        return await original_open(addr, auth, timeout)
+
+    opener.side_effect = open_
+
+
+async def _update_from_routers(pool, *routers):
+    return await pool._update_routing_table_from(
+        *routers,
+        database="test_db",
+        imp_user=None,
+        bookmarks=None,
+        auth=None,
+        acquisition_timeout=None,
+        database_callback=None,
+    )
+
+
+@mark_async_test
+async def test_hedged_discovery_skips_failing_router(opener, mocker):
+    async def router_open(addr):
+        if addr == ROUTER1_ADDRESS:
+            raise ServiceUnavailable("oops")
+
+    _patch_router_opener(opener, router_open)
+    pool = _hedged_pool(opener)
+    deactivate_spy = mocker.spy(pool, "deactivate")
+
+    assert await _update_from_routers(pool, ROUTER1_ADDRESS, ROUTER2_ADDRESS)
+
+    assert pool.routing_tables["test_db"].readers == {READER1_ADDRESS}
+    deactivate_spy.assert_called_once_with(ROUTER1_ADDRESS)
+    assert len(opener.connections) == 1
+    cx = opener.connections[0]
+    assert cx.unresolved_address == ROUTER2_ADDRESS
+    cx.route.assert_called_once()
+    cx.close.assert_called_once()
+    # dedicated connections don't end up in the pool
+    assert not pool.connections.get(ROUTER2_ADDRESS)
+
+
+def _slow_down_router(opener, router):
+    original_open = opener.side_effect
+
+    async def open_(addr, auth, timeout):
+        connection = await original_open(addr, auth, timeout)
+        if addr == router:
+            route = connection.route.side_effect
+
+            async def slow_route(*args, **kwargs):
+                for _ in range(500):
+                    if connection.kill.called:
+                        raise ServiceUnavailable("killed")
+                    await async_sleep(0.01)
+                return route(*args, **kwargs)
+
+            connection.route.side_effect = slow_route
+        return connection
+
+    opener.side_effect = open_
+
+
+@mark_async_test
+async def test_hedged_discovery_does_not_wait_for_slow_router(opener, mocker):
+    _slow_down_router(opener, ROUTER1_ADDRESS)
+    pool = _hedged_pool(opener)
+    deactivate_spy = mocker.spy(pool, "deactivate")
+
+    assert await _update_from_routers(pool, ROUTER1_ADDRESS, ROUTER2_ADDRESS)
+
+    assert pool.routing_tables["test_db"].readers == {READER1_ADDRESS}
+    # abandoning the slow router is no failure
+    deactivate_spy.assert_not_called()
+    slow_cx, fast_cx = opener.connections
+    assert slow_cx.unresolved_address == ROUTER1_ADDRESS
+    assert fast_cx.unresolved_address == ROUTER2_ADDRESS
+    # the abandoned query's connection is killed
+    slow_cx.kill.assert_called_once()
+    fast_cx.kill.assert_not_called()
+    for cx in (slow_cx, fast_cx):
+        cx.close.assert_called_once()
+
+
+@mark_async_test
+async def test_hedged_discovery_borrows_idle_connections(opener, mocker):
+    _slow_down_router(opener, ROUTER1_ADDRESS)
+    pool = _hedged_pool(opener)
+    idle_cx = await pool._acquire(ROUTER2_ADDRESS, None, Deadline(30), None)
+    await pool.release(idle_cx)
+    idle_cx.route.reset_mock()
+
+    assert await _update_from_routers(pool, ROUTER1_ADDRESS, ROUTER2_ADDRESS)
+
+    assert pool.routing_tables["test_db"].readers == {READER1_ADDRESS}
+    # the router with an idle connection is queried first
+    idle_cx.route.assert_called_once()
+    assert opener.connections == [idle_cx]
+    # the connection is handed back to the pool
+    idle_cx.close.assert_not_called()
+    assert idle_cx.pool is pool
+    assert not idle_cx.in_use
+    assert list(pool.connections[ROUTER2_ADDRESS]) == [idle_cx]
+
+
+@mark_async_test
+async def test_hedged_discovery_all_routers_failing(opener, mocker):
+    async def router_open(addr):
+        raise ServiceUnavailable("oops")
+
+    _patch_router_opener(opener, router_open)
+    pool = _hedged_pool(opener)
+    deactivate_spy = mocker.spy(pool, "deactivate")
+
+    assert not await _update_from_routers(
+        pool, ROUTER1_ADDRESS, ROUTER2_ADDRESS
+    )
+
+    assert "test_db" not in pool.routing_tables
+    assert deactivate_spy.call_count == 2
+    deactivate_spy.assert_any_call(ROUTER1_ADDRESS)
+    deactivate_spy.assert_any_call(ROUTER2_ADDRESS)
+
+
+@mark_async_test
+async def test_hedged_discovery_fails_fast(
+    custom_routing_opener,
+):
+    error = Neo4jError._hydrate_neo4j(
+        code="Neo.ClientError.Database.DatabaseNotFound", message="message"
+    )
+    opener = custom_routing_opener([error])
+    pool = _hedged_pool(opener)
+
+    with pytest.raises(Neo4jError) as exc:
+        await _update_from_routers(pool, ROUTER1_ADDRESS, ROUTER2_ADDRESS)
+
+    assert exc.value is error
+
+
+def _pre_warming_pool(opener, min_idle=2) -> AsyncNeo4jPool:
+    pool_config = _pool_config()
+    pool_config.min_idle_connections = min_idle
+    return AsyncNeo4jPool(
+        opener, pool_config, WorkspaceConfig(), ROUTER1_ADDRESS
+    )
+
+
+def _idle_connections(pool, address):
+    return [cx for cx in pool.connections[address] if not cx.in_use]
+
+
+@mark_async_test
+async def test_no_pre_warmer_by_default(opener):
+    pool = _simple_pool(opener)
+    cx = await pool.acquire(READ_ACCESS, 30, "test_db", None, None, None)
+    await pool.release(cx)
+    assert pool._pre_warmer is None
+    await pool.close()
+
+
+@mark_async_test
+async def test_acquire_starts_pre_warmer(opener):
+    pool = _pre_warming_pool(opener)
+    assert not pool._pre_warmer.running
+    cx = await pool.acquire(READ_ACCESS, 30, "test_db", None, None, None)
+    await pool.release(cx)
+    assert pool._pre_warmer.running
+    await pool.close()
+    assert not pool._pre_warmer.running
+
+
+@mark_async_test
+async def test_pre_warmer_opens_idle_connections(opener):
+    pool = _pre_warming_pool(opener)
+    await pool.update_routing_table(
+        database="test_db", imp_user=None, bookmarks=None
+    )
+    cx = await pool.acquire(READ_ACCESS, 30, "test_db", None, None, None)
+
+    delay = await pool._keep_idle_connections()
+
+    assert delay > 0
+    assert cx.in_use
+    assert len(_idle_connections(pool, READER1_ADDRESS)) == 2
+    assert len(_idle_connections(pool, WRITER1_ADDRESS)) == 2
+    assert not _idle_connections(pool, ROUTER2_ADDRESS)
+    await pool.release(cx)
+    await pool.close()
+
+
+@mark_async_test
+async def test_pre_warmer_replaces_unusable_idle_connections(opener):
+    pool = _pre_warming_pool(opener)
+    await pool.update_routing_table(
+        database="test_db", imp_user=None, bookmarks=None
+    )
+    await pool._keep_idle_connections()
+    stale_cx, healthy_cx = _idle_connections(pool, READER1_ADDRESS)
+    stale_cx.stale.return_value = True
+
+    await pool._keep_idle_connections()
+
+    stale_cx.close.assert_awaited_once()
+    healthy_cx.close.assert_not_called()
+    idle = _idle_connections(pool, READER1_ADDRESS)
+    assert len(idle) == 2
+    assert stale_cx not in idle
+    assert healthy_cx in idle
+
+
+@mark_async_test
+async def test_pre_warmer_respects_max_connection_pool_size(opener):
+    pool = _pre_warming_pool(opener, min_idle=3)
+    pool.pool_config.max_connection_pool_size = 2
+    await pool.update_routing_table(
+        database="test_db", imp_user=None, bookmarks=None
+    )
+
+    await pool._keep_idle_connections()
+
+    assert len(pool.connections[READER1_ADDRESS]) == 2
+
+
+@mark_async_test
+async def test_pre_warmer_survives_failures(opener):
+    async def router_open(addr):
+        if addr == READER1_ADDRESS:
+            raise ServiceUnavailable("oops")
+
+    pool = _pre_warming_pool(opener)
+    await pool.update_routing_table(
+        database="test_db", imp_user=None, bookmarks=None
+    )
+    _patch_router_opener(opener, router_open)
+
+    await pool._keep_idle_connections()
+
+    assert not _idle_connections(pool, READER1_ADDRESS)
+    assert len(_idle_connections(pool, WRITER1_ADDRESS)) == 2
+
+
+@pytest.mark.parametrize(("min_idle", "expected"), ((0, 1), (3, 3)))
+@mark_async_test
+async def test_warm_up(opener, min_idle, expected):
+    pool = _pre_warming_pool(opener, min_idle=min_idle)
+    await pool.update_routing_table(
+        database="test_db", imp_user=None, bookmarks=None
+    )
+
+    await pool.warm_up()
+
+    assert len(_idle_connections(pool, READER1_ADDRESS)) == expected
+    assert len(_idle_connections(pool, WRITER1_ADDRESS)) == expected
+    if min_idle:
+        assert pool._pre_warmer.running
+    else:
+        assert pool._pre_warmer is None
+    await pool.close()
+
+
+def _maintained_pool(
+    opener, max_idle_time=None, liveness_check_timeout=None
+) -> AsyncNeo4jPool:
+    pool_config = _pool_config()
+    pool_config.connection_maintenance_interval = 1
+    pool_config.max_idle_time = max_idle_time
+    pool_config.liveness_check_timeout = liveness_check_timeout
+    return AsyncNeo4jPool(
+        opener, pool_config, WorkspaceConfig(), ROUTER1_ADDRESS
+    )
+
+
+async def _idle_connection(pool, address):
+    cx = await pool._acquire(address, None, Deadline(30), None)
+    await pool.release(cx)
+    return cx
+
+
+@mark_async_test
+async def test_no_maintainer_by_default(opener):
+    pool = _simple_pool(opener)
+    cx = await pool.acquire(READ_ACCESS, 30, "test_db", None, None, None)
+    await pool.release(cx)
+    assert pool._maintainer is None
+    await pool.close()
+
+
+@mark_async_test
+async def test_acquire_starts_maintainer(opener):
+    pool = _maintained_pool(opener)
+    assert not pool._maintainer.running
+    cx = await pool.acquire(READ_ACCESS, 30, "test_db", None, None, None)
+    await pool.release(cx)
+    assert pool._maintainer.running
+    await pool.close()
+    assert not pool._maintainer.running
+
+
+@mark_async_test
+async def test_acquire_skips_connections_idle_for_too_long(opener):
+    pool = _maintained_pool(opener, max_idle_time=10)
+    cx1 = await _idle_connection(pool, READER1_ADDRESS)
+    cx1.is_idle_for.return_value = True
+
+    cx2 = await pool._acquire(READER1_ADDRESS, None, Deadline(30), None)
+
+    assert cx2 is not cx1
+    cx1.is_idle_for.assert_called_with(10)
+    cx1.close.assert_awaited_once()
+    assert cx1 not in pool.connections[READER1_ADDRESS]
+
+
+@pytest.mark.parametrize("reason", ("stale", "idle"))
+@mark_async_test
+async def test_maintainer_closes_expired_idle_connections(opener, reason):
+    pool = _maintained_pool(opener, max_idle_time=10)
+    expired_cx = await _idle_connection(pool, READER1_ADDRESS)
+    healthy_cx = await _idle_connection(pool, READER2_ADDRESS)
+    healthy_cx.is_idle_for.return_value = False
+    if reason == "stale":
+        expired_cx.stale.return_value = True
+        expired_cx.is_idle_for.return_value = False
+    else:
+        expired_cx.is_idle_for.return_value = True
+
+    delay = await pool._maintain_connections()
+
+    assert delay == 1
+    expired_cx.close.assert_awaited_once()
+    healthy_cx.close.assert_not_called()
+    assert expired_cx not in pool.connections[READER1_ADDRESS]
+    assert healthy_cx in pool.connections[READER2_ADDRESS]
+
+
+@mark_async_test
+async def test_maintainer_leaves_connections_in_use_alone(opener):
+    pool = _maintained_pool(opener, max_idle_time=10, liveness_check_timeout=0)
+    cx = await pool._acquire(READER1_ADDRESS, None, Deadline(30), None)
+    cx.stale.return_value = True
+    cx.is_idle_for.return_value = True
+
+    await pool._maintain_connections()
+
+    cx.close.assert_not_called()
+    cx.reset.assert_not_called()
+    assert cx in pool.connections[READER1_ADDRESS]
+    assert cx.in_use
+
+
+@mark_async_test
+async def test_maintainer_checks_liveness(opener):
+    pool = _maintained_pool(opener, liveness_check_timeout=5)
+    idle_cx = await _idle_connection(pool, READER1_ADDRESS)
+    idle_cx.is_idle_for.return_value = True
+    recent_cx = await _idle_connection(pool, READER2_ADDRESS)
+    recent_cx.is_idle_for.return_value = False
+
+    await pool._maintain_connections()
+
+    idle_cx.is_idle_for.assert_called_with(5)
+    idle_cx.reset.assert_awaited_once()
+    recent_cx.reset.assert_not_called()
+    assert not idle_cx.in_use
+    assert idle_cx in pool.connections[READER1_ADDRESS]
+
+
+@pytest.mark.parametrize(
+    "liveness_error", (OSError, ServiceUnavailable, SessionExpired)
+)
+@mark_async_test
+async def test_maintainer_removes_connections_failing_liveness_check(
+    opener, liveness_error
+):
+    pool = _maintained_pool(opener, liveness_check_timeout=5)
+    cx = await _idle_connection(pool, READER1_ADDRESS)
+    cx.is_idle_for.return_value = True
+    cx.reset.side_effect = liveness_error("liveness check failed")
+
+    await pool._maintain_connections()
+
+    cx.reset.assert_awaited_once()
+    cx.close.assert_awaited_once()
+    assert not cx.in_use
+    assert cx not in pool.connections[READER1_ADDRESS]
+
+
+@mark_async_test
+async def test_maintainer_retires_expiring_connections_gradually(opener):
+    pool = _maintained_pool(opener)
+    connections = [
+        await pool._acquire(READER1_ADDRESS, None, Deadline(30), None)
+        for _ in range(3)
+    ]
+    for cx in connections:
+        await pool.release(cx)
+        cx.expires_within.return_value = True
+
+    await pool._maintain_connections()
+
+    connections[0].expires_within.assert_called_with(1)
+    closed = [cx for cx in connections if cx.close.await_count]
+    assert len(closed) == 1
+    assert closed[0] not in pool.connections[READER1_ADDRESS]
+    assert len(pool.connections[READER1_ADDRESS]) == 2
+
+    await pool._maintain_connections()
+
+    assert len(pool.connections[READER1_ADDRESS]) == 1
+
+
+@mark_async_test
+async def test_maintainer_does_not_retire_connections_in_use(opener):
+    pool = _maintained_pool(opener)
+    cx = await pool._acquire(READER1_ADDRESS, None, Deadline(30), None)
+    cx.expires_within.return_value = True
+
+    await pool._maintain_connections()
+
+    cx.close.assert_not_called()
+    assert cx in pool.connections[READER1_ADDRESS]
+
+
+@mark_async_test
+async def test_capacity_counts_servers_of_database_routing_table(
+    custom_routing_opener,
+):
+    readers = {
+        "db1": [str(READER1_ADDRESS), str(READER2_ADDRESS)],
+        "db2": [
+            str(READER1_ADDRESS),
+            str(READER2_ADDRESS),
+            str(READER3_ADDRESS),
+        ],
+    }
+    opener = custom_routing_opener(get_readers=readers.__getitem__)
+    pool_config = _pool_config()
+    pool_config.max_connection_pool_size = 5
+    pool = AsyncNeo4jPool(
+        opener, pool_config, WorkspaceConfig(), ROUTER1_ADDRESS
+    )
+
+    # no routing table known yet
+    assert await pool.capacity(READ_ACCESS, "db1") == 5
+
+    for db in readers:
+        cx = await pool.acquire(READ_ACCESS, 30, db, None, None, None)
+        await pool.release(cx)
+
+    assert await pool.capacity(READ_ACCESS, "db1") == 10
+    assert await pool.capacity(READ_ACCESS, "db2") == 15
+    assert await pool.capacity(WRITE_ACCESS, "db2") == 5
+    assert await pool.capacity(READ_ACCESS, "db3") == 5
+    assert await pool.capacity(READ_ACCESS, None) == 5
+
+
+@pytest.mark.parametrize("max_pool_size", (-1, float("inf")))
+@mark_async_test
+async def test_capacity_of_unbounded_pool(opener, max_pool_size):
+    pool_config = _pool_config()
+    pool_config.max_connection_pool_size = max_pool_size
+    pool = AsyncNeo4jPool(
+        opener, pool_config, WorkspaceConfig(), ROUTER1_ADDRESS
+    )
+
+    cx = await pool.acquire(READ_ACCESS, 30, "test_db", None, None, None)
+    await pool.release(cx)
+
+    assert await pool.capacity(READ_ACCESS, "test_db") is None
+
+
+@mark_async_test
+async def test_refresh_writers_after_writer_removed(opener):
+    pool = _simple_pool(opener)
+    cx = await pool.acquire(WRITE_ACCESS, 30, "test_db", None, None, None)
+    await pool.release(cx)
+    old_update_time = pool.routing_tables["test_db"].last_updated_time
+
+    # fresh table: nothing to do
+    assert await pool.refresh_writers(
+        database="test_db", imp_user=None, bookmarks=None
+    )
+    rt = pool.routing_tables["test_db"]
+    assert rt.last_updated_time == old_update_time
+
+    await pool.on_write_failure(WRITER1_ADDRESS, "test_db")
+    assert not pool.routing_tables["test_db"].writers
+
+    for _ in range(3):
+        assert await pool.refresh_writers(
+            database="test_db", imp_user=None, bookmarks=None
+        )
+
+    rt = pool.routing_tables["test_db"]
+    assert rt.writers == {WRITER1_ADDRESS}
+    assert rt.last_updated_time > old_update_time
+    # only the first call had to update the routing table
+    route_calls = sum(
+        connection.route.await_count for connection in opener.connections
+    )
+    assert route_calls == 2
@@ -51,15 +51,31 @@ watch("neo4j")
 test_pool_config = {
     "connection_timeout": 30.0,
     "keep_alive": True,
+    "keep_alive_interval": None,
+    "tcp_no_delay": True,
+    "socket_receive_buffer_size": None,
+    "socket_send_buffer_size": None,
+    "tcp_user_timeout": None,
+    "stream_reader_limit": 2**16,
     "max_connection_lifetime": 3600,
+    "max_connection_lifetime_jitter": 0.0,
     "liveness_check_timeout": None,
+    "max_idle_time": None,
+    "connection_maintenance_interval": None,
     "max_connection_pool_size": 100,
+    "min_idle_connections": 0,
+    "max_pending_connections": None,
+    "deferred_reset": False,
     "resolver": None,
+    "dns_cache_ttl": None,
+    "hedged_discovery_delay": None,
+    "routing_table_refresh_ratio": None,
     "encrypted": False,
     "user_agent": "test",
     "trusted_certificates": TrustSystemCAs(),
     "client_certificate": None,
     "ssl_context": None,
+    "tls_session_resumption": False,
     "auth": None,
     "notifications_min_severity": None,
     "notifications_disabled_classifications": None,
@@ -47,11 +47,17 @@ from neo4j import (
 from neo4j._api import TelemetryAPI
 from neo4j._async.auth_management import _AsyncStaticClientCertificateProvider
 from neo4j._async.config import AsyncPoolConfig
-from neo4j._async.driver import _work
+from neo4j._async.driver import (
+    _bulk_work,
+    _eager_work,
+    _many_work,
+    _work,
+)
 from neo4j._async.io import (
     AsyncBoltPool,
     AsyncNeo4jPool,
 )
+from neo4j._async_compat.concurrency import async_bounded_as_completed
 from neo4j._debug import ENABLED as DEBUG_ENABLED
 from neo4j.api import (
     AsyncBookmarkManager,
@@ -249,6 +255,131 @@ def test_driver_liveness_timeout_config_error(
         AsyncGraphDatabase.driver("bolt://127.0.0.1:9001", **test_config)
 
 
+@pytest.mark.parametrize("ratio", (-1, 0, 1, 1.5))
+def test_driver_routing_table_refresh_ratio_config_error(ratio):
+    with pytest.warns(PreviewWarning, match="routing_table_refresh_ratio"):
+        with pytest.raises(
+            ConfigurationError, match='"routing_table_refresh_ratio"'
+        ):
+            AsyncGraphDatabase.driver(
+                "neo4j://127.0.0.1:9001", routing_table_refresh_ratio=ratio
+            )
+
+
+@pytest.mark.parametrize(
+    ("min_idle", "max_pool_size"),
+    ((-1, None), (2, 1), (101, None)),
+)
+def test_driver_min_idle_connections_config_error(min_idle, max_pool_size):
+    config = {"min_idle_connections": min_idle}
+    if max_pool_size is not None:
+        config["max_connection_pool_size"] = max_pool_size
+    with pytest.warns(PreviewWarning, match="min_idle_connections"):
+        with pytest.raises(ConfigurationError, match='"min_idle_connections"'):
+            AsyncGraphDatabase.driver("neo4j://127.0.0.1:9001", **config)
+
+
+@pytest.mark.parametrize(
+    "option", ("max_idle_time", "connection_maintenance_interval")
+)
+@pytest.mark.parametrize("value", (0, -1))
+def test_driver_connection_maintenance_config_error(option, value):
+    with pytest.warns(PreviewWarning, match=option):
+        with pytest.raises(ConfigurationError, match=f'"{option}"'):
+            AsyncGraphDatabase.driver(
+                "neo4j://127.0.0.1:9001", **{option: value}
+            )
+
+
+@pytest.mark.parametrize("jitter", (-0.1, 1, 1.5))
+def test_driver_max_connection_lifetime_jitter_config_error(jitter):
+    with pytest.warns(PreviewWarning, match="max_connection_lifetime_jitter"):
+        with pytest.raises(
+            ConfigurationError, match='"max_connection_lifetime_jitter"'
+        ):
+            AsyncGraphDatabase.driver(
+                "neo4j://127.0.0.1:9001", max_connection_lifetime_jitter=jitter
+            )
+
+
+@pytest.mark.parametrize("max_pending", (0, -1))
+def test_driver_max_pending_connections_config_error(max_pending):
+    with pytest.warns(PreviewWarning, match="max_pending_connections"):
+        with pytest.raises(
+            ConfigurationError, match='"max_pending_connections"'
+        ):
+            AsyncGraphDatabase.driver(
+                "neo4j://127.0.0.1:9001", max_pending_connections=max_pending
+            )
+
+
+@mark_async_test
+async def test_driver_deferred_reset_preview_warning() -> None:
+    with pytest.warns(PreviewWarning, match="deferred_reset"):
+        async with AsyncGraphDatabase.driver(
+            "neo4j://127.0.0.1:9001", deferred_reset=True
+        ) as driver:
+            assert driver._pool.pool_config.deferred_reset is True
+
+
+@mark_async_test
+async def test_driver_tls_session_resumption_preview_warning() -> None:
+    with pytest.warns(PreviewWarning, match="tls_session_resumption"):
+        async with AsyncGraphDatabase.driver(
+            "neo4j://127.0.0.1:9001", tls_session_resumption=True
+        ) as driver:
+            pool_config = driver._pool.pool_config
+            assert pool_config.get_tls_session_cache() is not None
+
+
+@pytest.mark.parametrize(
+    "option",
+    (
+        "keep_alive_interval",
+        "socket_receive_buffer_size",
+        "socket_send_buffer_size",
+        "tcp_user_timeout",
+    ),
+)
+@pytest.mark.parametrize("value", (0, -1))
+def test_driver_socket_option_config_error(option, value):
+    with pytest.warns(PreviewWarning, match=option):
+        with pytest.raises(ConfigurationError, match=f'"{option}"'):
+            AsyncGraphDatabase.driver(
+                "neo4j://127.0.0.1:9001", **{option: value}
+            )
+
+
+@pytest.mark.parametrize("delay", (0, 0.1, None))
+@mark_async_test
+async def test_driver_hedged_discovery_delay_config(delay):
+    with pytest.warns(PreviewWarning, match="hedged_discovery_delay"):
+        driver = AsyncGraphDatabase.driver(
+            "neo4j://127.0.0.1:9001", hedged_discovery_delay=delay
+        )
+    async with driver:
+        assert driver._pool.pool_config.hedged_discovery_delay == delay
+
+
+def test_driver_hedged_discovery_delay_config_error():
+    with pytest.warns(PreviewWarning, match="hedged_discovery_delay"):
+        with pytest.raises(
+            ConfigurationError, match='"hedged_discovery_delay"'
+        ):
+            AsyncGraphDatabase.driver(
+                "neo4j://127.0.0.1:9001", hedged_discovery_delay=-1
+            )
+
+
+@pytest.mark.parametrize("ttl", (0, -1))
+def test_driver_dns_cache_ttl_config_error(ttl):
+    with pytest.warns(PreviewWarning, match="dns_cache_ttl"):
+        with pytest.raises(ConfigurationError, match='"dns_cache_ttl"'):
+            AsyncGraphDatabase.driver(
+                "neo4j://127.0.0.1:9001", dns_cache_ttl=ttl
+            )
+
+
 @pytest.mark.parametrize(
     "uri",
     (
@@ -928,6 +1059,334 @@ async def test_execute_query_work(mocker) -> None:
     assert res is transformer_mock.return_value
 
 
+@mark_async_test
+async def test_execute_query_eager_work(mocker) -> None:
+    tx_mock = mocker.AsyncMock(spec=neo4j.AsyncManagedTransaction)
+    transformer_mock = mocker.AsyncMock()
+    query = "QUERY"
+    parameters = {"para": "meters", "foo": object}
+
+    res = await _eager_work(tx_mock, query, parameters, transformer_mock)
+
+    tx_mock.run.assert_not_called()
+    tx_mock._run_and_commit.assert_awaited_once_with(query, parameters)
+    transformer_mock.assert_awaited_once_with(
+        tx_mock._run_and_commit.return_value
+    )
+    assert res is transformer_mock.return_value
+
+
+@mark_async_test
+async def test_execute_query_reuses_session_config(session_cls_mock) -> None:
+    driver = AsyncGraphDatabase.driver("bolt://localhost")
+
+    async with driver as driver:
+        await driver.execute_query("QUERY", database_="db1")
+        (_, config1), _ = session_cls_mock.call_args
+        # sessions may alter their config (e.g., home database resolution)
+        config1.database = "altered"
+        await driver.execute_query("QUERY", database_="db1")
+        (_, config2), _ = session_cls_mock.call_args
+        await driver.execute_query("QUERY", database_="db2")
+        (_, config3), _ = session_cls_mock.call_args
+
+    assert len(driver._query_session_configs) == 2
+    assert config2 is not config1
+    assert config2.database == "db1"
+    assert config2.bookmark_manager is driver.execute_query_bookmark_manager
+    assert config3.database == "db2"
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {"auth_": ("user", "password")},
+        {"bookmark_manager_": neo4j.AsyncGraphDatabase.bookmark_manager()},
+    ),
+)
+@mark_async_test
+async def test_execute_query_does_not_cache_custom_session_config(
+    session_cls_mock, kwargs
+) -> None:
+    driver = AsyncGraphDatabase.driver("bolt://localhost")
+
+    async with driver as driver:
+        await driver.execute_query("QUERY", **kwargs)
+
+    assert not driver._query_session_configs
+    (_, config), _ = session_cls_mock.call_args
+    if "auth_" in kwargs:
+        assert config.auth == kwargs["auth_"]
+    else:
+        assert config.bookmark_manager is kwargs["bookmark_manager_"]
+
+
+@mark_async_test
+async def test_execute_queries_many_work(mocker) -> None:
+    tx_mock = mocker.AsyncMock(spec=neo4j.AsyncManagedTransaction)
+    results = [mocker.AsyncMock(), mocker.AsyncMock()]
+    tx_mock._run_many.return_value = results
+    queries = [("QUERY 1", {}), ("QUERY 2", {"para": "meters"})]
+
+    res = await _many_work(tx_mock, queries)
+
+    tx_mock._run_many.assert_awaited_once_with(queries, -1, commit=True)
+    assert res == [r.to_eager_result.return_value for r in results]
+
+
+@mark_async_test
+async def test_execute_queries(session_cls_mock) -> None:
+    driver = AsyncGraphDatabase.driver("bolt://localhost")
+
+    async with driver as driver:
+        with pytest.warns(PreviewWarning, match="execute_queries"):
+            res = await driver.execute_queries(
+                [("QUERY 1", None), ("QUERY 2", {"para": "meters"})],
+                routing_=neo4j.RoutingControl.READ,
+            )
+
+    session_cls_mock.assert_called_once()
+    session_mock = session_cls_mock.return_value
+    session_executor_mock = session_mock._run_transaction
+    session_executor_mock.assert_awaited_once_with(
+        READ_ACCESS,
+        TelemetryAPI.DRIVER,
+        _many_work,
+        ([("QUERY 1", {}), ("QUERY 2", {"para": "meters"})],),
+        {},
+    )
+    assert res is session_executor_mock.return_value
+
+
+@mark_async_test
+async def test_driver_retry_policy_config() -> None:
+    with pytest.warns(PreviewWarning, match="RetryPolicy"):
+        retry_policy = neo4j.RetryPolicy()
+
+    with pytest.warns(PreviewWarning, match="retry_policy"):
+        driver = AsyncGraphDatabase.driver(
+            "bolt://localhost", retry_policy=retry_policy
+        )
+    async with driver:
+        assert driver._default_workspace_config.retry_policy is retry_policy
+
+
+@mark_async_test
+async def test_session_retry_policy_config() -> None:
+    with pytest.warns(PreviewWarning, match="RetryPolicy"):
+        retry_policy = neo4j.RetryPolicy()
+
+    async with AsyncGraphDatabase.driver("bolt://localhost") as driver:
+        with pytest.warns(PreviewWarning, match="retry_policy"):
+            session = driver.session(retry_policy=retry_policy)
+        async with session:
+            assert session._config.retry_policy is retry_policy
+
+
+def test_driver_retry_policy_config_error() -> None:
+    with pytest.warns(PreviewWarning, match="retry_policy"):
+        with pytest.raises(ConfigurationError, match="retry_policy"):
+            AsyncGraphDatabase.driver(
+                "bolt://localhost",
+                retry_policy=object(),  # type: ignore[arg-type]
+            )
+
+
+@pytest.mark.parametrize("max_concurrency", (None, 1, 3))
+@mark_async_test
+async def test_execute_concurrently(max_concurrency, mocker) -> None:
+    driver = AsyncGraphDatabase.driver("bolt://localhost")
+    capacity_mock = mocker.patch.object(
+        driver._pool, "capacity", return_value=2
+    )
+    execute_query_mock = mocker.patch.object(
+        driver, "execute_query", side_effect=lambda query, *_, **__: query
+    )
+    queries: list[t.Any] = [("QUERY 1", None), ("QUERY 2", {"x": 1}, "db2")]
+
+    async with driver as driver:
+        with pytest.warns(PreviewWarning, match="execute_concurrently"):
+            res = [
+                item
+                async for item in driver.execute_concurrently(
+                    queries,
+                    max_concurrency_=max_concurrency,
+                    routing_=neo4j.RoutingControl.READ,
+                    database_="db1",
+                )
+            ]
+
+    if max_concurrency is None:
+        capacity_mock.assert_called_once_with(READ_ACCESS, "db1")
+    else:
+        capacity_mock.assert_not_called()
+    assert sorted(res) == [(0, "QUERY 1"), (1, "QUERY 2")]
+    assert execute_query_mock.call_args_list == [
+        mocker.call(
+            "QUERY 1",
+            None,
+            routing_=neo4j.RoutingControl.READ,
+            database_="db1",
+            impersonated_user_=None,
+            bookmark_manager_=mocker.ANY,
+            auth_=None,
+        ),
+        mocker.call(
+            "QUERY 2",
+            {"x": 1},
+            routing_=neo4j.RoutingControl.READ,
+            database_="db2",
+            impersonated_user_=None,
+            bookmark_manager_=mocker.ANY,
+            auth_=None,
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("capacity", "expected_concurrency"),
+    (
+        (None, 32),
+        (0, 1),
+        (2, 2),
+        (300, 32),
+    ),
+)
+@mark_async_test
+async def test_execute_concurrently_default_concurrency(
+    capacity, expected_concurrency, mocker
+) -> None:
+    driver = AsyncGraphDatabase.driver("bolt://localhost")
+    mocker.patch.object(driver._pool, "capacity", return_value=capacity)
+    mocker.patch.object(
+        driver, "execute_query", side_effect=lambda query, *_, **__: query
+    )
+    bounded_as_completed_mock = mocker.patch(
+        "neo4j._async.driver.async_bounded_as_completed",
+        wraps=async_bounded_as_completed,
+    )
+
+    async with driver as driver:
+        with pytest.warns(PreviewWarning, match="execute_concurrently"):
+            res = [
+                item
+                async for item in driver.execute_concurrently(
+                    [("QUERY", None)]
+                )
+            ]
+
+    assert res == [(0, "QUERY")]
+    bounded_as_completed_mock.assert_called_once_with(
+        mocker.ANY, expected_concurrency
+    )
+
+
+@pytest.mark.parametrize("max_pool_size", (-1, float("inf")))
+@mark_async_test
+async def test_execute_concurrently_unbounded_pool(
+    max_pool_size, mocker
+) -> None:
+    driver = AsyncGraphDatabase.driver(
+        "neo4j://localhost", max_connection_pool_size=max_pool_size
+    )
+    mocker.patch.object(
+        driver, "execute_query", side_effect=lambda query, *_, **__: query
+    )
+    queries = [("QUERY 1", None), ("QUERY 2", None)]
+
+    async with driver as driver:
+        with pytest.warns(PreviewWarning, match="execute_concurrently"):
+            res = [item async for item in driver.execute_concurrently(queries)]
+
+    assert sorted(res) == [(0, "QUERY 1"), (1, "QUERY 2")]
+
+
+@mark_async_test
+async def test_execute_concurrently_invalid_max_concurrency() -> None:
+    driver = AsyncGraphDatabase.driver("bolt://localhost")
+
+    async with driver as driver:
+        with pytest.warns(PreviewWarning, match="execute_concurrently"):
+            results = driver.execute_concurrently(
+                [("QUERY", None)], max_concurrency_=0
+            )
+        with pytest.raises(ValueError, match="max_concurrency_"):
+            async for _ in results:
+                pass
+
+
+@mark_async_test
+async def test_bulk_write_work(mocker) -> None:
+    tx_mock = mocker.AsyncMock(spec=neo4j.AsyncManagedTransaction)
+    parameters = {"rows": [1, 2]}
+
+    res = await _bulk_work(tx_mock, "QUERY", parameters)
+
+    tx_mock._run_and_commit.assert_awaited_once_with("QUERY", parameters)
+    result_mock = tx_mock._run_and_commit.return_value
+    assert res is result_mock.consume.return_value
+
+
+@mark_async_test
+async def test_bulk_write_batches(session_cls_mock, mocker) -> None:
+    driver = AsyncGraphDatabase.driver("bolt://localhost")
+    rows = (str(i) for i in range(5))
+
+    async with driver as driver:
+        with pytest.warns(PreviewWarning, match="bulk_write"):
+            res = await driver.bulk_write(
+                "QUERY", rows, parameter_name_="batch", batch_bytes_=4
+            )
+
+    session_cls_mock.assert_called_once()
+    session_mock = session_cls_mock.return_value
+    session_executor_mock = session_mock._run_transaction
+    assert session_executor_mock.call_args_list == [
+        mocker.call(
+            WRITE_ACCESS,
+            TelemetryAPI.DRIVER,
+            _bulk_work,
+            ("QUERY", {"batch": batch}),
+            {},
+        )
+        for batch in (["0", "1"], ["2", "3"], ["4"])
+    ]
+    assert res == [session_executor_mock.return_value] * 3
+
+
+@mark_async_test
+async def test_bulk_write_reports_committed_batches_on_failure(
+    session_cls_mock, mocker
+) -> None:
+    driver = AsyncGraphDatabase.driver("bolt://localhost")
+    summaries = [mocker.Mock(), mocker.Mock()]
+    error = neo4j.exceptions.ClientError("oops")
+    session_executor_mock = session_cls_mock.return_value._run_transaction
+    session_executor_mock.side_effect = [*summaries, error]
+    rows = (str(i) for i in range(5))
+
+    async with driver as driver:
+        with pytest.warns(PreviewWarning, match="bulk_write"):
+            with pytest.raises(neo4j.exceptions.BulkWriteError) as exc:
+                await driver.bulk_write("QUERY", rows, batch_bytes_=4)
+
+    assert exc.value.__cause__ is error
+    assert exc.value.summaries == summaries
+    assert session_executor_mock.call_count == 3
+
+
+@mark_async_test
+async def test_bulk_write_invalid_batch_bytes(session_cls_mock) -> None:
+    driver = AsyncGraphDatabase.driver("bolt://localhost")
+
+    async with driver as driver:
+        with pytest.warns(PreviewWarning, match="bulk_write"):
+            with pytest.raises(ValueError, match="batch_bytes_"):
+                await driver.bulk_write("QUERY", [1], batch_bytes_=0)
+
+    session_cls_mock.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "query",
     (
@@ -967,7 +1426,7 @@ async def test_execute_query_query(
             query.metadata, query.timeout
         )
         unit_of_work = unit_of_work_mock.return_value
-        unit_of_work.assert_called_once_with(_work)
+        unit_of_work.assert_called_once_with(_eager_work)
         session_executor_mock.assert_awaited_once_with(
             WRITE_ACCESS,
             TelemetryAPI.DRIVER,
@@ -980,7 +1439,7 @@ async def test_execute_query_query(
         session_executor_mock.assert_awaited_once_with(
             WRITE_ACCESS,
             TelemetryAPI.DRIVER,
-            _work,
+            _eager_work,
             (query, mocker.ANY, mocker.ANY),
             {},
         )
@@ -1017,7 +1476,7 @@ async def test_execute_query_parameters(
     session_executor_mock.assert_awaited_once_with(
         WRITE_ACCESS,
         TelemetryAPI.DRIVER,
-        _work,
+        _eager_work,
         (mocker.ANY, parameters or {}, mocker.ANY),
         {},
     )
@@ -1055,7 +1514,7 @@ async def test_execute_query_keyword_parameters(
     session_executor_mock.assert_awaited_once_with(
         WRITE_ACCESS,
         TelemetryAPI.DRIVER,
-        _work,
+        _eager_work,
         (mocker.ANY, parameters or {}, mocker.ANY),
         {},
     )
@@ -1137,7 +1596,7 @@ async def test_execute_query_parameter_precedence(
     session_executor_mock.assert_awaited_once_with(
         WRITE_ACCESS,
         TelemetryAPI.DRIVER,
-        _work,
+        _eager_work,
         (mocker.ANY, expected_params, mocker.ANY),
         {},
     )
@@ -1180,7 +1639,7 @@ async def test_execute_query_routing_control(
     session_executor_mock.assert_awaited_once_with(
         mode,
         TelemetryAPI.DRIVER,
-        _work,
+        _eager_work,
         (mocker.ANY, mocker.ANY, mocker.ANY),
         {},
     )
@@ -1293,10 +1752,13 @@ async def test_execute_query_result_transformer(
     session_mock.__aenter__.assert_awaited_once()
     session_mock.__aexit__.assert_awaited_once()
     session_executor_mock = session_mock._run_transaction
+    expected_work = _work
+    if result_transformer is Ellipsis:
+        expected_work = _eager_work
     session_executor_mock.assert_awaited_once_with(
         WRITE_ACCESS,
         TelemetryAPI.DRIVER,
-        _work,
+        expected_work,
         (mocker.ANY, mocker.ANY, expected_transformer),
         {},
     )
@@ -1316,6 +1778,19 @@ async def test_supports_session_auth(session_cls_mock) -> None:
     assert res is connection_mock.supports_re_auth
 
 
+@mark_async_test
+async def test_warm_up(session_cls_mock, mocker) -> None:
+    driver = AsyncGraphDatabase.driver("bolt://localhost")
+    pool_mock = mocker.patch.object(driver, "_pool", autospec=True)
+    with pytest.warns(PreviewWarning, match="warm_up"):
+        await driver.warm_up()
+
+    session_cls_mock.assert_called_once()
+    session_mock = session_cls_mock.return_value.__aenter__.return_value
+    session_mock._connect.assert_awaited_once_with(READ_ACCESS)
+    pool_mock.warm_up.assert_awaited_once_with()
+
+
 @pytest.mark.parametrize(
     ("method_name", "args", "kwargs"),
     (
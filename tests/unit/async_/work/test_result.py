@@ -17,14 +17,17 @@
 from __future__ import annotations
 
 import datetime
+import inspect
 import logging
 import typing as t
 import uuid
 import warnings
+from array import array
 from contextlib import suppress
 from unittest import mock
 
 import pandas as pd
+import pyarrow as pa  # type: ignore[import]
 import pytest
 import pytz
 
@@ -32,6 +35,7 @@ from neo4j import (
     Address,
     AsyncResult,
     EagerResult,
+    PreviewWarning,
     Record,
     ResultSummary,
     ServerInfo,
@@ -49,6 +53,7 @@ from neo4j._data import (
 from neo4j._debug import NotificationPrinter
 from neo4j.exceptions import (
     BrokenRecordError,
+    ResultConsumedError,
     ResultNotSingleError,
 )
 from neo4j.graph import (
@@ -640,6 +645,187 @@ async def test_data(num_records):
         record.data.assert_called_once_with("hello", "world")
 
 
+@pytest.mark.parametrize("fetch_size", (1, 2, -1))
+@pytest.mark.parametrize("peek", (True, False))
+@mark_async_test
+async def test_to_columns(fetch_size, peek):
+    records = Records(
+        ["i", "f", "s", "mixed"],
+        [
+            [1, 1.5, "a", 1],
+            [2, 2.5, "b", True],
+            [3, 3.5, None, 1.0],
+        ],
+    )
+    connection = AsyncConnectionStub(records=records)
+    result = AsyncResult(connection, fetch_size, None, noop, noop)
+    await result._run("CYPHER", {}, None, None, "r", None, None, None)
+    if peek:
+        assert (await result.peek()) == Record(zip(records.fields, records[0]))
+
+    with pytest.warns(PreviewWarning, match="to_columns"):
+        columns = await result.to_columns()
+
+    assert list(columns) == ["i", "f", "s", "mixed"]
+    assert columns["i"] == array("q", [1, 2, 3])
+    assert isinstance(columns["i"], array)
+    assert columns["f"] == array("d", [1.5, 2.5, 3.5])
+    assert isinstance(columns["f"], array)
+    assert columns["s"] == ["a", "b", None]
+    assert columns["mixed"] == [1, True, 1.0]
+    assert [type(v) for v in columns["mixed"]] == [int, bool, float]
+    assert not result._record_buffer
+    assert result._exhausted
+
+
+@mark_async_test
+async def test_to_columns_empty():
+    connection = AsyncConnectionStub(records=Records(["n"], []))
+    result = AsyncResult(connection, 1, None, noop, noop)
+    await result._run("CYPHER", {}, None, None, "r", None, None, None)
+
+    with pytest.warns(PreviewWarning, match="to_columns"):
+        columns = await result.to_columns()
+
+    assert columns == {"n": []}
+
+
+@mark_async_test
+async def test_to_columns_consumed():
+    connection = AsyncConnectionStub(records=Records(["n"], [[1]]))
+    result = AsyncResult(connection, 1, None, noop, noop)
+    await result._run("CYPHER", {}, None, None, "r", None, None, None)
+    await result.consume()
+
+    with pytest.warns(PreviewWarning, match="to_columns"):
+        with pytest.raises(ResultConsumedError):
+            await result.to_columns()
+
+
+@mark_async_test
+async def test_to_arrow():
+    tz = pytz.timezone("Europe/Stockholm")
+    records = Records(
+        ["i", "f", "s", "l", "dt", "dt_tz", "d"],
+        [
+            [
+                1,
+                1.5,
+                "a",
+                [1, 2],
+                neo4j_time.DateTime(2022, 1, 2, 3, 4, 5, 123456789),
+                tz.localize(
+                    neo4j_time.DateTime(2022, 6, 2, 3, 4, 5, 123456789)
+                ),
+                neo4j_time.Date(2022, 1, 2),
+            ],
+            [2, None, None, [], None, None, None],
+        ],
+    )
+    connection = AsyncConnectionStub(records=records)
+    result = AsyncResult(connection, 1, None, noop, noop)
+    await result._run("CYPHER", {}, None, None, "r", None, None, None)
+
+    with pytest.warns(PreviewWarning, match="to_arrow"):
+        table = await result.to_arrow()
+
+    assert table.schema == pa.schema(
+        [
+            ("i", pa.int64()),
+            ("f", pa.float64()),
+            ("s", pa.string()),
+            ("l", pa.list_(pa.int64())),
+            ("dt", pa.timestamp("ns")),
+            ("dt_tz", pa.timestamp("ns", tz="Europe/Stockholm")),
+            ("d", pa.date32()),
+        ]
+    )
+    assert table.column("i").to_pylist() == [1, 2]
+    assert table.column("f").to_pylist() == [1.5, None]
+    assert table.column("s").to_pylist() == ["a", None]
+    assert table.column("l").to_pylist() == [[1, 2], []]
+    assert table.column("dt")[0].value == (
+        pd.Timestamp("2022-01-02T03:04:05.123456789").value
+    )
+    assert table.column("dt_tz")[0].value == (
+        pd.Timestamp("2022-06-02T03:04:05.123456789+02:00").value
+    )
+    assert table.column("d").to_pylist() == [datetime.date(2022, 1, 2), None]
+    assert table.column("dt")[1].as_py() is None
+    assert table.column("dt_tz")[1].as_py() is None
+
+
+@mark_async_test
+async def test_to_arrow_empty():
+    connection = AsyncConnectionStub(records=Records(["n"], []))
+    result = AsyncResult(connection, 1, None, noop, noop)
+    await result._run("CYPHER", {}, None, None, "r", None, None, None)
+
+    with pytest.warns(PreviewWarning, match="to_arrow"):
+        table = await result.to_arrow()
+
+    assert table.column_names == ["n"]
+    assert table.num_rows == 0
+
+
+@pytest.mark.parametrize(
+    ("fetch_size", "batch_sizes"),
+    (
+        (1, [1, 1, 1, 1, 1]),
+        (2, [2, 2, 1]),
+        (5, [5]),
+        (-1, [5]),
+    ),
+)
+@pytest.mark.parametrize("peek", (True, False))
+@mark_async_test
+async def test_iter_arrow_batches(fetch_size, batch_sizes, peek):
+    records = Records(["n", "s"], [[i, str(i)] for i in range(5)])
+    connection = AsyncConnectionStub(records=records)
+    result = AsyncResult(connection, fetch_size, None, noop, noop)
+    await result._run("CYPHER", {}, None, None, "r", None, None, None)
+    if peek:
+        await result.peek()
+
+    with pytest.warns(PreviewWarning, match="iter_arrow_batches"):
+        batches = [batch async for batch in result.iter_arrow_batches()]
+
+    assert [batch.num_rows for batch in batches] == batch_sizes
+    table = pa.Table.from_batches(batches)
+    assert table.column_names == ["n", "s"]
+    assert table.column("n").to_pylist() == list(range(5))
+    assert table.column("s").to_pylist() == [str(i) for i in range(5)]
+    assert result._exhausted
+
+
+@mark_async_test
+async def test_abandoned_iter_arrow_batches_leaves_result_usable():
+    records = Records(["n"], [[i] for i in range(5)])
+    connection = AsyncConnectionStub(records=records)
+    result = AsyncResult(connection, 2, None, noop, noop)
+    await result._run("CYPHER", {}, None, None, "r", None, None, None)
+
+    with pytest.warns(PreviewWarning, match="iter_arrow_batches"):
+        batches = result.iter_arrow_batches()
+        batch = await batches.__anext__()
+    assert batch.column("n").to_pylist() == [0, 1]
+    # batches is neither exhausted nor closed
+
+    assert [record["n"] async for record in result] == [2, 3, 4]
+
+
+@mark_async_test
+async def test_iter_arrow_batches_empty():
+    connection = AsyncConnectionStub(records=Records(["n"], []))
+    result = AsyncResult(connection, 1, None, noop, noop)
+    await result._run("CYPHER", {}, None, None, "r", None, None, None)
+
+    with pytest.warns(PreviewWarning, match="iter_arrow_batches"):
+        batches = [batch async for batch in result.iter_arrow_batches()]
+
+    assert batches == []
+
+
 @pytest.mark.parametrize(
     "records",
     (
@@ -1083,6 +1269,106 @@ async def test_to_df_expand(
     assert df.equals(expected_df)
 
 
+@pytest.mark.parametrize("batch_rows", (1, 2, 3, 5, 10))
+@pytest.mark.parametrize("expand", (True, False))
+@mark_async_test
+async def test_to_df_batch_rows(batch_rows, expand):
+    values = [[i, str(i), {"x": i}] for i in range(5)]
+    records = Records(["n", "s", "m"], values)
+    connection = AsyncConnectionStub(records=records)
+    result = AsyncResult(connection, 2, None, noop, noop)
+    await result._run("CYPHER", {}, None, None, "r", None, None, None)
+    with pytest.warns(PreviewWarning, match="batch_rows"):
+        df = await result.to_df(expand=expand, batch_rows=batch_rows)
+
+    if expand:
+        expected_df = pd.DataFrame(
+            [[i, str(i), i] for i in range(5)], columns=["n", "s", "m{}.x"]
+        )
+    else:
+        expected_df = pd.DataFrame(values, columns=["n", "s", "m"])
+    pd.testing.assert_frame_equal(df, expected_df)
+
+
+@pytest.mark.parametrize("batch_rows", (0, -1))
+@mark_async_test
+async def test_to_df_invalid_batch_rows(batch_rows):
+    connection = AsyncConnectionStub(records=Records(["n"], [[1]]))
+    result = AsyncResult(connection, 1, None, noop, noop)
+    await result._run("CYPHER", {}, None, None, "r", None, None, None)
+
+    with pytest.warns(PreviewWarning, match="batch_rows"):
+        with pytest.raises(ValueError, match="batch_rows"):
+            await result.to_df(batch_rows=batch_rows)
+
+
+@pytest.mark.parametrize(
+    ("fetch_size", "batch_rows", "batch_sizes"),
+    (
+        (2, None, [2, 2, 1]),
+        (-1, None, [5]),
+        (1, 2, [2, 2, 1]),
+        (2, 3, [3, 2]),
+        (-1, 2, [2, 2, 1]),
+        (-1, 1, [1, 1, 1, 1, 1]),
+        (4, 3, [3, 2]),
+        (3, 5, [5]),
+        (3, 10, [5]),
+    ),
+)
+@pytest.mark.parametrize("peek", (True, False))
+@mark_async_test
+async def test_iter_dfs(fetch_size, batch_rows, batch_sizes, peek):
+    records = Records(["n", "s"], [[i, str(i)] for i in range(5)])
+    connection = AsyncConnectionStub(records=records)
+    result = AsyncResult(connection, fetch_size, None, noop, noop)
+    await result._run("CYPHER", {}, None, None, "r", None, None, None)
+    if peek:
+        await result.peek()
+
+    with pytest.warns(PreviewWarning, match="iter_dfs"):
+        dfs = [df async for df in result.iter_dfs(batch_rows=batch_rows)]
+
+    assert [len(df) for df in dfs] == batch_sizes
+    df = pd.concat(dfs, ignore_index=True)
+    expected_df = pd.DataFrame(
+        [[i, str(i)] for i in range(5)], columns=["n", "s"]
+    )
+    pd.testing.assert_frame_equal(df, expected_df)
+    assert result._exhausted
+
+
+@mark_async_test
+async def test_iter_dfs_expand_and_parse_dates():
+    records = Records(
+        ["x"],
+        [
+            [{"dt": neo4j_time.DateTime(2022, 1, 2, 3, 4, 5, 6)}],
+            [{"dt": None}],
+        ],
+    )
+    connection = AsyncConnectionStub(records=records)
+    result = AsyncResult(connection, 1, None, noop, noop)
+    await result._run("CYPHER", {}, None, None, "r", None, None, None)
+
+    with pytest.warns(PreviewWarning, match="iter_dfs"):
+        dfs = [
+            df
+            async for df in result.iter_dfs(
+                batch_rows=2, expand=True, parse_dates=True
+            )
+        ]
+
+    assert len(dfs) == 1
+    pd.testing.assert_frame_equal(
+        dfs[0],
+        pd.DataFrame(
+            [[pd.Timestamp("2022-01-02 03:04:05.000000006")], [pd.NaT]],
+            columns=["x{}.dt"],
+        ),
+    )
+
+
 DTS_AROUND_SWEDISH_DST_CHANGE: tuple[datetime.datetime, ...] = (
     datetime.datetime(2024, 3, 31, 0, 30, 0),
     datetime.datetime(2024, 3, 31, 1, 30, 0),
@@ -1141,6 +1427,60 @@ DTS_AROUND_SWEDISH_DST_CHANGE: tuple[datetime.datetime, ...] = (
                 columns=["dt_tz"],
             ),
         ),
+        # DateTime with fixed offset and None
+        (
+            ["dt_offset"],
+            [
+                [
+                    pytz.FixedOffset(-90).localize(
+                        neo4j_time.DateTime(2022, 1, 2, 3, 4, 5, 6)
+                    ),
+                ],
+                [None],
+            ],
+            pd.DataFrame(
+                [
+                    [
+                        pytz.FixedOffset(-90).localize(
+                            pd.Timestamp("2022-01-02 03:04:05.000000006")
+                        )
+                    ],
+                    [pd.NaT],
+                ],
+                columns=["dt_offset"],
+            ),
+        ),
+        # DateTimes with different timezones
+        (
+            ["dt_tzs"],
+            [
+                [
+                    pytz.timezone("Europe/Stockholm").localize(
+                        neo4j_time.DateTime(1970, 1, 1, 0, 0, 0, 0)
+                    ),
+                ],
+                [
+                    pytz.FixedOffset(60).localize(
+                        neo4j_time.DateTime(1970, 1, 1, 0, 0, 0, 0)
+                    ),
+                ],
+            ],
+            pd.DataFrame(
+                [
+                    [
+                        pytz.timezone("Europe/Stockholm").localize(
+                            pd.Timestamp("1970-01-01")
+                        )
+                    ],
+                    [
+                        pytz.FixedOffset(60).localize(
+                            pd.Timestamp("1970-01-01")
+                        )
+                    ],
+                ],
+                columns=["dt_tzs"],
+            ),
+        ),
         # DateTime, Date, DateTime with timezone, and None
         (
             ["mixed"],
@@ -1328,6 +1668,24 @@ async def test_broken_hydration(nested):
     assert repr(b"a") in str(cause)
 
 
+@pytest.mark.parametrize("nested", [True, False])
+@mark_async_test
+async def test_broken_hydration_to_columns(nested):
+    value_in = Structure(b"a", "broken")
+    if nested:
+        value_in = [value_in]
+    records_in = Records(["foo", "bar"], [["foobar", value_in]])
+    connection = AsyncConnectionStub(records=records_in)
+    result = AsyncResult(connection, 1, None, noop, noop)
+    await result._run("CYPHER", {}, None, None, "r", None, None, None)
+    with pytest.warns(PreviewWarning, match="to_columns"):
+        with pytest.raises(BrokenRecordError) as exc:
+            await result.to_columns()
+    cause = exc.value.__cause__
+    assert isinstance(cause, ValueError)
+    assert repr(b"a") in str(cause)
+
+
 @pytest.mark.parametrize(
     (
         "notification_severity",
@@ -1380,6 +1738,35 @@ async def test_notification_warning(
         assert recording.list[0].category is expected_warning
 
 
+@mark_async_test
+async def test_notification_warning_points_to_result_creation(
+    raw_notification_factory: TRawNotificationFactory,
+    mocker,
+) -> None:
+    # capturing the whole stack is too expensive to do for every result
+    mocker.patch("inspect.stack", side_effect=AssertionError)
+    connection = AsyncConnectionStub(
+        records=Records(["foo"], ()),
+        summary_meta={
+            "notifications": [
+                raw_notification_factory(
+                    data_overwrite={"severity": "WARNING"}
+                )
+            ]
+        },
+    )
+    frame = inspect.currentframe()
+    assert frame is not None
+    creation_line = frame.f_lineno + 1
+    result = AsyncResult(connection, 1, "WARNING", noop, noop)
+    with pytest.warns(Neo4jWarning) as recording:
+        await result._run("CYPHER", {}, None, None, "r", None, None, None)
+        await result.consume()
+    assert len(recording.list) == 1
+    assert recording.list[0].filename == __file__
+    assert recording.list[0].lineno == creation_line
+
+
 @pytest.mark.parametrize("notification_severity", ("INFORMATION", "WARNING"))
 @pytest.mark.parametrize(
     "notification_category",
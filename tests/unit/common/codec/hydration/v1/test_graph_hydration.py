@@ -20,6 +20,7 @@ from neo4j._codec.hydration.v1 import HydrationHandler
 from neo4j._codec.packstream import Structure
 from neo4j.graph import (
     Node,
+    Path,
     Relationship,
 )
 
@@ -62,3 +63,27 @@ class TestGraphHydration(HydrationHandlerTestBase):
         assert rel.type == "KNOWS"
         assert set(rel.keys()) == {"since"}
         assert rel.get("since") == 1999
+
+    def test_can_hydrate_path_structure(self, hydration_scope):
+        hydrate = hydration_scope.hydration_hooks[Structure]
+        alice = hydrate(Structure(b"N", 1, ["Person"], {"name": "Alice"}))
+        bob = hydrate(Structure(b"N", 2, ["Person"], {"name": "Bob"}))
+        carol = hydrate(Structure(b"N", 3, ["Person"], {"name": "Carol"}))
+        knows = hydrate(Structure(b"r", 4, "KNOWS", {}))
+        dislikes = hydrate(Structure(b"r", 5, "DISLIKES", {}))
+        struct = Structure(
+            b"P", [alice, bob, carol], [knows, dislikes], [1, 1, -2, 2]
+        )
+        path = hydrate(struct)
+
+        assert isinstance(path, Path)
+        assert path.nodes == (alice, bob, carol)
+        assert path.relationships == (knows, dislikes)
+        assert path.start_node == alice
+        assert path.end_node == carol
+        assert len(path) == 2
+        assert knows.start_node == alice
+        assert knows.end_node == bob
+        assert dislikes.start_node == carol
+        assert dislikes.end_node == bob
+        assert path == Path(alice, knows, dislikes)
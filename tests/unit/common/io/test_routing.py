@@ -292,3 +292,34 @@ class TestRoutingTableUpdate:
     def test_update_should_replace_ttl(self, table, new_table):
         table.update(new_table)
         assert table.ttl == 300
+
+
+class TestRoutingTableUsage:
+    @pytest.fixture
+    def table(self):
+        return RoutingTable(
+            database=DEFAULT_DATABASE,
+            routers=[("192.168.1.1", 7687)],
+            readers=[("192.168.1.2", 7687)],
+            writers=[("192.168.1.3", 7687)],
+            ttl=300,
+        )
+
+    def test_new_table_should_not_be_used(self, table):
+        assert not table.used_since_update()
+
+    def test_should_be_used_after_mark_used(self, table):
+        table.mark_used()
+        assert table.used_since_update()
+
+    def test_update_should_reset_usage(self, table):
+        new_table = RoutingTable(
+            database=DEFAULT_DATABASE,
+            routers=table.routers,
+            readers=table.readers,
+            writers=table.writers,
+            ttl=300,
+        )
+        table.mark_used()
+        table.update(new_table)
+        assert not table.used_since_update()
@@ -36,6 +36,7 @@ test_session_config = {
     "initial_retry_delay": 1.0,
     "retry_delay_multiplier": 2.0,
     "retry_delay_jitter_factor": 0.2,
+    "retry_policy": None,
     "bookmarks": (),
     "default_access_mode": WRITE_ACCESS,
     "database": None,
@@ -73,6 +73,7 @@ NEO4J_ATTRIBUTES = (
     ("Record", None),
     ("Result", None),
     ("ResultSummary", None),
+    ("RetryPolicy", None),
     ("RoutingControl", None),
     ("ServerInfo", None),
     ("Session", None),
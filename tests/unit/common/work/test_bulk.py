@@ -0,0 +1,82 @@
+# Copyright (c) "Neo4j"
+# Neo4j Sweden AB [https://neo4j.com]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from io import BytesIO
+
+import pytest
+
+from neo4j._codec.packstream.v1 import Packer
+from neo4j._work.bulk import (
+    batch_rows,
+    estimate_packed_size,
+)
+
+
+@pytest.mark.parametrize(
+    "value",
+    (
+        None,
+        True,
+        0,
+        -16,
+        127,
+        -17,
+        200,
+        -40000,
+        2**31,
+        1.5,
+        "",
+        "abc",
+        "x" * 100,
+        "x" * 70000,
+        b"",
+        b"ab",
+        bytearray(300),
+        [],
+        [1, "two", 3.0],
+        list(range(20)),
+        {},
+        {"a": 1, "b": [None, "c"]},
+        {str(i): i for i in range(300)},
+    ),
+)
+def test_estimate_packed_size_matches_packstream(value) -> None:
+    stream = BytesIO()
+    Packer(stream).pack(value)
+
+    assert estimate_packed_size(value) == len(stream.getvalue())
+
+
+def test_batch_rows_respects_max_bytes() -> None:
+    rows = [{"name": "x" * 10} for _ in range(10)]
+    row_size = estimate_packed_size(rows[0])
+
+    batches = list(batch_rows(iter(rows), row_size * 3))
+
+    assert [len(batch) for batch in batches] == [3, 3, 3, 1]
+    assert [row for batch in batches for row in batch] == rows
+
+
+def test_batch_rows_oversized_row_gets_own_batch() -> None:
+    rows = ["small", "x" * 100, "small"]
+
+    batches = list(batch_rows(rows, 10))
+
+    assert batches == [["small"], ["x" * 100], ["small"]]
+
+
+def test_batch_rows_empty() -> None:
+    assert list(batch_rows([], 10)) == []
@@ -0,0 +1,120 @@
+# Copyright (c) "Neo4j"
+# Neo4j Sweden AB [https://neo4j.com]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+
+from neo4j import (
+    PreviewWarning,
+    RetryPolicy,
+)
+from neo4j.exceptions import (
+    Neo4jError,
+    ServiceUnavailable,
+)
+
+
+def _policy(**kwargs):
+    with pytest.warns(PreviewWarning, match="RetryPolicy"):
+        return RetryPolicy(**kwargs)
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    (
+        (
+            Neo4jError._hydrate_neo4j(
+                code="Neo.ClientError.Cluster.NotALeader"
+            ),
+            1.0,
+        ),
+        (
+            Neo4jError._hydrate_neo4j(
+                code="Neo.ClientError.General.ForbiddenOnReadOnlyDatabase"
+            ),
+            1.0,
+        ),
+        (ServiceUnavailable("oops"), 2.0),
+        (
+            Neo4jError._hydrate_neo4j(
+                code="Neo.TransientError.Transaction.DeadlockDetected"
+            ),
+            3.0,
+        ),
+    ),
+)
+@pytest.mark.parametrize("attempt", (1, 2, 3))
+def test_retry_delay_by_error_kind(error, expected, attempt) -> None:
+    policy = _policy(
+        leader_switch_delay=1.0,
+        connectivity_delay=2.0,
+        transient_delay=3.0,
+        multiplier=1.5,
+        jitter_factor=0,
+    )
+
+    delay = policy.retry_delay(error, attempt)
+
+    assert delay == pytest.approx(expected * 1.5 ** (attempt - 1))
+
+
+def test_retry_delay_jitter() -> None:
+    policy = _policy(connectivity_delay=1.0, jitter_factor=0.5)
+
+    for _ in range(100):
+        delay = policy.retry_delay(ServiceUnavailable("oops"), 1)
+        assert 0.5 <= delay <= 1.5
+
+
+def test_retries_unlimited_without_budget() -> None:
+    policy = _policy()
+
+    for _ in range(100):
+        assert policy._acquire_retry(0.5)
+
+    assert policy.retry_count == 100
+    assert policy.denied_retry_count == 0
+    assert policy.retry_time == pytest.approx(50)
+
+
+def test_retry_budget() -> None:
+    policy = _policy(retry_budget_ratio=0.5, retry_budget_max_tokens=2)
+
+    # the bucket starts full
+    assert policy._acquire_retry(1)
+    assert policy._acquire_retry(1)
+    assert not policy._acquire_retry(1)
+
+    # two successes earn one retry
+    policy._on_success()
+    assert not policy._acquire_retry(1)
+    policy._on_success()
+    assert policy._acquire_retry(1)
+    assert not policy._acquire_retry(1)
+
+    assert policy.retry_count == 3
+    assert policy.denied_retry_count == 3
+    assert policy.retry_time == 3
+
+
+def test_retry_budget_is_capped() -> None:
+    policy = _policy(retry_budget_ratio=1, retry_budget_max_tokens=2)
+
+    for _ in range(10):
+        policy._on_success()
+
+    assert policy._acquire_retry(1)
+    assert policy._acquire_retry(1)
+    assert not policy._acquire_retry(1)
@@ -0,0 +1,544 @@
+# Copyright (c) "Neo4j"
+# Neo4j Sweden AB [https://neo4j.com]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import socket
+import threading
+import time
+
+import pytest
+
+from neo4j._async_compat.network import (
+    AsyncBoltSocket,
+    BoltSocket,
+    DnsCache,
+    SocketOptions,
+    TlsSessionCache,
+)
+from neo4j._async_compat.network._bolt_socket import (
+    _interleave_address_families,
+    _SessionResumingSSLContext,
+)
+from neo4j._deadline import Deadline
+from neo4j.addressing import (
+    Address,
+    ResolvedAddress,
+)
+from neo4j.exceptions import ServiceUnavailable
+
+
+SLOW_ADDRESS = ResolvedAddress(("127.0.0.1", 7687), host_name="host")
+FAST_ADDRESS = ResolvedAddress(("127.0.0.2", 7687), host_name="host")
+
+
+def _resolver(*addresses):
+    def resolver(address):
+        return [Address(address_) for address_ in addresses]
+
+    return resolver
+
+
+def _connect_kwargs(*addresses):
+    return {
+        "tcp_timeout": 30,
+        "deadline": Deadline(None),
+        "custom_resolver": _resolver(*addresses),
+        "ssl_context": None,
+        "keep_alive": True,
+    }
+
+
+def test_interleave_address_families():
+    v4_1 = ResolvedAddress(("127.0.0.1", 7687), host_name="host")
+    v4_2 = ResolvedAddress(("127.0.0.2", 7687), host_name="host")
+    v6_1 = ResolvedAddress(("::1", 7687, 0, 0), host_name="host")
+    v6_2 = ResolvedAddress(("::2", 7687, 0, 0), host_name="host")
+    v6_3 = ResolvedAddress(("::3", 7687, 0, 0), host_name="host")
+
+    assert _interleave_address_families([v6_1, v6_2, v6_3, v4_1, v4_2]) == [
+        v6_1,
+        v4_1,
+        v6_2,
+        v4_2,
+        v6_3,
+    ]
+    assert _interleave_address_families([v4_1, v6_1, v4_2]) == [
+        v4_1,
+        v6_1,
+        v4_2,
+    ]
+    assert _interleave_address_families([]) == []
+
+
+@pytest.mark.asyncio
+async def test_async_connect_does_not_wait_for_slow_address(mocker):
+    slow_cancelled = False
+    winner = mocker.AsyncMock(spec=AsyncBoltSocket)
+    winner._handshake.return_value = (winner, (5, 0), None, None)
+
+    async def connect_secure(
+        resolved_address, timeout, keep_alive, ssl, **kwargs
+    ):
+        nonlocal slow_cancelled
+        if resolved_address == SLOW_ADDRESS:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                slow_cancelled = True
+                raise
+        return winner
+
+    mocker.patch.object(
+        AsyncBoltSocket, "_connect_secure", side_effect=connect_secure
+    )
+    mocker.patch(
+        "neo4j._async_compat.network._bolt_socket._CONNECTION_ATTEMPT_DELAY",
+        0.01,
+    )
+
+    res = await AsyncBoltSocket.connect(
+        ("host", 7687), **_connect_kwargs(SLOW_ADDRESS, FAST_ADDRESS)
+    )
+
+    assert res == (winner, (5, 0), None, None)
+    assert slow_cancelled
+    winner.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_connect_closes_losing_connections(mocker):
+    sockets = {}
+
+    async def connect_secure(
+        resolved_address, timeout, keep_alive, ssl, **kwargs
+    ):
+        socket_ = mocker.AsyncMock(spec=AsyncBoltSocket)
+        socket_._handshake.return_value = (socket_, (5, 0), None, None)
+        sockets[resolved_address] = socket_
+        return socket_
+
+    mocker.patch.object(
+        AsyncBoltSocket, "_connect_secure", side_effect=connect_secure
+    )
+    mocker.patch(
+        "neo4j._async_compat.network._bolt_socket._CONNECTION_ATTEMPT_DELAY",
+        0,
+    )
+
+    res = await AsyncBoltSocket.connect(
+        ("host", 7687), **_connect_kwargs(SLOW_ADDRESS, FAST_ADDRESS)
+    )
+
+    assert res[0] is sockets[SLOW_ADDRESS]
+    sockets[SLOW_ADDRESS].close.assert_not_called()
+    if FAST_ADDRESS in sockets:
+        sockets[FAST_ADDRESS].close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_connect_all_addresses_failing(mocker):
+    async def connect_secure(
+        resolved_address, timeout, keep_alive, ssl, **kwargs
+    ):
+        raise ServiceUnavailable(f"oops {resolved_address}")
+
+    mocker.patch.object(
+        AsyncBoltSocket, "_connect_secure", side_effect=connect_secure
+    )
+
+    with pytest.raises(ServiceUnavailable, match="Couldn't connect") as exc:
+        await AsyncBoltSocket.connect(
+            ("host", 7687), **_connect_kwargs(SLOW_ADDRESS, FAST_ADDRESS)
+        )
+
+    assert str(SLOW_ADDRESS) in str(exc.value)
+    assert str(FAST_ADDRESS) in str(exc.value)
+
+
+def test_connect_does_not_wait_for_slow_address(mocker):
+    slow_connect = threading.Event()
+    slow_socket = mocker.Mock()
+    fast_socket = mocker.Mock()
+
+    def connect(resolved_address, timeout, keep_alive, socket_options=None):
+        if resolved_address == SLOW_ADDRESS:
+            slow_connect.wait(10)
+            return slow_socket
+        return fast_socket
+
+    def handshake(s, resolved_address, deadline):
+        return s, (5, 0), None, None
+
+    mocker.patch.object(BoltSocket, "_connect", side_effect=connect)
+    mocker.patch.object(
+        BoltSocket, "_secure", side_effect=lambda s, *_, **__: s
+    )
+    mocker.patch.object(BoltSocket, "_handshake", side_effect=handshake)
+    close_mock = mocker.patch.object(BoltSocket, "close_socket")
+    mocker.patch(
+        "neo4j._async_compat.network._bolt_socket._CONNECTION_ATTEMPT_DELAY",
+        0.01,
+    )
+
+    res = BoltSocket.connect(
+        ("host", 7687), **_connect_kwargs(SLOW_ADDRESS, FAST_ADDRESS)
+    )
+
+    assert res == (fast_socket, (5, 0), None, None)
+    close_mock.assert_not_called()
+    # the slow attempt completes after the race is decided => it's closed
+    slow_connect.set()
+    for _ in range(100):
+        if close_mock.called:
+            break
+        threading.Event().wait(0.05)
+    close_mock.assert_called_once_with(slow_socket)
+
+
+def test_connect_all_addresses_failing(mocker):
+    def connect(resolved_address, timeout, keep_alive, socket_options=None):
+        raise ServiceUnavailable(f"oops {resolved_address}")
+
+    mocker.patch.object(BoltSocket, "_connect", side_effect=connect)
+
+    with pytest.raises(ServiceUnavailable, match="Couldn't connect") as exc:
+        BoltSocket.connect(
+            ("host", 7687), **_connect_kwargs(SLOW_ADDRESS, FAST_ADDRESS)
+        )
+
+    assert str(SLOW_ADDRESS) in str(exc.value)
+    assert str(FAST_ADDRESS) in str(exc.value)
+
+
+@pytest.mark.asyncio
+async def test_async_connect_invalidates_dns_cache_on_failure(mocker):
+    async def connect_secure(
+        resolved_address, timeout, keep_alive, ssl, **kwargs
+    ):
+        raise ServiceUnavailable(f"oops {resolved_address}")
+
+    mocker.patch.object(
+        AsyncBoltSocket, "_connect_secure", side_effect=connect_secure
+    )
+    dns_cache = DnsCache(ttl=60)
+    invalidate = mocker.spy(dns_cache, "invalidate")
+
+    with pytest.raises(ServiceUnavailable):
+        await AsyncBoltSocket.connect(
+            ("host", 7687),
+            **_connect_kwargs(SLOW_ADDRESS, FAST_ADDRESS),
+            dns_cache=dns_cache,
+        )
+
+    invalidated = {call.args[0] for call in invalidate.call_args_list}
+    assert invalidated == {SLOW_ADDRESS, FAST_ADDRESS}
+
+
+def test_connect_invalidates_dns_cache_on_failure(mocker):
+    def connect(resolved_address, timeout, keep_alive, socket_options=None):
+        raise ServiceUnavailable(f"oops {resolved_address}")
+
+    mocker.patch.object(BoltSocket, "_connect", side_effect=connect)
+    dns_cache = DnsCache(ttl=60)
+    invalidate = mocker.spy(dns_cache, "invalidate")
+
+    with pytest.raises(ServiceUnavailable):
+        BoltSocket.connect(
+            ("host", 7687),
+            **_connect_kwargs(SLOW_ADDRESS, FAST_ADDRESS),
+            dns_cache=dns_cache,
+        )
+
+    invalidated = {call.args[0] for call in invalidate.call_args_list}
+    assert invalidated == {SLOW_ADDRESS, FAST_ADDRESS}
+
+
+@pytest.mark.asyncio
+async def test_async_dns_cache_merges_concurrent_misses():
+    cache = DnsCache(ttl=60)
+    address = Address(("example.com", 7687))
+    calls = 0
+
+    async def resolver():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return [SLOW_ADDRESS]
+
+    results = await asyncio.gather(
+        *(cache.async_resolve(address, 0, resolver) for _ in range(5))
+    )
+
+    assert calls == 1
+    assert results == [[SLOW_ADDRESS]] * 5
+    # other families are resolved separately
+    await cache.async_resolve(address, socket.AF_INET6, resolver)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_async_dns_cache_shares_resolution_errors():
+    cache = DnsCache(ttl=60)
+    address = Address(("example.com", 7687))
+    calls = 0
+
+    async def resolver():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        raise ValueError("oops")
+
+    results = await asyncio.gather(
+        *(cache.async_resolve(address, 0, resolver) for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert calls == 1
+    assert all(isinstance(res, ValueError) for res in results)
+    # failures are not cached
+    with pytest.raises(ValueError):
+        await cache.async_resolve(address, 0, resolver)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_async_dns_cache_survives_cancelled_resolution():
+    cache = DnsCache(ttl=60)
+    address = Address(("example.com", 7687))
+    started = asyncio.Event()
+
+    async def slow_resolver():
+        started.set()
+        await asyncio.sleep(10)
+        return [SLOW_ADDRESS]
+
+    async def fast_resolver():
+        return [FAST_ADDRESS]
+
+    leader = asyncio.ensure_future(
+        cache.async_resolve(address, 0, slow_resolver)
+    )
+    await started.wait()
+    follower = asyncio.ensure_future(
+        cache.async_resolve(address, 0, fast_resolver)
+    )
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    # the follower takes over instead of being cancelled as well
+    assert await follower == [FAST_ADDRESS]
+    assert leader.cancelled()
+
+
+def test_dns_cache_merges_concurrent_misses():
+    cache = DnsCache(ttl=60)
+    address = Address(("example.com", 7687))
+    calls = 0
+    started = threading.Event()
+    release = threading.Event()
+    results = []
+
+    def resolver():
+        nonlocal calls
+        calls += 1
+        started.set()
+        release.wait(10)
+        return [SLOW_ADDRESS]
+
+    def resolve():
+        results.append(cache.resolve(address, 0, resolver))
+
+    threads = [threading.Thread(target=resolve) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    started.wait(10)
+    # give the other threads time to find the resolution in progress
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == 1
+    assert results == [[SLOW_ADDRESS]] * 5
+
+
+def test_tls_session_cache(mocker):
+    cache = TlsSessionCache()
+    ssl_context = mocker.sentinel.ssl_context
+    session = mocker.sentinel.session
+
+    assert cache.get(SLOW_ADDRESS, ssl_context) is None
+    cache.put(SLOW_ADDRESS, ssl_context, session)
+    assert cache.get(SLOW_ADDRESS, ssl_context) is session
+    # sessions can only be resumed with the context that created them
+    assert cache.get(SLOW_ADDRESS, mocker.sentinel.other_context) is None
+    assert cache.get(FAST_ADDRESS, ssl_context) is None
+    cache.invalidate(SLOW_ADDRESS)
+    assert cache.get(SLOW_ADDRESS, ssl_context) is None
+
+
+def test_session_resuming_ssl_context_passes_session(mocker):
+    ssl_context = mocker.Mock()
+    proxy = _SessionResumingSSLContext(ssl_context, mocker.sentinel.session)
+
+    proxy.wrap_bio(
+        mocker.sentinel.incoming,
+        mocker.sentinel.outgoing,
+        server_hostname="host",
+    )
+
+    ssl_context.wrap_bio.assert_called_once_with(
+        mocker.sentinel.incoming,
+        mocker.sentinel.outgoing,
+        server_side=False,
+        server_hostname="host",
+        session=mocker.sentinel.session,
+    )
+    assert proxy.check_hostname is ssl_context.check_hostname
+
+
+@pytest.mark.asyncio
+async def test_async_connect_resumes_tls_session(mocker):
+    tls_sessions = []
+    socket_ = mocker.AsyncMock(spec=AsyncBoltSocket)
+    socket_._handshake.return_value = (socket_, (5, 0), None, None)
+    socket_._tls_session = mocker.Mock(return_value=mocker.sentinel.session)
+
+    async def connect_secure(
+        resolved_address, timeout, keep_alive, ssl, **kwargs
+    ):
+        tls_sessions.append(kwargs["tls_session"])
+        return socket_
+
+    mocker.patch.object(
+        AsyncBoltSocket, "_connect_secure", side_effect=connect_secure
+    )
+    cache = TlsSessionCache()
+    kwargs = {
+        **_connect_kwargs(SLOW_ADDRESS),
+        "ssl_context": mocker.sentinel.ssl_context,
+        "tls_session_cache": cache,
+    }
+
+    await AsyncBoltSocket.connect(("host", 7687), **kwargs)
+    await AsyncBoltSocket.connect(("host", 7687), **kwargs)
+
+    assert tls_sessions == [None, mocker.sentinel.session]
+
+
+def test_connect_resumes_tls_session(mocker):
+    socket_ = mocker.Mock()
+    socket_.session = mocker.sentinel.session
+    secure_mock = mocker.patch.object(
+        BoltSocket, "_secure", side_effect=lambda s, *_, **__: s
+    )
+    mocker.patch.object(BoltSocket, "_connect", return_value=socket_)
+    mocker.patch.object(
+        BoltSocket,
+        "_handshake",
+        side_effect=lambda s, *_: (s, (5, 0), None, None),
+    )
+    cache = TlsSessionCache()
+    kwargs = {
+        **_connect_kwargs(SLOW_ADDRESS),
+        "ssl_context": mocker.sentinel.ssl_context,
+        "tls_session_cache": cache,
+    }
+
+    BoltSocket.connect(("host", 7687), **kwargs)
+    BoltSocket.connect(("host", 7687), **kwargs)
+
+    sessions = [call.kwargs["session"] for call in secure_mock.mock_calls]
+    assert sessions == [None, mocker.sentinel.session]
+
+
+@pytest.mark.asyncio
+async def test_async_connect_invalidates_tls_session_on_failure(mocker):
+    async def connect_secure(
+        resolved_address, timeout, keep_alive, ssl, **kwargs
+    ):
+        raise ServiceUnavailable(f"oops {resolved_address}")
+
+    mocker.patch.object(
+        AsyncBoltSocket, "_connect_secure", side_effect=connect_secure
+    )
+    cache = TlsSessionCache()
+    ssl_context = mocker.sentinel.ssl_context
+    cache.put(SLOW_ADDRESS, ssl_context, mocker.sentinel.session)
+
+    with pytest.raises(ServiceUnavailable):
+        await AsyncBoltSocket.connect(
+            ("host", 7687),
+            **{
+                **_connect_kwargs(SLOW_ADDRESS),
+                "ssl_context": ssl_context,
+                "tls_session_cache": cache,
+            },
+        )
+
+    assert cache.get(SLOW_ADDRESS, ssl_context) is None
+
+
+def test_socket_options_apply():
+    options = SocketOptions(
+        tcp_no_delay=True,
+        receive_buffer_size=32768,
+        send_buffer_size=32768,
+        keep_alive_interval=10,
+    )
+    with socket.socket(socket.AF_INET) as s:
+        options.apply(s)
+
+        assert s.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        # the OS may round (e.g., Linux doubles) the buffer sizes
+        assert s.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) >= 32768
+        assert s.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF) >= 32768
+        if hasattr(socket, "TCP_KEEPINTVL"):
+            assert s.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL) == 10
+
+
+@pytest.mark.skipif(
+    not hasattr(socket, "TCP_USER_TIMEOUT"),
+    reason="TCP_USER_TIMEOUT not supported on this platform",
+)
+def test_socket_options_apply_tcp_user_timeout():
+    options = SocketOptions(tcp_user_timeout=1.5)
+    with socket.socket(socket.AF_INET) as s:
+        options.apply(s)
+
+        assert (
+            s.getsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT) == 1500
+        )
+
+
+def test_socket_options_apply_defaults():
+    with socket.socket(socket.AF_INET) as s:
+        default_rcvbuf = s.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+        SocketOptions().apply(s)
+
+        assert s.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        assert (
+            s.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) == default_rcvbuf
+        )
+
+
+def test_socket_options_ignore_unsupported_options(mocker):
+    s = mocker.Mock()
+    s.setsockopt.side_effect = OSError("not supported")
+
+    SocketOptions(receive_buffer_size=1024).apply(s)
+
+    assert s.setsockopt.call_count == 2
@@ -15,10 +15,20 @@
 
 
 import asyncio
+import threading
+import time
 
 import pytest
 
-from neo4j._async_compat.concurrency import AsyncRLock
+from neo4j._async_compat.concurrency import (
+    async_bounded_as_completed,
+    async_staggered_race,
+    AsyncPeriodicWorker,
+    AsyncRLock,
+    bounded_as_completed,
+    PeriodicWorker,
+    staggered_race,
+)
 
 
 @pytest.mark.asyncio
@@ -253,3 +263,319 @@ async def test_async_r_lock_acquire_cancellation(waits):
     fut.cancel()
     with pytest.raises(asyncio.CancelledError):
         await fut
+
+
+@pytest.mark.asyncio
+async def test_async_periodic_worker():
+    calls = 0
+    called = asyncio.Event()
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        called.set()
+        return 0
+
+    worker = AsyncPeriodicWorker(work)
+    assert not worker.running
+    worker.ensure_started()
+    worker.ensure_started()
+    assert worker.running
+    await called.wait()
+    await worker.stop()
+    assert not worker.running
+    calls_after_stop = calls
+    assert calls_after_stop >= 1
+    worker.ensure_started()
+    assert not worker.running
+    await asyncio.sleep(0)
+    assert calls == calls_after_stop
+
+
+def test_periodic_worker():
+    calls = 0
+    called = threading.Event()
+
+    def work():
+        nonlocal calls
+        calls += 1
+        called.set()
+        return 0.01
+
+    worker = PeriodicWorker(work)
+    assert not worker.running
+    worker.ensure_started()
+    worker.ensure_started()
+    assert worker.running
+    assert called.wait(5)
+    worker.stop()
+    assert not worker.running
+    calls_after_stop = calls
+    assert calls_after_stop >= 1
+    worker.ensure_started()
+    assert not worker.running
+    assert calls == calls_after_stop
+
+
+def test_periodic_worker_stop_does_not_wait_forever():
+    calls = 0
+    started = threading.Event()
+    release = threading.Event()
+    thread = None
+
+    def work():
+        nonlocal calls, thread
+        calls += 1
+        thread = threading.current_thread()
+        started.set()
+        release.wait(10)
+        return 0
+
+    worker = PeriodicWorker(work, stop_timeout=0.05)
+    worker.ensure_started()
+    assert started.wait(5)
+
+    start = time.monotonic()
+    worker.stop()
+    assert time.monotonic() - start < 5
+    assert not worker.running
+
+    release.set()
+    assert thread is not None
+    thread.join(5)
+    assert not thread.is_alive()
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_async_staggered_race_first_success_wins():
+    slow_cancelled = False
+
+    async def slow():
+        nonlocal slow_cancelled
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            slow_cancelled = True
+            raise
+        return "slow"
+
+    async def failing():
+        return None
+
+    async def fast():
+        return "fast"
+
+    cancelled = []
+    res = await async_staggered_race(
+        (slow, failing, fast), 0.01, cancel=cancelled.append
+    )
+
+    assert res == (2, "fast")
+    assert slow_cancelled
+    assert cancelled == [0]
+
+
+@pytest.mark.asyncio
+async def test_async_staggered_race_all_failing():
+    async def failing():
+        return None
+
+    assert await async_staggered_race((), 0.01) == (None, None)
+    assert await async_staggered_race((failing, failing), 10) == (None, None)
+
+
+@pytest.mark.asyncio
+async def test_async_staggered_race_propagates_errors():
+    async def slow():
+        await asyncio.sleep(10)
+
+    async def raising():
+        raise ValueError("oops")
+
+    with pytest.raises(ValueError, match="oops"):
+        await async_staggered_race((slow, raising), 0.01)
+
+
+@pytest.mark.asyncio
+async def test_async_staggered_race_discards_losers():
+    discarded = []
+
+    async def discard(result):
+        discarded.append(result)
+
+    async def fast(result):
+        return result
+
+    res = await async_staggered_race(
+        (lambda: fast("a"), lambda: fast("b")), 0, discard=discard
+    )
+
+    assert res == (0, "a")
+    assert discarded in ([], ["b"])
+
+
+def test_staggered_race_first_success_wins():
+    slow_done = threading.Event()
+    cancelled = []
+
+    def slow():
+        if slow_done.wait(10):
+            return None
+        return "slow"
+
+    def failing():
+        return None
+
+    def fast():
+        return "fast"
+
+    def cancel(index):
+        cancelled.append(index)
+        slow_done.set()
+
+    res = staggered_race((slow, failing, fast), 0.01, cancel=cancel)
+
+    assert res == (2, "fast")
+    assert cancelled == [0]
+
+
+def test_staggered_race_joins_losers():
+    slow_done = threading.Event()
+    slow_thread = None
+
+    def slow():
+        nonlocal slow_thread
+        slow_thread = threading.current_thread()
+        slow_done.wait(10)
+
+    def fast():
+        return "fast"
+
+    res = staggered_race((slow, fast), 0, cancel=lambda _: slow_done.set())
+
+    assert res == (1, "fast")
+    assert slow_thread is not None
+    assert not slow_thread.is_alive()
+
+
+def test_staggered_race_all_failing():
+    def failing():
+        return None
+
+    assert staggered_race((), 0.01) == (None, None)
+    assert staggered_race((failing, failing), 10) == (None, None)
+
+
+def test_staggered_race_propagates_errors():
+    def raising():
+        raise ValueError("oops")
+
+    with pytest.raises(ValueError, match="oops"):
+        staggered_race((raising, raising), 0.01)
+
+
+def test_staggered_race_discards_late_losers():
+    discarded = []
+    slow_started = threading.Event()
+
+    def slow():
+        slow_started.set()
+        time.sleep(0.1)
+        return "slow"
+
+    def fast():
+        slow_started.wait(10)
+        return "fast"
+
+    res = staggered_race((slow, fast), 0, discard=discarded.append)
+
+    assert res == (1, "fast")
+    for _ in range(100):
+        if discarded:
+            break
+        time.sleep(0.05)
+    assert discarded == ["slow"]
+
+
+@pytest.mark.asyncio
+async def test_async_bounded_as_completed_limits_concurrency():
+    running = max_running = 0
+
+    async def call(delay):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(delay)
+        running -= 1
+        return delay
+
+    delays = [0.05, 0.01, 0.03, 0.02, 0]
+    calls = (lambda delay=delay: call(delay) for delay in delays)
+
+    res = [item async for item in async_bounded_as_completed(calls, 2)]
+
+    assert max_running == 2
+    assert sorted(res) == sorted(enumerate(delays))
+    assert res[0] == (1, 0.01)
+
+
+@pytest.mark.asyncio
+async def test_async_bounded_as_completed_propagates_errors():
+    slow_cancelled = False
+
+    async def slow():
+        nonlocal slow_cancelled
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            slow_cancelled = True
+            raise
+
+    async def raising():
+        raise ValueError("oops")
+
+    with pytest.raises(ValueError, match="oops"):
+        async for _ in async_bounded_as_completed((slow, raising), 2):
+            pass
+
+    assert slow_cancelled
+
+
+def test_bounded_as_completed_limits_concurrency():
+    lock = threading.Lock()
+    running = max_running = 0
+
+    def call(delay):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(delay)
+        with lock:
+            running -= 1
+        return delay
+
+    delays = [0.05, 0.01, 0.03, 0.02, 0]
+    calls = (lambda delay=delay: call(delay) for delay in delays)
+
+    res = list(bounded_as_completed(calls, 2))
+
+    assert max_running <= 2
+    assert sorted(res) == sorted(enumerate(delays))
+
+
+def test_bounded_as_completed_propagates_errors():
+    started = []
+
+    def raising():
+        started.append("raising")
+        raise ValueError("oops")
+
+    def other():
+        started.append("other")
+
+    with pytest.raises(ValueError, match="oops"):
+        list(bounded_as_completed((raising, other), 1))
+
+    assert started == ["raising"]
@@ -24,7 +24,10 @@ from neo4j._api import TelemetryAPI
 from neo4j._meta import USER_AGENT
 from neo4j._sync.config import PoolConfig
 from neo4j._sync.io._bolt5 import Bolt5x0
-from neo4j.exceptions import ConfigurationError
+from neo4j.exceptions import (
+    ConfigurationError,
+    ServiceUnavailable,
+)
 
 from ...._async_compat import mark_sync_test
 from ....iter_util import powerset
@@ -685,6 +688,42 @@ def test_tracks_last_database(fake_socket_pair, actions):
         assert connection.last_database == db
 
 
+@pytest.mark.parametrize("success", (True, False))
+@mark_sync_test
+def test_deferred_reset(fake_socket_pair, success):
+    address = neo4j.Address(("127.0.0.1", 7687))
+    sockets = fake_socket_pair(
+        address,
+        packer_cls=Bolt5x0.PACKER_CLS,
+        unpacker_cls=Bolt5x0.UNPACKER_CLS,
+    )
+    connection = Bolt5x0(address, sockets.client, 0)
+
+    connection.reset(deferred=True)
+
+    tag, _ = sockets.server.pop_message()
+    assert tag == b"\x0f"
+    assert len(connection.responses) == 1
+    assert connection.is_reset
+
+    if success:
+        sockets.server.send_message(b"\x70", {})
+    else:
+        sockets.server.send_message(
+            b"\x7f", {"code": "Neo.TransientError.Made.Up", "message": "oh"}
+        )
+    sockets.server.send_message(b"\x70", {})
+    connection.begin()
+    connection.send_all()
+    if success:
+        connection.fetch_all()
+        assert not connection.responses
+    else:
+        with pytest.raises(ServiceUnavailable):
+            connection.fetch_all()
+        assert connection.closed()
+
+
 @pytest.mark.parametrize(
     "sent_diag_records",
     powerset(
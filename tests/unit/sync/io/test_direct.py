@@ -206,6 +206,65 @@ def test_pool_max_conn_pool_size(fake_connection_generator):
         assert pool.in_use_connection_count(address) == 1
 
 
+@mark_sync_test
+def test_pool_max_pending_connections(fake_connection_generator):
+    with FakeBoltPool(
+        fake_connection_generator, (), max_pending_connections=1
+    ) as pool:
+        address = neo4j.Address(("127.0.0.1", 7687))
+        # simulate another connection being opened
+        pool.connections_reservations[address] += 1
+        assert pool._acquire_new_later(address, None, Deadline(0)) is None
+        with pytest.raises(ClientError):
+            pool._acquire(address, None, Deadline(0), None)
+        assert pool.in_use_connection_count(address) == 0
+
+        pool.connections_reservations[address] -= 1
+        pool._acquire(address, None, Deadline(0), None)
+        assert pool.in_use_connection_count(address) == 1
+        assert not pool.waiters
+
+
+@mark_sync_test
+def test_pool_serves_waiters_in_order(fake_connection_generator):
+    with FakeBoltPool(
+        fake_connection_generator,
+        (),
+        max_connection_pool_size=1,
+        max_pending_connections=1,
+    ) as pool:
+        address = neo4j.Address(("127.0.0.1", 7687))
+        cx1 = pool._acquire(address, None, Deadline(0), None)
+        # simulate another acquisition that's been waiting for longer
+        older_waiter = object()
+        pool.waiters[address].append(older_waiter)
+        pool.release(cx1)
+
+        # the idle connection is reserved for the older waiter
+        with pytest.raises(ClientError):
+            pool._acquire(address, None, Deadline(0.1), None)
+        assert list(pool.waiters[address]) == [older_waiter]
+        assert pool.in_use_connection_count(address) == 0
+
+        pool.waiters[address].remove(older_waiter)
+        cx2 = pool._acquire(address, None, Deadline(3), None)
+        assert cx2 is cx1
+
+
+@mark_sync_test
+def test_pool_does_not_queue_waiters_by_default(
+    fake_connection_generator,
+):
+    with FakeBoltPool(
+        fake_connection_generator, (), max_connection_pool_size=1
+    ) as pool:
+        address = neo4j.Address(("127.0.0.1", 7687))
+        pool._acquire(address, None, Deadline(0), None)
+        with pytest.raises(ClientError):
+            pool._acquire(address, None, Deadline(0), None)
+        assert not pool.waiters
+
+
 @pytest.mark.parametrize("is_reset", (True, False))
 @mark_sync_test
 def test_pool_reset_when_released(
@@ -22,7 +22,10 @@ from neo4j import (
     Address,
     IPv4Address,
 )
-from neo4j._async_compat.network import NetworkUtil
+from neo4j._async_compat.network import (
+    DnsCache,
+    NetworkUtil,
+)
 from neo4j._async_compat.util import Util
 
 from ..._async_compat import mark_sync_test
@@ -114,3 +117,76 @@ def test_address_unresolve() -> None:
     resolved_classes = [a.__class__ for a in custom_resolved_addresses]
     unresolved_classes = [a.__class__ for a in unresolved_list]
     assert resolved_classes == unresolved_classes
+
+
+@mark_sync_test
+def test_address_resolve_uses_dns_cache(mocker) -> None:
+    info = [(AF_INET, 1, 6, "", ("127.0.0.1", 7687))]
+    get_address_info = mocker.patch.object(
+        NetworkUtil, "get_address_info", return_value=info
+    )
+    resolver = mocker.Mock(return_value=[("example.com", 7687)])
+    cache = DnsCache(ttl=60)
+    address = Address(("example.com", 7687))
+
+    for _ in range(3):
+        resolved = Util.list(
+            NetworkUtil.resolve_address(
+                address, resolver=resolver, cache=cache
+            )
+        )
+        assert resolved == [IPv4Address(("127.0.0.1", 7687))]
+
+    get_address_info.assert_called_once()
+    # custom resolvers are never cached
+    assert resolver.call_count == 3
+
+
+@mark_sync_test
+def test_address_resolve_dns_cache_expires(mocker) -> None:
+    info = [(AF_INET, 1, 6, "", ("127.0.0.1", 7687))]
+    get_address_info = mocker.patch.object(
+        NetworkUtil, "get_address_info", return_value=info
+    )
+    monotonic = mocker.patch(
+        "neo4j._async_compat.network._util.monotonic", return_value=0
+    )
+    cache = DnsCache(ttl=10)
+    address = Address(("example.com", 7687))
+
+    Util.list(
+        NetworkUtil.resolve_address(address, cache=cache)
+    )
+    monotonic.return_value = 9
+    Util.list(
+        NetworkUtil.resolve_address(address, cache=cache)
+    )
+    assert get_address_info.call_count == 1
+    monotonic.return_value = 10
+    Util.list(
+        NetworkUtil.resolve_address(address, cache=cache)
+    )
+    assert get_address_info.call_count == 2
+
+
+@mark_sync_test
+def test_address_resolve_dns_cache_invalidate(mocker) -> None:
+    info = [
+        (AF_INET, 1, 6, "", ("127.0.0.1", 7687)),
+        (AF_INET, 1, 6, "", ("127.0.0.2", 7687)),
+    ]
+    get_address_info = mocker.patch.object(
+        NetworkUtil, "get_address_info", return_value=info
+    )
+    cache = DnsCache(ttl=60)
+    address = Address(("example.com", 7687))
+
+    resolved = Util.list(
+        NetworkUtil.resolve_address(address, cache=cache)
+    )
+    cache.invalidate(resolved[1])
+    Util.list(
+        NetworkUtil.resolve_address(address, cache=cache)
+    )
+
+    assert get_address_info.call_count == 2
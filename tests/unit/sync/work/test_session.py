@@ -21,12 +21,15 @@ import pytest
 from neo4j import (
     Bookmarks,
     ManagedTransaction,
+    PreviewWarning,
+    RetryPolicy,
     Session,
     Transaction,
     unit_of_work,
 )
 from neo4j._api import TelemetryAPI
 from neo4j._conf import SessionConfig
+from neo4j._sync.driver import _bulk_work
 from neo4j._sync.io import (
     BoltPool,
     Neo4jPool,
@@ -36,6 +39,7 @@ from neo4j.api import (
     READ_ACCESS,
     WRITE_ACCESS,
 )
+from neo4j.exceptions import Neo4jError
 
 from ...._async_compat import mark_sync_test
 
@@ -699,3 +703,167 @@ def test_session_custom_api_telemetry(fake_pool, mode):
         connection_mock.telemetry.assert_called_once()
         call_args = connection_mock.telemetry.call_args.args
         assert call_args[0] == TelemetryAPI.DRIVER
+
+
+def _transient_error():
+    return Neo4jError._hydrate_neo4j(
+        code="Neo.TransientError.Transaction.DeadlockDetected"
+    )
+
+
+@mark_sync_test
+def test_session_run_transaction_uses_retry_policy(
+    fake_pool, mocker
+):
+    sleep_mock = mocker.patch(
+        "neo4j._sync.work.session.sleep", autospec=True
+    )
+    with pytest.warns(PreviewWarning, match="RetryPolicy"):
+        retry_policy = RetryPolicy(transient_delay=0.1, jitter_factor=0)
+    attempts = 0
+
+    def work(_):
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise _transient_error()
+        return "done"
+
+    with Session(
+        fake_pool, SessionConfig(retry_policy=retry_policy)
+    ) as session:
+        res = session.execute_write(work)
+
+    assert res == "done"
+    assert sleep_mock.call_args_list == [mocker.call(0.1), mocker.call(0.2)]
+    assert retry_policy.retry_count == 2
+    assert retry_policy.retry_time == pytest.approx(0.3)
+
+
+@mark_sync_test
+def test_session_run_transaction_respects_retry_budget(
+    fake_pool, mocker
+):
+    sleep_mock = mocker.patch(
+        "neo4j._sync.work.session.sleep", autospec=True
+    )
+    with pytest.warns(PreviewWarning, match="RetryPolicy"):
+        retry_policy = RetryPolicy(
+            retry_budget_ratio=0.5, retry_budget_max_tokens=1
+        )
+    attempts = 0
+
+    def work(_):
+        nonlocal attempts
+        attempts += 1
+        raise _transient_error()
+
+    with Session(
+        fake_pool, SessionConfig(retry_policy=retry_policy)
+    ) as session:
+        with pytest.raises(Neo4jError):
+            session.execute_write(work)
+
+    assert attempts == 2
+    sleep_mock.assert_called_once()
+    assert retry_policy.retry_count == 1
+    assert retry_policy.denied_retry_count == 1
+
+
+@pytest.mark.parametrize("writer_known", (True, False))
+@mark_sync_test
+def test_session_run_transaction_refreshes_routing_on_not_a_leader(
+    fake_pool, mocker, writer_known
+):
+    sleep_mock = mocker.patch(
+        "neo4j._sync.work.session.sleep", autospec=True
+    )
+    attempts = 0
+
+    def work(_):
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise Neo4jError._hydrate_neo4j(
+                code="Neo.ClientError.Cluster.NotALeader"
+            )
+        return "done"
+
+    with Session(fake_pool, SessionConfig()) as session:
+        refresh_mock = mocker.patch.object(
+            session, "_refresh_writers", return_value=writer_known
+        )
+        res = session.execute_write(work)
+
+    assert res == "done"
+    assert sleep_mock.call_count == 2
+    delays = [call.args[0] for call in sleep_mock.call_args_list]
+    if writer_known:
+        # only the first leader switch is retried right away
+        refresh_mock.assert_called_once()
+        assert delays[0] == 0
+        assert delays[1] > 0
+    else:
+        assert refresh_mock.call_count == 2
+        assert all(delay > 0 for delay in delays)
+
+
+@mark_sync_test
+def test_session_run_transaction_no_routing_refresh_on_other_errors(
+    fake_pool, mocker
+):
+    mocker.patch("neo4j._sync.work.session.sleep", autospec=True)
+    attempts = 0
+
+    def work(_):
+        nonlocal attempts
+        attempts += 1
+        if attempts < 2:
+            raise _transient_error()
+
+    with Session(fake_pool, SessionConfig()) as session:
+        refresh_mock = mocker.patch.object(
+            session, "_refresh_writers", return_value=True
+        )
+        session.execute_write(work)
+
+    refresh_mock.assert_not_called()
+
+
+@mark_sync_test
+def test_bulk_batches_start_with_previous_commits_bookmark(
+    fake_pool, scripted_connection_generator
+):
+    # Driver.bulk_write can't send the next batch before the previous COMMIT
+    # returned: the next BEGIN must carry the bookmark that COMMIT returns.
+    connections = []
+    for bookmark in ("bm:2", "bm:1"):
+        connection = scripted_connection_generator()
+        connection.set_script(
+            [
+                ("run", {"on_success": ({"fields": []},)}),
+                ("pull", {"on_success": ({"has_more": False},)}),
+                ("commit", {"on_success": ({"bookmark": bookmark},)}),
+            ]
+        )
+        connections.insert(0, connection)
+        fake_pool.buffered_connection_mocks.append(connection)
+
+    with Session(fake_pool, SessionConfig()) as session:
+        for _ in connections:
+            with session._pipelined_begin:
+                session._run_transaction(
+                    WRITE_ACCESS,
+                    TelemetryAPI.DRIVER,
+                    _bulk_work,
+                    ("RETURN 1", {}),
+                    {},
+                )
+
+        assert fake_pool.acquired_connection_mocks == connections
+        first_begin, second_begin = (
+            connection.begin.call_args for connection in connections
+        )
+        assert not first_begin.kwargs["bookmarks"]
+        assert list(second_begin.kwargs["bookmarks"]) == ["bm:1"]
+        assert (session.last_bookmarks()).raw_values == {"bm:2"}
@@ -18,15 +18,22 @@ from unittest.mock import MagicMock
 
 import pytest
 
+import neo4j
 from neo4j import (
+    ManagedTransaction,
     NotificationMinimumSeverity,
+    PreviewWarning,
     Query,
     Transaction,
 )
+from neo4j._sync.config import PoolConfig
+from neo4j._sync.io._bolt5 import Bolt5x0
 from neo4j.exceptions import (
     ClientError,
+    ResultConsumedError,
     ResultFailedError,
     ServiceUnavailable,
+    TransactionError,
 )
 
 from ...._async_compat import mark_sync_test
@@ -292,6 +299,160 @@ def test_transaction_begin_pipelining(
     assert fake_connection.method_calls == expected_calls
 
 
+@pytest.mark.parametrize("end", ("commit", "rollback"))
+@mark_sync_test
+def test_transaction_pipelines_discards_with_end(
+    scripted_connection, end
+):
+    connection = scripted_connection
+    connection.is_reset_mock.return_value = False
+    pull = (
+        "pull",
+        {"on_records": ([[1], [2]],), "on_success": ({"has_more": True},)},
+    )
+    connection.set_script(
+        [
+            ("run", {"on_success": ({"fields": ["n"], "qid": 1},)}),
+            pull,
+            ("run", {"on_success": ({"fields": ["n"], "qid": 2},)}),
+            pull,
+            ("discard", {"on_success": ({},)}),
+            ("discard", {"on_success": ({},)}),
+            (end, {"on_success": ({},)}),
+        ]
+    )
+    tx = Transaction(connection, 2, None, noop, noop, noop)
+    res1 = tx.run("UNWIND range(1, 1000) AS n RETURN n")
+    res2 = tx.run("UNWIND range(1, 1000) AS n RETURN n")
+    connection.reset_mock()
+
+    if end == "commit":
+        tx.commit()
+    else:
+        tx.rollback()
+
+    calls = [
+        call[0]
+        for call in connection.method_calls
+        if call[0] in {"discard", end, "send_all", "fetch_all"}
+    ]
+    assert calls == [
+        "send_all",
+        "fetch_all",
+        "discard",
+        "discard",
+        end,
+        "send_all",
+        "fetch_all",
+    ]
+    assert [call.kwargs["qid"] for call in connection.discard.mock_calls] == [
+        1,
+        -1,
+    ]
+    for res in (res1, res2):
+        with pytest.raises(ResultConsumedError):
+            res.__next__()
+
+
+@mark_sync_test
+def test_transaction_run_and_commit_pipelines_commit(
+    scripted_connection,
+):
+    connection = scripted_connection
+    connection.set_script(
+        [
+            ("run", {"on_success": ({"fields": ["n"]},)}),
+            (
+                "pull",
+                {"on_records": ([[1], [2]],), "on_success": ({},)},
+            ),
+            ("commit", {"on_success": ({"bookmark": "bm:1"},)}),
+        ]
+    )
+    tx = ManagedTransaction(connection, 2, None, noop, noop, noop)
+
+    res = tx._run_and_commit("UNWIND [1, 2] AS n RETURN n", {})
+
+    calls = [
+        call[0]
+        for call in connection.method_calls
+        if call[0] in {"run", "pull", "commit", "send_all"}
+    ]
+    assert calls == ["run", "pull", "commit", "send_all"]
+    assert connection.pull.call_args.kwargs["n"] == -1
+    assert [record["n"] for record in res] == [1, 2]
+
+    connection.reset_mock()
+    assert tx._commit() == "bm:1"
+    connection.commit.assert_not_called()
+    # only flushing what might still be queued, the COMMIT is out already
+    connection.send_all.assert_called_once()
+
+
+@mark_sync_test
+def test_transaction_run_and_commit_does_not_roll_back(
+    scripted_connection,
+):
+    connection = scripted_connection
+    connection.is_reset_mock.return_value = False
+    connection.set_script(
+        [
+            ("run", {"on_success": ({"fields": ["n"]},)}),
+            ("pull", {"on_records": ([[1]],), "on_success": ({},)}),
+            ("commit", {"on_success": ({},)}),
+        ]
+    )
+    tx = ManagedTransaction(connection, 2, None, noop, noop, noop)
+    tx._run_and_commit("RETURN 1 AS n", {})
+
+    tx._close()
+
+    connection.rollback.assert_not_called()
+    with pytest.raises(TransactionError):
+        tx._run_and_commit("RETURN 1 AS n", {})
+
+
+@mark_sync_test
+def test_transaction_run_many_sends_once(scripted_connection):
+    connection = scripted_connection
+    connection.set_script(
+        [
+            ("run", {"on_success": ({"fields": ["n"], "qid": 1},)}),
+            ("pull", {"on_records": ([[1]],), "on_success": ({},)}),
+            ("run", {"on_success": ({"fields": ["m"], "qid": 2},)}),
+            ("pull", {"on_records": ([[2], [3]],), "on_success": ({},)}),
+        ]
+    )
+    tx = Transaction(connection, 2, None, noop, noop, noop)
+
+    with pytest.warns(PreviewWarning, match="run_many"):
+        res1, res2 = tx.run_many(
+            [("RETURN 1 AS n", None), ("UNWIND [2, 3] AS m RETURN m", {})]
+        )
+
+    calls = [
+        call[0]
+        for call in connection.method_calls
+        if call[0] in {"run", "pull", "send_all"}
+    ]
+    assert calls == ["run", "pull", "run", "pull", "send_all"]
+    assert [record["n"] for record in res1] == [1]
+    assert [record["m"] for record in res2] == [2, 3]
+
+
+@mark_sync_test
+def test_transaction_run_many_rejects_query_object(
+    scripted_connection,
+):
+    tx = Transaction(scripted_connection, 2, None, noop, noop, noop)
+
+    with pytest.warns(PreviewWarning, match="run_many"):
+        with pytest.raises(ValueError):
+            tx.run_many([(Query("RETURN 1"), None)])
+
+    scripted_connection.send_all.assert_not_called()
+
+
 @pytest.mark.parametrize("error", ("server", "connection"))
 @mark_sync_test
 def test_server_error_propagates(scripted_connection, error):
@@ -349,3 +510,116 @@ def test_server_error_propagates(scripted_connection, error):
         res1.__next__()
 
     assert exc1.value is exc2.value.__cause__
+
+
+class _RespondingSocket:
+    # Replies SUCCESS to every message the client has actually sent.
+    _SUCCESS = b"\x00\x03\xb1\x70\xa0\x00\x00"
+
+    def __init__(self, address):
+        self.address = address
+        self.recv_buffer = bytearray()
+        self.sent_messages = 0
+
+    def getsockname(self):
+        return "127.0.0.1", 0xFFFF
+
+    def getpeername(self):
+        return self.address
+
+    def recv_into(self, buffer, nbytes):
+        data = self.recv_buffer[:nbytes]
+        actual = len(data)
+        buffer[:actual] = data
+        self.recv_buffer = self.recv_buffer[actual:]
+        return actual
+
+    def sendall(self, data):
+        pos = 0
+        while pos < len(data):
+            size = int.from_bytes(data[pos : pos + 2], "big")
+            pos += 2 + size
+            if size == 0:
+                self.sent_messages += 1
+                self.recv_buffer += self._SUCCESS
+
+    def close(self):
+        return
+
+    def kill(self):
+        return
+
+
+@mark_sync_test
+def test_transaction_close_flushes_pipelined_begin():
+    address = neo4j.Address(("127.0.0.1", 7687))
+    socket = _RespondingSocket(address)
+    connection = Bolt5x0(
+        address, socket, PoolConfig.max_connection_lifetime
+    )
+    tx = Transaction(connection, 2, None, noop, noop, noop)
+    tx._begin(None, None, None, "w", None, None, None, None, True)
+
+    with pytest.raises(ValueError):
+        # parameters that can't be packed => RUN is never queued
+        tx.run("RETURN $x AS x", x=object())
+    assert socket.sent_messages == 0
+
+    tx._close()
+
+    # BEGIN and ROLLBACK
+    assert socket.sent_messages == 2
+    assert tx.closed()
+
+
+@mark_sync_test
+def test_transaction_run_many_flushes_queued_queries_on_failure():
+    address = neo4j.Address(("127.0.0.1", 7687))
+    socket = _RespondingSocket(address)
+    connection = Bolt5x0(
+        address, socket, PoolConfig.max_connection_lifetime
+    )
+    tx = Transaction(connection, 2, None, noop, noop, noop)
+    tx._begin(None, None, None, "w", None, None, None, None, True)
+
+    # parameters of query #2 can't be packed
+    queries = [("RETURN 1 AS x", None), ("RETURN $x AS x", {"x": object()})]
+    with pytest.warns(PreviewWarning, match="run_many"):
+        with pytest.raises(ValueError):
+            tx.run_many(queries)
+
+    # BEGIN, RUN, and PULL of query #1 were sent and their responses consumed
+    assert socket.sent_messages == 3
+    assert not connection.responses
+
+    tx._close()
+
+    # ROLLBACK
+    assert socket.sent_messages == 4
+    assert tx.closed()
+
+
+@mark_sync_test
+def test_transaction_run_many_validates_queries_before_queueing():
+    address = neo4j.Address(("127.0.0.1", 7687))
+    socket = _RespondingSocket(address)
+    connection = Bolt5x0(
+        address, socket, PoolConfig.max_connection_lifetime
+    )
+    tx = Transaction(connection, 2, None, noop, noop, noop)
+    tx._begin(None, None, None, "w", None, None, None, None, True)
+
+    queries = [("RETURN 1 AS x", None), (1, None)]
+    with pytest.warns(PreviewWarning, match="run_many"):
+        with pytest.raises(TypeError):
+            tx.run_many(queries)  # type: ignore[arg-type]
+
+    # only the pipelined BEGIN is queued
+    assert socket.sent_messages == 0
+    assert len(connection.responses) == 1
+
+    tx._close()
+
+    # BEGIN and ROLLBACK
+    assert socket.sent_messages == 2
+    assert tx.closed()